@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the time and peak memory of exporting a dataframe to CSV in one go and as a
+stream of row chunks.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Iterator
+from typing import Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.utils.csv import df_to_escaped_csv, df_to_escaped_csv_chunks
+
+
+def build_dataframe(rows: int) -> pd.DataFrame:
+    """
+    Build a dataframe resembling a typical table chart result, with a share of
+    values that need escaping.
+    """
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "__timestamp": pd.date_range("2020-01-01", periods=rows, freq="min"),
+            "country": rng.choice(["US", "FR", "BR", "IN", "JP"], rows),
+            "comment": rng.choice(["ok", "=SUM(A1:A2)", "-10", "@user", "n/a"], rows),
+            "count": rng.integers(0, 1_000_000, rows),
+            "revenue": rng.random(rows) * 1000,
+        }
+    )
+
+
+def measure(export: Callable[[], Iterator[str]]) -> tuple[float, int, int]:
+    """
+    Consume an export, returning the elapsed time in ms, the number of characters
+    and the peak memory allocated while exporting.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = sum(len(chunk) for chunk in export())
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, peak
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows in the dataframe.")
+@click.option("--chunk-size", default=10_000, help="Number of rows per CSV chunk.")
+def main(rows: int, chunk_size: int) -> None:
+    df = build_dataframe(rows)
+
+    exports: dict[str, Callable[[], Iterator[str]]] = {
+        "full": lambda: iter([df_to_escaped_csv(df, index=False)]),
+        f"chunks ({chunk_size})": lambda: df_to_escaped_csv_chunks(
+            df, chunk_size, index=False
+        ),
+    }
+
+    print(f"Benchmarking {rows} rows\n")
+    print(f"{'mode':<20}{'chars':>14}{'time (ms)':>12}{'peak (MiB)':>12}")
+    for label, export in exports.items():
+        elapsed, size, peak = measure(export)
+        print(f"{label:<20}{size:>14}{elapsed:>12.0f}{peak / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
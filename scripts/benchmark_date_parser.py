@@ -0,0 +1,80 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure how long it takes to resolve common time ranges with `get_since_until`,
+with empty caches (as for the first query object using a time range) and with warm
+caches.
+"""
+
+import time
+
+import click
+
+TIME_RANGES = [
+    ("Last week", None),
+    ("Last month", None),
+    ("previous calendar month", None),
+    ("Current quarter", None),
+    ("DATEADD(DATETIME('today'), -7, day) : today", None),
+    ("2024-01-01 : 2024-12-31", None),
+    ("Last week", "1 week ago"),
+]
+
+
+@click.command()
+@click.option("--calls", default=1_000, help="Number of calls per time range.")
+def main(calls: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.utils.date_parser import (
+        compile_datetime_expression,
+        get_since_until,
+        get_time_range_expressions,
+        shift_datetime,
+    )
+
+    def clear_caches() -> None:
+        get_time_range_expressions.cache_clear()
+        compile_datetime_expression.cache_clear()
+        shift_datetime.cache_clear()
+
+    print(f"Benchmarking {calls} calls per time range\n")
+    print(f"{'time range':<48}{'time shift':<14}{'cold (us)':>10}{'warm (us)':>10}")
+    for time_range, time_shift in TIME_RANGES:
+        start = time.perf_counter()
+        for _ in range(calls):
+            clear_caches()
+            get_since_until(time_range=time_range, time_shift=time_shift)
+        cold = (time.perf_counter() - start) / calls
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            get_since_until(time_range=time_range, time_shift=time_shift)
+        warm = (time.perf_counter() - start) / calls
+
+        print(
+            f"{time_range:<48}{time_shift or '':<14}"
+            f"{cold * 1e6:>10.1f}{warm * 1e6:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -0,0 +1,107 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the size and get/set latency of query cache values stored as pickled
+dataframes (the legacy format) and as Arrow IPC buffers.
+
+Cache backends such as Redis pickle the cached value, so both formats are measured
+including the pickling step.
+"""
+
+import pickle
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+from flask import current_app
+
+
+def build_dataframe(rows: int) -> pd.DataFrame:
+    """
+    Build a dataframe resembling a typical table chart result.
+    """
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "__timestamp": pd.date_range("2020-01-01", periods=rows, freq="min"),
+            "country": rng.choice(["US", "FR", "BR", "IN", "JP"], rows),
+            "product": [f"product {i % 1000}" for i in range(rows)],
+            "count": rng.integers(0, 1_000_000, rows),
+            "revenue": rng.random(rows) * 1000,
+        }
+    )
+
+
+def timeit(func: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows in the dataframe.")
+@click.option("--iterations", default=10, help="Number of iterations per format.")
+@click.option(
+    "--compression",
+    type=click.Choice(["lz4", "zstd", "none"]),
+    default="lz4",
+    help="Arrow IPC buffer compression.",
+)
+def main(rows: int, iterations: int, compression: str) -> None:
+    # the cache manager can only be imported within an app context
+    from superset.common.utils.query_cache_manager import (
+        deserialize_df,
+        serialize_df,
+    )
+
+    df = build_dataframe(rows)
+    current_app.config["DATA_CACHE_ARROW_COMPRESSION"] = (
+        None if compression == "none" else compression
+    )
+
+    formats: dict[str, tuple[Callable[[], bytes], Callable[[bytes], pd.DataFrame]]]
+    formats = {
+        "pickle": (
+            lambda: pickle.dumps({"df": df}),
+            lambda payload: pickle.loads(payload)["df"],  # noqa: S301
+        ),
+        f"arrow ({compression})": (
+            lambda: pickle.dumps(serialize_df(df)),
+            lambda payload: deserialize_df(pickle.loads(payload)),  # noqa: S301
+        ),
+    }
+
+    print(f"Benchmarking {rows} rows, {iterations} iterations\n")
+    print(f"{'format':<16}{'bytes':>14}{'set (ms)':>12}{'get (ms)':>12}")
+    for label, (set_, get) in formats.items():
+        payload = set_()
+        pd.testing.assert_frame_equal(get(payload), df)
+        set_ms = timeit(set_, iterations)
+        get_ms = timeit(lambda: get(payload), iterations)  # noqa: B023
+        print(f"{label:<16}{len(payload):>14}{set_ms:>12.2f}{get_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -0,0 +1,103 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measure how many query object cache keys can be computed per second in the legacy
+format and in the compact format with each supported hash algorithm.
+"""
+
+import time
+from datetime import datetime
+
+import click
+from flask import current_app
+
+FORMATS = {
+    "legacy (md5)": (False, "md5"),
+    "compact (md5)": (True, "md5"),
+    "compact (blake2b)": (True, "blake2b"),
+    "compact (xxh128)": (True, "xxh128"),
+}
+
+
+@click.command()
+@click.option("--keys", default=50_000, help="Number of cache keys per format.")
+@click.option("--filters", default=10, help="Number of filters of the query.")
+def main(keys: int, filters: int) -> None:
+    # the query object can only be imported within an app context
+    from superset.common.query_object import QueryObject
+
+    query_object = QueryObject(
+        columns=["country", {"sqlExpression": "UPPER(product)", "label": "product"}],
+        metrics=[
+            {
+                "expressionType": "SIMPLE",
+                "aggregate": "SUM",
+                "column": {"column_name": "revenue"},
+                "label": "SUM(revenue)",
+            },
+        ],
+        filters=[
+            {"col": f"col_{idx}", "op": "IN", "val": ["a", "b", idx]}
+            for idx in range(filters)
+        ],
+        extras={"time_grain_sqla": "P1D", "where": "", "having": ""},
+        granularity="ds",
+        time_range="Last week",
+        row_limit=10_000,
+        post_processing=[
+            {
+                "operation": "pivot",
+                "options": {
+                    "index": ["ds"],
+                    "columns": ["country"],
+                    "aggregates": {"SUM(revenue)": {"operator": "mean"}},
+                },
+            },
+        ],
+    )
+    extra = {
+        "datasource": "1__table",
+        "extra_cache_keys": [],
+        "rls": [],
+        "changed_on": datetime(2024, 1, 1),
+    }
+
+    print(f"Benchmarking {keys} keys\n")
+    print(f"{'format':<20}{'keys/s':>12}")
+    for label, (compact_format, algorithm) in FORMATS.items():
+        current_app.config["QUERY_CACHE_KEY_COMPACT_FORMAT"] = compact_format
+        current_app.config["QUERY_CACHE_KEY_HASH_ALGORITHM"] = algorithm
+        try:
+            query_object.cache_key(**extra)
+        except ValueError as ex:
+            print(f"{label:<20}{'n/a':>12}  ({ex})")
+            continue
+
+        start = time.perf_counter()
+        for _ in range(keys):
+            query_object.cache_key(**extra)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<20}{keys / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
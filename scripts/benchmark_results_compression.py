@@ -0,0 +1,143 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the codecs available to compress SQL Lab results stored in the results
+backend, reporting the compression ratio and the write and read throughput of each
+codec (RESULTS_BACKEND_COMPRESSION), optionally combined with the compression of the
+Arrow record batches (RESULTS_BACKEND_ARROW_COMPRESSION).
+"""
+
+import time
+from functools import partial
+from typing import Any, Callable, Optional
+
+import click
+import msgpack
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+CODECS: list[tuple[Optional[str], Optional[str]]] = [
+    ("zlib", None),
+    ("zstd", None),
+    ("lz4", None),
+    (None, "zstd"),
+    (None, "lz4"),
+    ("zstd", "lz4"),
+]
+
+
+def get_result_sets(rows: int) -> dict[str, pa.Table]:
+    rng = np.random.default_rng(42)
+    countries = np.array(["France", "Germany", "Italy", "Spain", "United States"])
+    return {
+        "numeric": pa.Table.from_pandas(
+            pd.DataFrame(
+                {
+                    "id": np.arange(rows),
+                    "value": rng.normal(size=rows),
+                    "count": rng.integers(0, 1_000, size=rows),
+                }
+            )
+        ),
+        "mixed": pa.Table.from_pandas(
+            pd.DataFrame(
+                {
+                    "ts": pd.date_range("2024-01-01", periods=rows, freq="s"),
+                    "country": rng.choice(countries, size=rows),
+                    "name": [f"user_{i % 5_000}" for i in range(rows)],
+                    "revenue": rng.gamma(2, 100, size=rows).round(2),
+                }
+            )
+        ),
+        "text": pa.Table.from_pandas(
+            pd.DataFrame(
+                {
+                    "description": [
+                        f"Order {i} shipped to {countries[i % 5]} in {i % 7} days"
+                        for i in range(rows)
+                    ],
+                }
+            )
+        ),
+    }
+
+
+def write_blob(
+    table: pa.Table,
+    codec: Optional[str],
+    arrow_codec: Optional[str],
+) -> bytes:
+    # pylint: disable=import-outside-toplevel
+    from superset.sqllab.utils import write_ipc_buffer
+    from superset.utils.core import compress_blob
+
+    data = write_ipc_buffer(table, compression=arrow_codec).to_pybytes()
+    return compress_blob(msgpack.dumps({"data": data}), codec)
+
+
+def read_blob(blob: bytes) -> pa.Table:
+    # pylint: disable=import-outside-toplevel
+    from superset.sqllab.utils import read_ipc_buffer
+    from superset.utils.core import decompress_blob
+
+    payload = msgpack.loads(decompress_blob(blob, decode=False))
+    return read_ipc_buffer(payload["data"])
+
+
+def measure(func: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows per result set.")
+@click.option("--repeat", default=3, help="Number of runs per measure.")
+def main(rows: int, repeat: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.sqllab.utils import write_ipc_buffer
+
+    print(f"Benchmarking result sets of {rows:,} rows\n")
+    print(
+        f"{'result set':<12}{'codec':<8}{'arrow':<8}{'ratio':>8}"
+        f"{'write (MB/s)':>14}{'read (MB/s)':>14}"
+    )
+    for name, table in get_result_sets(rows).items():
+        raw_size = len(msgpack.dumps({"data": write_ipc_buffer(table).to_pybytes()}))
+        for codec, arrow_codec in CODECS:
+            blob, write_time = measure(
+                partial(write_blob, table, codec, arrow_codec), repeat
+            )
+            _, read_time = measure(partial(read_blob, blob), repeat)
+
+            megabytes = raw_size / 1024 / 1024
+            print(
+                f"{name:<12}{codec or '-':<8}{arrow_codec or '-':<8}"
+                f"{raw_size / len(blob):>8.2f}"
+                f"{megabytes / write_time:>14.1f}{megabytes / read_time:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Micro-benchmarks for the columnar sanitization applied to query results before they
+are serialized, compared to the equivalent cell by cell implementations.
+"""
+
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.utils.core import JS_MAX_INTEGER
+from superset.utils.csv import escape_value
+from superset.utils.excel import EXCEL_MAX_NUMBER
+from superset.utils.sanitization import (
+    escape_formulas,
+    quote_formulas,
+    stringify_large_numbers,
+)
+
+
+def build_dataframe(rows: int, columns: int, outliers: float) -> pd.DataFrame:
+    """
+    Build a wide dataframe alternating string, integer and float columns, where a
+    share of the values needs to be sanitized.
+    """
+    rng = np.random.default_rng(42)
+    data: dict[str, Any] = {}
+    for idx in range(columns):
+        is_outlier = rng.random(rows) < outliers
+        if idx % 3 == 0:
+            data[f"col_{idx}"] = np.where(
+                is_outlier,
+                rng.choice(["=SUM(A1:A2)", "@user", "+1|2"], rows),
+                rng.choice(["ok", "-10", "n/a", "product"], rows),
+            )
+            data[f"col_{idx}"] = data[f"col_{idx}"].astype(object)
+        elif idx % 3 == 1:
+            data[f"col_{idx}"] = np.where(
+                is_outlier,
+                rng.integers(2**60, 2**62, rows),
+                rng.integers(-(10**6), 10**6, rows),
+            )
+        else:
+            data[f"col_{idx}"] = rng.random(rows) * np.where(is_outlier, 1e17, 1e6)
+    return pd.DataFrame(data)
+
+
+def row_wise(func: Callable[[Any], Any]) -> Callable[[pd.DataFrame], Any]:
+    def apply(df: pd.DataFrame) -> Any:
+        return [column.map(func) for _, column in df.items()]
+
+    return apply
+
+
+def columnar(func: Callable[[pd.Series], Any]) -> Callable[[pd.DataFrame], Any]:
+    def apply(df: pd.DataFrame) -> Any:
+        return [func(column) for _, column in df.items()]
+
+    return apply
+
+
+BENCHMARKS: dict[str, tuple[Callable[[pd.DataFrame], Any], ...]] = {
+    "csv escaping": (
+        row_wise(lambda v: escape_value(v) if isinstance(v, str) else v),
+        columnar(escape_formulas),
+    ),
+    "excel quoting": (
+        row_wise(
+            lambda v: f"'{v}" if isinstance(v, str) and v[:1] in "=+-@" and v else v
+        ),
+        columnar(quote_formulas),
+    ),
+    "js integers": (
+        row_wise(
+            lambda v: str(v) if isinstance(v, int) and abs(v) > JS_MAX_INTEGER else v
+        ),
+        columnar(lambda c: stringify_large_numbers(c, JS_MAX_INTEGER)),
+    ),
+    "excel clamping": (
+        row_wise(
+            lambda v: str(v)
+            if isinstance(v, (int, float)) and abs(v) > EXCEL_MAX_NUMBER
+            else v
+        ),
+        columnar(
+            lambda c: stringify_large_numbers(c, EXCEL_MAX_NUMBER, include_floats=True)
+        ),
+    ),
+}
+
+
+def timeit(func: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows in the dataframe.")
+@click.option("--columns", default=30, help="Number of columns in the dataframe.")
+@click.option(
+    "--outliers",
+    default=0.01,
+    help="Share of the values that need to be sanitized.",
+)
+@click.option("--iterations", default=3, help="Number of iterations per benchmark.")
+def main(rows: int, columns: int, outliers: float, iterations: int) -> None:
+    df = build_dataframe(rows, columns, outliers)
+
+    print(f"Benchmarking {rows} rows x {columns} columns\n")
+    print(f"{'benchmark':<16}{'row-wise (ms)':>16}{'columnar (ms)':>16}")
+    for label, (row_wise_, columnar_) in BENCHMARKS.items():
+        row_wise_ms = timeit(lambda: row_wise_(df), iterations)  # noqa: B023
+        columnar_ms = timeit(lambda: columnar_(df), iterations)  # noqa: B023
+        print(f"{label:<16}{row_wise_ms:>16.0f}{columnar_ms:>16.0f}")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -163,6 +163,37 @@ describe('asyncEvent middleware', () => {
     });
   });
 
+  describe('long-polling transport', () => {
+    const config = {
+      GLOBAL_ASYNC_QUERIES_TRANSPORT: 'long-polling',
+      GLOBAL_ASYNC_QUERIES_POLLING_DELAY: 50,
+      GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT: 10,
+      GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL: '',
+    };
+
+    beforeEach(async () => {
+      fetchMock.get(EVENTS_ENDPOINT, {
+        status: 200,
+        body: { result: [asyncDoneEvent] },
+      });
+      fetchMock.get(CACHED_DATA_ENDPOINT, {
+        status: 200,
+        body: { result: chartData },
+      });
+      asyncEvent.init(config);
+    });
+
+    it('resolves with chart data on event done status', async () => {
+      await expect(
+        asyncEvent.waitForAsyncData(asyncPendingEvent),
+      ).resolves.toEqual([chartData]);
+
+      const [[url]] = fetchMock.calls(EVENTS_ENDPOINT);
+      expect(url).toContain('timeout=10');
+      expect(fetchMock.calls(CACHED_DATA_ENDPOINT)).toHaveLength(1);
+    });
+  });
+
   describe('ws transport', () => {
     let wsServer: WS;
     const config = {
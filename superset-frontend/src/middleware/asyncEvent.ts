@@ -47,6 +47,7 @@ type AppConfig = Record<string, any>;
 type ListenerFn = (asyncEvent: AsyncEvent) => Promise<any>;
 
 const TRANSPORT_POLLING = 'polling';
+const TRANSPORT_LONG_POLLING = 'long-polling';
 const TRANSPORT_WS = 'ws';
 const JOB_STATUS = {
   PENDING: 'pending',
@@ -62,6 +63,7 @@ const RETRY_DELAY = 100;
 let config: AppConfig;
 let transport: string;
 let pollingDelayMs: number;
+let longPollingTimeout: number;
 let pollingTimeoutId: number;
 let listenersByJobId: Record<string, ListenerFn>;
 let retriesByJobId: Record<string, number>;
@@ -124,7 +126,7 @@ export const waitForAsyncData = async (asyncResponse: AsyncEvent) =>
   });
 
 const fetchEvents = makeApi<
-  { last_id?: string | null },
+  { last_id?: string | null; timeout?: number },
   { result: AsyncEvent[] }
 >({
   method: 'GET',
@@ -167,18 +169,26 @@ export const processEvents = async (events: AsyncEvent[]) => {
 };
 
 const loadEventsFromApi = async () => {
-  const eventArgs = lastReceivedEventId ? { last_id: lastReceivedEventId } : {};
+  const eventArgs = {
+    ...(lastReceivedEventId ? { last_id: lastReceivedEventId } : {}),
+    ...(transport === TRANSPORT_LONG_POLLING
+      ? { timeout: longPollingTimeout }
+      : {}),
+  };
+  let delayMs = pollingDelayMs;
   if (Object.keys(listenersByJobId).length) {
     try {
       const { result: events } = await fetchEvents(eventArgs);
       if (events?.length) await processEvents(events);
+      // long polling requests wait on the server for new events
+      if (transport === TRANSPORT_LONG_POLLING) delayMs = 0;
     } catch (err) {
       logging.warn(err);
     }
   }
 
-  if (transport === TRANSPORT_POLLING) {
-    pollingTimeoutId = window.setTimeout(loadEventsFromApi, pollingDelayMs);
+  if (transport === TRANSPORT_POLLING || transport === TRANSPORT_LONG_POLLING) {
+    pollingTimeoutId = window.setTimeout(loadEventsFromApi, delayMs);
   }
 };
 
@@ -238,6 +248,7 @@ export const init = (appConfig?: AppConfig) => {
   config = appConfig || getBootstrapData().common.conf;
   transport = config.GLOBAL_ASYNC_QUERIES_TRANSPORT || TRANSPORT_POLLING;
   pollingDelayMs = config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY || 500;
+  longPollingTimeout = config.GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT || 25;
 
   try {
     lastReceivedEventId = localStorage.getItem(LOCALSTORAGE_KEY);
@@ -245,7 +256,7 @@ export const init = (appConfig?: AppConfig) => {
     logging.warn('Failed to fetch last event Id from localStorage');
   }
 
-  if (transport === TRANSPORT_POLLING) {
+  if (transport === TRANSPORT_POLLING || transport === TRANSPORT_LONG_POLLING) {
     loadEventsFromApi();
   }
   if (transport === TRANSPORT_WS) {
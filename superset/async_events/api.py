@@ -41,7 +41,8 @@ class AsyncEventsRestApi(BaseSupersetApi):
     def events(self) -> Response:
         """
         Read off of the Redis async events stream, using the user's JWT token and
-        optional query params for last event received.
+        optional query params for last event received, waiting for new events when
+        a timeout is given.
         ---
         get:
           summary: Read off of the Redis events stream
@@ -54,6 +55,13 @@ class AsyncEventsRestApi(BaseSupersetApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Number of seconds to wait for new events when there are none yet
+              (long polling), bounded by the server configuration
+            schema:
+                type: number
           responses:
             200:
               description: Async event results
@@ -93,7 +101,15 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            timeout = request.args.get("timeout", 0.0, type=float)
+            if timeout > 0:
+                events = async_query_manager.wait_for_events(
+                    async_channel_id, last_event_id, timeout
+                )
+            else:
+                events = async_query_manager.read_events(
+                    async_channel_id, last_event_id
+                )
 
         except AsyncQueryTokenException:
             return self.response_401()
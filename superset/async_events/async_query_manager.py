@@ -17,8 +17,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 import uuid
-from typing import Any, Literal, Optional
+from time import monotonic
+from typing import Any, Callable, Literal, Optional
 
 import jwt
 from flask import Flask, Request, request, Response, session
@@ -94,6 +96,67 @@ def get_cache_backend(
     raise UnsupportedCacheBackendError("Unsupported cache backend configuration")
 
 
+class StreamListener:
+    """
+    Wait for new events on streams, sharing a single blocking read of each stream
+    between all the requests of the process waiting on it.
+    """
+
+    class _Stream:
+        def __init__(self, lock: threading.Lock) -> None:
+            self.changed = threading.Condition(lock)
+            self.generation = 0
+            self.reading = False
+            self.waiters = 0
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._streams: dict[str, StreamListener._Stream] = {}
+
+    def wait(
+        self,
+        stream_name: str,
+        last_id: str,
+        timeout: float,
+        read: Callable[[str, str, int], Any],
+    ) -> None:
+        """
+        Wait until the stream may have events newer than `last_id`, or until the
+        timeout in seconds expires.
+
+        The first waiter of a stream reads it with `read(stream_name, last_id, block)`,
+        and the others wait for that read to complete. Waiters should then read the
+        events they are interested in themselves.
+        """
+        with self._lock:
+            stream = self._streams.setdefault(stream_name, self._Stream(self._lock))
+            stream.waiters += 1
+            generation = stream.generation
+            leader = not stream.reading
+            stream.reading = True
+
+        try:
+            if leader:
+                try:
+                    read(stream_name, last_id, max(1, int(timeout * 1000)))
+                finally:
+                    with self._lock:
+                        stream.reading = False
+                        stream.generation += 1
+                        stream.changed.notify_all()
+            else:
+                with self._lock:
+                    stream.changed.wait_for(
+                        lambda: stream.generation != generation,
+                        timeout,
+                    )
+        finally:
+            with self._lock:
+                stream.waiters -= 1
+                if not stream.waiters:
+                    del self._streams[stream_name]
+
+
 class AsyncQueryManager:
     MAX_EVENT_COUNT = 100
     STATUS_PENDING = "pending"
@@ -112,6 +175,9 @@ class AsyncQueryManager:
         self._jwt_cookie_domain: Optional[str]
         self._jwt_cookie_samesite: Optional[Literal["None", "Lax", "Strict"]] = None
         self._jwt_secret: str
+        self._long_polling_timeout: float = 0
+        self._long_polling_slots: Optional[threading.BoundedSemaphore] = None
+        self._listener = StreamListener()
         self._load_chart_data_into_cache_job: Any = None
         # pylint: disable=invalid-name
         self._load_explore_json_into_cache_job: Any = None
@@ -146,6 +212,10 @@ class AsyncQueryManager:
         self._jwt_cookie_samesite = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE"]
         self._jwt_cookie_domain = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN"]
         self._jwt_secret = config["GLOBAL_ASYNC_QUERIES_JWT_SECRET"]
+        self._long_polling_timeout = config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"]
+        self._long_polling_slots = threading.BoundedSemaphore(
+            config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_MAX_CONNECTIONS"]
+        )
 
         if config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
@@ -282,6 +352,45 @@ class AsyncQueryManager:
             )
         return [] if not results else list(map(parse_event, results))
 
+    def wait_for_events(
+        self, channel: str, last_id: Optional[str], timeout: float
+    ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel newer than `last_id`, waiting up to `timeout`
+        seconds (bounded by GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT) for new events
+        when there are none yet.
+
+        Once GLOBAL_ASYNC_QUERIES_LONG_POLLING_MAX_CONNECTIONS requests of the process
+        are waiting, this returns right away, like `read_events`.
+        """
+        if not self._cache:
+            raise CacheBackendNotInitialized("Cache backend not initialized")
+
+        timeout = min(timeout, self._long_polling_timeout)
+        if (
+            timeout <= 0
+            or not self._long_polling_slots
+            or not self._long_polling_slots.acquire(blocking=False)
+        ):
+            return self.read_events(channel, last_id)
+
+        try:
+            deadline = monotonic() + timeout
+            while True:
+                events = self.read_events(channel, last_id)
+                remaining = deadline - monotonic()
+                if events or remaining <= 0:
+                    return events
+
+                self._listener.wait(
+                    f"{self._stream_prefix}{channel}",
+                    last_id or "0-0",
+                    remaining,
+                    self._cache.xread,
+                )
+        finally:
+            self._long_polling_slots.release()
+
     def update_job(
         self, job_metadata: dict[str, Any], status: str, **kwargs: Any
     ) -> None:
@@ -303,5 +412,9 @@ class AsyncQueryManager:
         logger.debug("********** logging event data to stream %s", scoped_stream_name)
         logger.debug(event_data)
 
-        self._cache.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
-        self._cache.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+        self._cache.xadd_many(
+            [
+                (scoped_stream_name, event_data, self._stream_limit),
+                (full_stream_name, event_data, self._stream_limit_firehose),
+            ]
+        )
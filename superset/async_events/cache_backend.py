@@ -80,6 +80,27 @@ class RedisCacheBackend(RedisCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xadd_many(
+        self,
+        events: List[Tuple[str, Dict[str, Any], Optional[int]]],
+    ) -> List[str]:
+        """Add events to several streams in a single round trip"""
+        pipeline = self._cache.pipeline(transaction=False)
+        for stream_name, event_data, maxlen in events:
+            pipeline.xadd(stream_name, event_data, "*", maxlen)
+        return pipeline.execute()
+
+    def xread(
+        self,
+        stream_name: str,
+        last_id: str,
+        block: int,
+        count: Optional[int] = None,
+    ) -> List[Any]:
+        """Wait up to `block` milliseconds for events newer than `last_id`"""
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread({stream_name: last_id}, count, block)
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisCacheBackend":
         kwargs = {
@@ -196,6 +217,27 @@ class RedisSentinelCacheBackend(RedisSentinelCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xadd_many(
+        self,
+        events: List[Tuple[str, Dict[str, Any], Optional[int]]],
+    ) -> List[str]:
+        """Add events to several streams in a single round trip"""
+        pipeline = self._cache.pipeline(transaction=False)
+        for stream_name, event_data, maxlen in events:
+            pipeline.xadd(stream_name, event_data, "*", maxlen)
+        return pipeline.execute()
+
+    def xread(
+        self,
+        stream_name: str,
+        last_id: str,
+        block: int,
+        count: Optional[int] = None,
+    ) -> List[Any]:
+        """Wait up to `block` milliseconds for events newer than `last_id`"""
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread({stream_name: last_id}, count, block)
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisSentinelCacheBackend":
         kwargs = {
@@ -25,6 +25,7 @@ In order to do that, we reproduce the post-processing in Python for these chart
 """
 
 import logging
+from collections.abc import Iterator
 from io import StringIO
 from typing import Any, Optional, TYPE_CHECKING, Union
 
@@ -330,6 +331,10 @@ def apply_client_processing(  # noqa: C901
 
         data = query["data"]
 
+        if isinstance(data, Iterator):
+            # streamed CSV chunks
+            data = "".join(data)
+
         if isinstance(data, str):
             data = data.strip()
 
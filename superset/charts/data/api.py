@@ -380,6 +380,8 @@ class ChartDataRestApi(ChartRestApi):
             def _process_data(query_data: Any) -> Any:
                 if result_format == ChartDataResultFormat.CSV:
                     encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
+                    if not isinstance(query_data, str):
+                        query_data = "".join(query_data)
                     return query_data.encode(encoding)
                 return query_data
 
@@ -1501,6 +1501,11 @@ class ChartDataResponseResult(Schema):
         required=False,
         allow_none=True,
     )
+    duration_ms = fields.Float(
+        metadata={"description": "Time spent processing the query, in milliseconds"},
+        required=False,
+        allow_none=True,
+    )
 
 
 class ChartDataResponseSchema(Schema):
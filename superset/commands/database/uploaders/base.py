@@ -16,10 +16,12 @@
 # under the License.
 import logging
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from functools import partial
 from typing import Any, Optional, TypedDict
 
 import pandas as pd
+from flask import current_app
 from flask_babel import lazy_gettext as _
 from werkzeug.datastructures import FileStorage
 
@@ -83,6 +85,20 @@ class BaseDataReader:
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
+    def file_to_dataframes(
+        self,
+        file: FileStorage,
+        chunk_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read file into DataFrames of up to `chunk_size` rows. Readers of formats that
+        can't be read in chunks yield a single DataFrame.
+
+        :return: an iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        yield self.file_to_dataframe(file)
+
     def read(
         self,
         file: FileStorage,
@@ -90,9 +106,17 @@ class BaseDataReader:
         table_name: str,
         schema_name: Optional[str],
     ) -> None:
-        self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
-        )
+        if chunk_size := current_app.config["UPLOAD_STREAMING_CHUNK_SIZE"]:
+            self._dataframes_to_database(
+                self.file_to_dataframes(file, chunk_size),
+                database,
+                table_name,
+                schema_name,
+            )
+        else:
+            self._dataframe_to_database(
+                self.file_to_dataframe(file), database, table_name, schema_name
+            )
 
     def _dataframe_to_database(
         self,
@@ -107,6 +131,21 @@ class BaseDataReader:
         :param df:
         :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
         """
+        self._dataframes_to_database([df], database, table_name, schema_name)
+
+    def _dataframes_to_database(
+        self,
+        dfs: Iterable[pd.DataFrame],
+        database: Database,
+        table_name: str,
+        schema_name: Optional[str],
+    ) -> None:
+        """
+        Upload chunks of DataFrames to database, reading them one at a time
+
+        :param dfs:
+        :throws DatabaseUploadFailed: if there is an error uploading the DataFrames
+        """
         try:
             data_table = Table(table=table_name, schema=schema_name)
             to_sql_kwargs = {
@@ -118,12 +157,14 @@ class BaseDataReader:
                 "dataframe_index"
             ):
                 to_sql_kwargs["index_label"] = self._options.get("index_label")
-            database.db_engine_spec.df_to_sql(
+            database.db_engine_spec.dfs_to_sql(
                 database,
                 data_table,
-                df,
+                dfs,
                 to_sql_kwargs=to_sql_kwargs,
             )
+        except DatabaseUploadFailed:
+            raise
         except ValueError as ex:
             raise DatabaseUploadFailed(
                 message=_(
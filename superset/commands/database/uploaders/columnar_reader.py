@@ -15,13 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from io import BytesIO
 from pathlib import Path
 from typing import Any, IO, Optional
 from zipfile import BadZipfile, is_zipfile, ZipFile
 
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 from flask_babel import lazy_gettext as _
 from pyarrow.lib import ArrowException
@@ -114,6 +115,41 @@ class ColumnarReader(BaseDataReader):
             self._read_buffer_to_dataframe(buffer) for buffer in self._yield_files(file)
         )
 
+    def file_to_dataframes(
+        self,
+        file: FileStorage,
+        chunk_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read Columnar file into DataFrames of up to `chunk_size` rows
+
+        :return: an iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        columns = self._options.get("columns_read") or None
+        try:
+            has_rows = False
+            schema = None
+            for buffer in self._yield_files(file):
+                parquet_file = pq.ParquetFile(buffer)
+                schema = parquet_file.schema_arrow
+                for batch in parquet_file.iter_batches(
+                    batch_size=chunk_size,
+                    columns=columns,
+                ):
+                    has_rows = True
+                    yield pa.Table.from_batches([batch]).to_pandas()
+            # files without rows still create the table
+            if not has_rows and schema is not None:
+                empty_table = schema.empty_table()
+                yield (
+                    empty_table.select(columns) if columns else empty_table
+                ).to_pandas()
+        except ArrowException as ex:
+            raise DatabaseUploadFailed(
+                message=_("Parsing error: %(error)s", error=str(ex))
+            ) from ex
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         column_names = set()
         try:
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
 from typing import Any, Optional
 
 import pandas as pd
@@ -61,19 +62,21 @@ class CSVReader(BaseDataReader):
         )
 
     @staticmethod
-    def _read_csv(file: FileStorage, kwargs: dict[str, Any]) -> pd.DataFrame:
+    def _read_csv_chunks(
+        file: FileStorage,
+        kwargs: dict[str, Any],
+    ) -> Iterator[pd.DataFrame]:
         try:
             if "chunksize" in kwargs:
-                return pd.concat(
-                    pd.read_csv(
-                        filepath_or_buffer=file.stream,
-                        **kwargs,
-                    )
+                yield from pd.read_csv(
+                    filepath_or_buffer=file.stream,
+                    **kwargs,
+                )
+            else:
+                yield pd.read_csv(
+                    filepath_or_buffer=file.stream,
+                    **kwargs,
                 )
-            return pd.read_csv(
-                filepath_or_buffer=file.stream,
-                **kwargs,
-            )
         except (
             pd.errors.ParserError,
             pd.errors.EmptyDataError,
@@ -86,6 +89,11 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
+    @classmethod
+    def _read_csv(cls, file: FileStorage, kwargs: dict[str, Any]) -> pd.DataFrame:
+        chunks = list(cls._read_csv_chunks(file, kwargs))
+        return chunks[0] if len(chunks) == 1 else pd.concat(chunks)
+
     def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
         """
         Read CSV file into a DataFrame
@@ -93,8 +101,24 @@ class CSVReader(BaseDataReader):
         :return: pandas DataFrame
         :throws DatabaseUploadFailed: if there is an error reading the file
         """
-        kwargs = {
-            "chunksize": READ_CSV_CHUNK_SIZE,
+        return self._read_csv(file, self._get_read_kwargs(READ_CSV_CHUNK_SIZE))
+
+    def file_to_dataframes(
+        self,
+        file: FileStorage,
+        chunk_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file into DataFrames of up to `chunk_size` rows
+
+        :return: an iterator of pandas DataFrames
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        return self._read_csv_chunks(file, self._get_read_kwargs(chunk_size))
+
+    def _get_read_kwargs(self, chunk_size: int) -> dict[str, Any]:
+        return {
+            "chunksize": chunk_size,
             "encoding": "utf-8",
             "header": self._options.get("header_row", 0),
             "decimal": self._options.get("decimal_character", "."),
@@ -118,7 +142,6 @@ class CSVReader(BaseDataReader):
             if self._options.get("column_data_types")
             else None,
         }
-        return self._read_csv(file, kwargs)
 
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
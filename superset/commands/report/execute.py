@@ -16,14 +16,21 @@
 # under the License.
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from typing import Any, cast, Optional, Union
 from uuid import UUID
 
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 
 from superset import app, db, security_manager
+from superset.charts.client_processing import apply_client_processing
+from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.commands.base import BaseCommand
+from superset.commands.chart.data.get_data_command import ChartDataCommand
+from superset.commands.chart.exceptions import (
+    ChartAccessDeniedError,
+    ChartNotFoundError,
+)
 from superset.commands.dashboard.permalink.create import CreateDashboardPermalinkCommand
 from superset.commands.exceptions import CommandException, UpdateFailedError
 from superset.commands.report.alert import AlertCommand
@@ -45,6 +52,7 @@ from superset.commands.report.exceptions import (
     ReportScheduleWorkingTimeoutError,
 )
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.daos.chart import ChartDAO
 from superset.daos.report import (
     REPORT_SCHEDULE_ERROR_NOTIFICATION_MARKER,
     ReportScheduleDAO,
@@ -72,8 +80,18 @@ from superset.reports.notifications.exceptions import (
 )
 from superset.tasks.utils import get_executor
 from superset.utils import json
-from superset.utils.core import HeaderDataType, override_user, recipients_string_to_list
-from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
+from superset.utils.concurrency import map_in_app_context
+from superset.utils.core import (
+    create_zip,
+    HeaderDataType,
+    override_user,
+    recipients_string_to_list,
+)
+from superset.utils.csv import (
+    chart_data_to_dataframe,
+    get_chart_csv_data,
+    get_chart_dataframe,
+)
 from superset.utils.decorators import logs_context, transaction
 from superset.utils.pdf import build_pdf_from_screenshots
 from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
@@ -352,10 +370,15 @@ class BaseReportState:
                 for url in urls
             ]
         try:
-            imges = []
-            for screenshot in screenshots:
-                if imge := screenshot.get_screenshot(user=user):
-                    imges.append(imge)
+            imges = [
+                cast(bytes, imge)
+                for imge in map_in_app_context(
+                    lambda screenshot: screenshot.get_screenshot(user=user),
+                    screenshots,
+                    max_workers=app.config["ALERT_REPORTS_MAX_CONCURRENT_SCREENSHOTS"],
+                )
+                if imge
+            ]
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while taking a screenshot.")
             raise ReportScheduleScreenshotTimeout() from ex
@@ -377,22 +400,91 @@ class BaseReportState:
 
         return pdf
 
+    def _get_chart_data(
+        self,
+        result_format: ChartDataResultFormat,
+    ) -> dict[str, Any]:
+        """
+        Run the saved query context of the chart in the worker, as the current user,
+        with the same permission checks and post-processing as the chart data API.
+
+        :param result_format: The format of the data of the queries
+        :returns: The post-processed chart data
+        """
+        chart = ChartDAO.find_by_id(self._report_schedule.chart_id)
+        if not chart:
+            raise ChartNotFoundError()
+
+        # enforced by `@protect()` on the chart data API
+        if not security_manager.can_access("can_read", "Chart"):
+            raise ChartAccessDeniedError()
+
+        if result_format == ChartDataResultFormat.CSV and not (
+            security_manager.can_access("can_csv", "Superset")
+        ):
+            raise ReportScheduleCsvFailedError(
+                "The report executor is not allowed to export CSV"
+            )
+
+        json_body = json.loads(chart.query_context)
+        json_body["result_format"] = result_format.value
+        json_body["result_type"] = ChartDataResultType.POST_PROCESSED.value
+        json_body["force"] = self._report_schedule.force_screenshot
+
+        query_context = ChartDataQueryContextSchema().load(json_body)
+        command = ChartDataCommand(query_context)
+        command.validate()
+        result = command.run()
+
+        try:
+            form_data = json.loads(chart.params)
+        except (TypeError, json.JSONDecodeError):
+            form_data = {}
+
+        return apply_client_processing(result, form_data, query_context.datasource)
+
+    def _get_chart_csv_data(self) -> Optional[bytes]:
+        """
+        Get the CSV data of the chart in the worker, zipping the files of charts with
+        multiple queries as the chart data API does.
+        """
+        encoding = app.config["CSV_EXPORT"].get("encoding", "utf-8")
+        files = {}
+        for idx, query in enumerate(
+            self._get_chart_data(ChartDataResultFormat.CSV)["queries"]
+        ):
+            # the CSV may be streamed in chunks
+            data = query["data"]
+            if not isinstance(data, str):
+                data = "".join(data)
+            files[f"query_{idx + 1}.csv"] = data.encode(encoding)
+        if len(files) > 1:
+            return create_zip(files).getvalue()
+        return next(iter(files.values()), None)
+
     def _get_csv_data(self) -> bytes:
-        url = self._get_url(result_format=ChartDataResultFormat.CSV)
         _, username = get_executor(
             executors=app.config["ALERT_REPORTS_EXECUTORS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
+            if app.config["ALERT_REPORTS_CHART_DATA_IN_PROCESS"]:
+                logger.info("Getting chart data in process as user %s", user.username)
+                with override_user(user):
+                    csv_data = self._get_chart_csv_data()
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.CSV)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleCsvTimeout() from ex
         except Exception as ex:
@@ -407,21 +499,29 @@ class BaseReportState:
         """
         Return data as a Pandas dataframe, to embed in notifications as a table.
         """
-        url = self._get_url(result_format=ChartDataResultFormat.JSON)
         _, username = get_executor(
             executors=app.config["ALERT_REPORTS_EXECUTORS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            dataframe = get_chart_dataframe(url, auth_cookies)
+            if app.config["ALERT_REPORTS_CHART_DATA_IN_PROCESS"]:
+                logger.info("Getting chart data in process as user %s", user.username)
+                with override_user(user):
+                    result = self._get_chart_data(ChartDataResultFormat.JSON)
+                dataframe = chart_data_to_dataframe(result["queries"][0])
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.JSON)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                dataframe = get_chart_dataframe(url, auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleDataFrameTimeout() from ex
         except Exception as ex:
@@ -17,13 +17,17 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast, TypedDict
+from collections.abc import Iterator
+from typing import cast, TypedDict
 
+import msgpack
 import pandas as pd
+import pyarrow as pa
 from flask_babel import gettext as __
 
 from superset import app, db, results_backend, results_backend_use_msgpack
 from superset.commands.base import BaseCommand
+from superset.db_engine_specs.base import BaseEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
@@ -40,7 +44,7 @@ logger = logging.getLogger(__name__)
 class SqlExportResult(TypedDict):
     query: Query
     count: int
-    data: list[Any]
+    data: str | Iterator[str]
 
 
 class SqlResultExportCommand(BaseCommand):
@@ -82,6 +86,36 @@ class SqlResultExportCommand(BaseCommand):
                 status=403,
             ) from ex
 
+    def _can_stream(self) -> bool:
+        """
+        Whether the stored Arrow results can be streamed as CSV as they are, which is
+        not the case for engines that expand nested fields when reading results.
+        """
+        db_engine_spec = self._query.database.db_engine_spec
+        return bool(
+            config["CSV_EXPORT_STREAMING_CHUNK_SIZE"]
+            and results_backend_use_msgpack
+            and db_engine_spec.expand_data.__func__
+            is BaseEngineSpec.expand_data.__func__  # type: ignore
+        )
+
+    def _stream_results(self, payload: bytes) -> SqlExportResult:
+        logger.info("Streaming CSV from the stored Arrow batches")
+        data = msgpack.loads(payload, raw=False)["data"]
+        count = sum(batch.num_rows for batch in pa.ipc.open_stream(pa.py_buffer(data)))
+        csv_data = csv.arrow_to_escaped_csv_chunks(
+            pa.ipc.open_stream(pa.py_buffer(data)),
+            config["CSV_EXPORT_STREAMING_CHUNK_SIZE"],
+            index=False,
+            **config["CSV_EXPORT"],
+        )
+
+        return {
+            "query": self._query,
+            "count": count,
+            "data": csv_data,
+        }
+
     def run(
         self,
     ) -> SqlExportResult:
@@ -92,9 +126,13 @@ class SqlResultExportCommand(BaseCommand):
                 "Fetching CSV from results backend [%s]", self._query.results_key
             )
             blob = results_backend.get(self._query.results_key)
+        if blob and self._can_stream():
+            logger.info("Decompressing")
+            payload = utils.decompress_blob(blob, decode=False)
+            return self._stream_results(cast(bytes, payload))
         if blob:
             logger.info("Decompressing")
-            payload = utils.zlib_decompress(
+            payload = utils.decompress_blob(
                 blob, decode=not results_backend_use_msgpack
             )
             obj = _deserialize_results_payload(
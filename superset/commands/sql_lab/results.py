@@ -41,6 +41,8 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _offset: int
+    _limit: int | None
     _blob: Any
     _query: Query
 
@@ -48,9 +50,13 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._offset = offset
+        self._limit = limit
 
     def validate(self) -> None:
         if not results_backend:
@@ -103,12 +109,21 @@ class SqlExecutionResultsCommand(BaseCommand):
     ) -> dict[str, Any]:
         """Runs arbitrary sql and returns data as json"""
         self.validate()
-        payload = utils.zlib_decompress(
+        payload = utils.decompress_blob(
             self._blob, decode=not results_backend_use_msgpack
         )
+        # only the rows of the requested page, up to the display limit, are decoded
+        limit = self._limit
+        if self._rows:
+            limit = min(limit, self._rows) if limit is not None else self._rows
+
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                offset=self._offset,
+                limit=limit,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
@@ -127,4 +142,7 @@ class SqlExecutionResultsCommand(BaseCommand):
         if self._rows:
             obj = apply_display_max_row_configuration_if_require(obj, self._rows)
 
+        if self._offset or self._limit is not None:
+            obj.update({"offset": self._offset, "limit": limit})
+
         return obj
@@ -19,6 +19,7 @@ from __future__ import annotations
 import copy
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
@@ -28,11 +29,11 @@ from flask_babel import gettext as _
 from pandas import DateOffset
 
 from superset import app
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
-from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.common.utils.query_cache_manager import QueryCacheManager, serialize_df
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
@@ -52,6 +53,7 @@ from superset.models.sql_lab import Query
 from superset.superset_typing import AdhocColumn, AdhocMetric
 from superset.utils import csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import map_in_app_context
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -70,6 +72,7 @@ from superset.utils.core import (
     TIME_COMPARISON,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
+from superset.utils.dates import now_as_float
 from superset.utils.pandas_postprocessing.utils import unescape_separator
 from superset.views.utils import get_viz
 from superset.viz import viz_types
@@ -123,6 +126,9 @@ class QueryContextProcessor:
     def __init__(self, query_context: QueryContext):
         self._query_context = query_context
         self._qc_datasource = query_context.datasource
+        # workers of each query object for its time offset queries, when the query
+        # objects themselves are processed concurrently
+        self._time_offset_max_workers: int | None = None
 
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
@@ -131,7 +137,7 @@ class QueryContextProcessor:
         self, query_obj: QueryObject, force_cached: bool | None = False
     ) -> dict[str, Any]:
         """Handles caching around the df payload retrieval"""
-        cache_key = self.query_cache_key(query_obj)
+        cache_key, fallback_cache_key = self.query_cache_keys(query_obj)
         timeout = self.get_cache_timeout()
         force_query = self._query_context.force or timeout == -1
         cache = QueryCacheManager.get(
@@ -139,6 +145,7 @@ class QueryContextProcessor:
             region=CacheRegion.DATA,
             force_query=force_query,
             force_cached=force_cached,
+            fallback_key=fallback_cache_key,
         )
 
         if query_obj and cache_key and not cache.is_loaded:
@@ -234,21 +241,28 @@ class QueryContextProcessor:
         """
         Returns a QueryObject cache key for objects in self.queries
         """
+        return self.query_cache_keys(query_obj, **kwargs)[0]
+
+    def query_cache_keys(
+        self, query_obj: QueryObject, **kwargs: Any
+    ) -> tuple[str | None, str | None]:
+        """
+        Returns a QueryObject cache key for objects in self.queries, along with the
+        key in the legacy format to fall back to while migrating key formats
+        """
+        if not query_obj:
+            return None, None
+
         datasource = self._qc_datasource
         extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
 
-        cache_key = (
-            query_obj.cache_key(
-                datasource=datasource.uid,
-                extra_cache_keys=extra_cache_keys,
-                rls=security_manager.get_rls_cache_key(datasource),
-                changed_on=datasource.changed_on,
-                **kwargs,
-            )
-            if query_obj
-            else None
+        return query_obj.cache_keys(
+            datasource=datasource.uid,
+            extra_cache_keys=extra_cache_keys,
+            rls=security_manager.get_rls_cache_key(datasource),
+            changed_on=datasource.changed_on,
+            **kwargs,
         )
-        return cache_key
 
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """Returns a pandas dataframe based on the query object"""
@@ -391,6 +405,12 @@ class QueryContextProcessor:
         """
         if join_column_producer:
             df[name] = df.apply(lambda row: join_column_producer(row, 0), axis=1)
+        elif (
+            join_column := self.generate_join_column_series(
+                df.iloc[:, 0], time_grain, time_offset
+            )
+        ) is not None:
+            df[name] = join_column
         else:
             df[name] = df.apply(
                 lambda row: self.generate_join_column(row, 0, time_grain, time_offset),
@@ -435,11 +455,12 @@ class QueryContextProcessor:
         query_object: QueryObject,
     ) -> CachedTimeOffset:
         query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        # offsets missing from the cache, with their position in `queries`
+        pending_offsets: list[tuple[int, str]] = []
+        pending_offset_queries: list[dict[str, Any]] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -458,6 +479,10 @@ class QueryContextProcessor:
         join_keys = [col for col in df.columns if col not in metric_names]
 
         for offset in query_object.time_offsets:
+            # ensure query_object is immutable, each offset gets its own clone as the
+            # queries of the offsets missing from the cache may run concurrently
+            query_object_clone = copy.copy(query_object)
+            query_object_clone.filter = copy.deepcopy(query_object.filter)
             try:
                 # pylint: disable=line-too-long
                 # Since the x-axis is also a column name for the time filter, x_axis_label will be set as granularity  # noqa: E501
@@ -529,14 +554,18 @@ class QueryContextProcessor:
                 offset if offset == original_offset else f"{offset}_{original_offset}"
             )
 
-            # `offset` is added to the hash function
-            cache_key = self.query_cache_key(
+            # `offset` is added to the hash function, so that each offset is cached
+            # independently of the other offsets of the query object
+            cache_key, fallback_cache_key = self.query_cache_keys(
                 query_object_clone,
                 time_offset=cached_time_offset_key,
                 time_grain=time_grain,
             )
             cache = QueryCacheManager.get(
-                cache_key, CacheRegion.DATA, query_context.force
+                cache_key,
+                CacheRegion.DATA,
+                query_context.force,
+                fallback_key=fallback_cache_key,
             )
             # whether hit on the cache
             if cache.is_loaded:
@@ -559,44 +588,39 @@ class QueryContextProcessor:
                 query_object_clone_dct["row_limit"] = config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
-
-            queries.append(result.query)
+            # keep the position of the offset, so that the queries remain in order
+            offset_dfs[offset] = pd.DataFrame()
+            pending_offsets.append((len(queries), offset))
+            pending_offset_queries.append(
+                {
+                    "query_object": query_object_clone,
+                    "query_object_dct": query_object_clone_dct,
+                    "metrics_mapping": metrics_mapping,
+                    "cache_key": cache_key,
+                    "join_keys": join_keys,
+                }
+            )
+            queries.append("")
             cache_keys.append(None)
 
-            offset_metrics_df = result.df
-            if offset_metrics_df.empty:
-                offset_metrics_df = pd.DataFrame(
-                    {
-                        col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
-                    }
-                )
-            else:
-                # 1. normalize df, set dttm column
-                offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
-                )
-
-                # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+        # query the offsets missing from the cache, concurrently when enabled
+        max_workers = (
+            self._time_offset_max_workers or config["CHART_DATA_QUERY_MAX_WORKERS"]
+        )
+        if max_workers > 1 and len(pending_offsets) > 1:
+            self._preload_datasource()
 
-            # cache df and query
-            value = {
-                "df": offset_metrics_df,
-                "query": result.query,
-            }
-            cache.set(
-                key=cache_key,
-                value=value,
-                timeout=self.get_cache_timeout(),
-                datasource_uid=query_context.datasource.uid,
-                region=CacheRegion.DATA,
+        offset_results = map_in_app_context(
+            lambda kwargs: self._get_time_offset_result(**kwargs),
+            pending_offset_queries,
+            max_workers=max_workers,
+        )
+        for (position, offset), offset_result in zip(
+            pending_offsets, offset_results, strict=True
+        ):
+            queries[position], offset_dfs[offset] = cast(
+                tuple[str, pd.DataFrame], offset_result
             )
-            offset_dfs[offset] = offset_metrics_df
 
         if offset_dfs:
             df = self.join_offset_dfs(
@@ -608,6 +632,55 @@ class QueryContextProcessor:
 
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    def _get_time_offset_result(  # pylint: disable=too-many-arguments
+        self,
+        query_object: QueryObject,
+        query_object_dct: dict[str, Any],
+        metrics_mapping: dict[str, str],
+        cache_key: str | None,
+        join_keys: list[str],
+    ) -> tuple[str, pd.DataFrame]:
+        """
+        Run the query of a time offset missing from the cache and cache its result.
+
+        :param query_object: The time shifted query object
+        :param query_object_dct: The query object as passed to the datasource
+        :param metrics_mapping: The metrics and their time shifted names
+        :param cache_key: The cache key of the time offset
+        :param join_keys: The columns used to join the result with the main query
+        :returns: The executed query and the resulting dataframe
+        """
+        if isinstance(self._qc_datasource, Query):
+            result = self._qc_datasource.exc_query(query_object_dct)
+        else:
+            result = self._qc_datasource.query(query_object_dct)
+
+        offset_metrics_df = result.df
+        if offset_metrics_df.empty:
+            offset_metrics_df = pd.DataFrame(
+                {col: [np.NaN] for col in join_keys + list(metrics_mapping.values())}
+            )
+        else:
+            # 1. normalize df, set dttm column
+            offset_metrics_df = self.normalize_df(offset_metrics_df, query_object)
+
+            # 2. rename extra query columns
+            offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+
+        # cache df and query
+        value = {
+            **serialize_df(offset_metrics_df),
+            "query": result.query,
+        }
+        QueryCacheManager.set(
+            key=cache_key,
+            value=value,
+            timeout=self.get_cache_timeout(),
+            datasource_uid=self._query_context.datasource.uid,
+            region=CacheRegion.DATA,
+        )
+        return result.query, offset_metrics_df
+
     def join_offset_dfs(
         self,
         df: pd.DataFrame,
@@ -682,6 +755,50 @@ class QueryContextProcessor:
                 )
         return df
 
+    @staticmethod
+    def generate_join_column_series(
+        series: pd.Series,
+        time_grain: str,
+        time_offset: str | None = None,
+    ) -> pd.Series | None:
+        """
+        Vectorized version of `generate_join_column` for a temporal column.
+
+        Returns `None` when the join column can't be computed column-wise, i.e. when
+        the column isn't temporal or the time grain doesn't aggregate dates, in which
+        case the join column should be computed row by row.
+        """
+        if (
+            time_grain not in AGGREGATED_JOIN_GRAINS
+            or not pd.api.types.is_datetime64_any_dtype(series)
+            or series.isnull().any()
+        ):
+            return None
+
+        if time_offset:
+            series = series + DateOffset(**normalize_time_delta(time_offset))
+
+        if time_grain in (
+            TimeGrain.WEEK_STARTING_SUNDAY,
+            TimeGrain.WEEK_ENDING_SATURDAY,
+        ):
+            return series.dt.strftime("%Y-W%U")
+
+        if time_grain in (
+            TimeGrain.WEEK,
+            TimeGrain.WEEK_STARTING_MONDAY,
+            TimeGrain.WEEK_ENDING_SUNDAY,
+        ):
+            return series.dt.strftime("%Y-W%W")
+
+        if time_grain == TimeGrain.MONTH:
+            return series.dt.strftime("%Y-%m")
+
+        if time_grain == TimeGrain.QUARTER:
+            return series.dt.strftime("%Y-Q") + series.dt.quarter.astype(str)
+
+        return series.dt.strftime("%Y")
+
     @staticmethod
     def generate_join_column(
         row: pd.Series,
@@ -721,7 +838,7 @@ class QueryContextProcessor:
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | Iterator[str] | list[dict[str, Any]]:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -731,6 +848,15 @@ class QueryContextProcessor:
 
             result = None
             if self._query_context.result_format == ChartDataResultFormat.CSV:
+                chunk_size = config["CSV_EXPORT_STREAMING_CHUNK_SIZE"]
+                if (
+                    chunk_size
+                    and self._query_context.result_type == ChartDataResultType.FULL
+                    and len(self._query_context.queries) == 1
+                ):
+                    return csv.df_to_escaped_csv_chunks(
+                        df, chunk_size, index=include_index, **config["CSV_EXPORT"]
+                    )
                 result = csv.df_to_escaped_csv(
                     df, index=include_index, **config["CSV_EXPORT"]
                 )
@@ -748,16 +874,34 @@ class QueryContextProcessor:
     ) -> dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
-        # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
+        def get_timed_query_results(query_obj: QueryObject) -> dict[str, Any]:
+            start = now_as_float()
+            query_results = get_query_results(
                 query_obj.result_type or self._query_context.result_type,
                 self._query_context,
                 query_obj,
                 force_cached,
             )
-            for query_obj in self._query_context.queries
-        ]
+            query_results["duration_ms"] = round(now_as_float() - start, 2)
+            return query_results
+
+        max_workers = config["CHART_DATA_QUERY_MAX_WORKERS"]
+        if max_workers > 1 and len(self._query_context.queries) > 1:
+            self._preload_datasource()
+            # split the workers between the query objects processed concurrently, so
+            # that their time offset queries don't run more than `max_workers` queries
+            # overall
+            self._time_offset_max_workers = max(
+                1, max_workers // min(max_workers, len(self._query_context.queries))
+            )
+
+        # Get all the payloads from the QueryObjects, independent query objects are
+        # processed concurrently when `CHART_DATA_QUERY_MAX_WORKERS` allows it
+        query_results = map_in_app_context(
+            get_timed_query_results,
+            self._query_context.queries,
+            max_workers=max_workers,
+        )
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -780,6 +924,14 @@ class QueryContextProcessor:
 
         return return_value
 
+    def _preload_datasource(self) -> None:
+        """
+        Load the lazy relationships of the datasource before it is shared between
+        threads, as the metadata database session it's bound to isn't thread safe.
+        """
+        for attribute in ("columns", "metrics", "database"):
+            getattr(self._qc_datasource, attribute, None)
+
     def get_cache_timeout(self) -> int:
         if cache_timeout_rv := self._query_context.get_cache_timeout():
             return cache_timeout_rv
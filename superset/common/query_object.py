@@ -22,7 +22,7 @@ from datetime import datetime
 from pprint import pformat
 from typing import Any, NamedTuple, TYPE_CHECKING
 
-from flask import g
+from flask import current_app, g
 from flask_babel import gettext as _
 from pandas import DataFrame
 
@@ -45,7 +45,7 @@ from superset.utils.core import (
     is_adhoc_metric,
     QueryObjectFilterClause,
 )
-from superset.utils.hashing import md5_sha_from_dict
+from superset.utils.hashing import hash_from_dict, hash_from_str, md5_sha_from_dict
 from superset.utils.json import json_int_dttm_ser
 
 if TYPE_CHECKING:
@@ -352,7 +352,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             default=str,
         )
 
-    def cache_key(self, **extra: Any) -> str:  # noqa: C901
+    def cache_key(self, **extra: Any) -> str:
         """
         The cache key is made out of the key/values from to_dict(), plus any
         other key/values in `extra`
@@ -360,6 +360,48 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
         the use-provided inputs to bounds, which may be time-relative (as in
         "5 days ago" or "now").
         """
+        return self.cache_keys(**extra)[0]
+
+    def cache_keys(self, **extra: Any) -> tuple[str, str | None]:
+        """
+        Returns the cache key in the configured format, along with the key in the
+        legacy format while migrating between the two (see
+        `QUERY_CACHE_KEY_LEGACY_FALLBACK`), None otherwise.
+        """
+        cache_dict = self._get_cache_dict(**extra)
+        compact = current_app.config["QUERY_CACHE_KEY_COMPACT_FORMAT"]
+        algorithm = current_app.config["QUERY_CACHE_KEY_HASH_ALGORITHM"]
+        if not compact and algorithm == "md5":
+            return self._get_legacy_cache_key(cache_dict), None
+
+        if compact:
+            key = hash_from_dict(
+                cache_dict, default=json_int_dttm_ser, algorithm=algorithm
+            )
+        else:
+            key = hash_from_str(
+                json.dumps(
+                    cache_dict,
+                    sort_keys=True,
+                    ignore_nan=True,
+                    default=json_int_dttm_ser,
+                    allow_nan=True,
+                ),
+                algorithm,
+            )
+
+        legacy_key = (
+            self._get_legacy_cache_key(cache_dict)
+            if current_app.config["QUERY_CACHE_KEY_LEGACY_FALLBACK"]
+            else None
+        )
+        return key, legacy_key
+
+    @staticmethod
+    def _get_legacy_cache_key(cache_dict: dict[str, Any]) -> str:
+        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+
+    def _get_cache_dict(self, **extra: Any) -> dict[str, Any]:  # noqa: C901
         cache_dict = self.to_dict()
         cache_dict.update(extra)
 
@@ -421,7 +463,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             # datasource or database do not exist
             pass
 
-        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+        return cache_dict
 
     def exec_post_processing(self, df: DataFrame) -> DataFrame:
         """
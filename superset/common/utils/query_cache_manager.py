@@ -19,6 +19,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import pyarrow as pa
 from flask_caching import Cache
 from pandas import DataFrame
 
@@ -28,6 +29,7 @@ from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
 from superset.models.helpers import QueryResult
+from superset.sqllab.utils import read_ipc_buffer, write_ipc_buffer
 from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
 from superset.utils.cache import set_and_log_cache
@@ -43,6 +45,75 @@ _cache: dict[CacheRegion, Cache] = {
 }
 
 
+def _is_object_column(type_: pa.DataType, column: pa.ChunkedArray) -> bool:
+    """
+    Whether an Arrow column is converted back to a pandas column of objects.
+    """
+    if (
+        pa.types.is_string(type_)
+        or pa.types.is_large_string(type_)
+        or pa.types.is_binary(type_)
+        or pa.types.is_large_binary(type_)
+        or pa.types.is_decimal(type_)
+        or pa.types.is_null(type_)
+    ):
+        return True
+    return (
+        pa.types.is_integer(type_) or pa.types.is_boolean(type_)
+    ) and column.null_count > 0
+
+
+def serialize_df(df: DataFrame) -> dict[str, Any]:
+    """
+    Serialize a dataframe for the query cache.
+
+    When enabled through `DATA_CACHE_ARROW_SERIALIZATION` the dataframe is stored as a
+    (compressed) Arrow IPC buffer under `df_arrow`, otherwise, or when the dataframe
+    can't be represented faithfully in Arrow, the dataframe itself is stored under
+    `df` and pickled by the cache backend.
+    """
+    if not app.config["DATA_CACHE_ARROW_SERIALIZATION"] or not all(
+        isinstance(label, str) for label in df.columns
+    ):
+        return {"df": df}
+
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return {"df": df}
+
+    # nested values would come back as numpy arrays instead of the original objects,
+    # and object columns of e.g. floats or dates as numpy dtypes
+    if any(
+        pa.types.is_nested(field.type)
+        or (
+            df[field.name].dtype == object
+            and not _is_object_column(field.type, table.column(field.name))
+        )
+        for field in table.schema
+        if field.name in df.columns
+    ):
+        return {"df": df}
+
+    buffer = write_ipc_buffer(table, app.config["DATA_CACHE_ARROW_COMPRESSION"])
+    return {"df_arrow": buffer.to_pybytes()}
+
+
+def deserialize_df(cache_value: dict[str, Any]) -> DataFrame:
+    """
+    Rebuild the dataframe stored by `serialize_df`, supporting both formats.
+
+    Integer columns with nulls are read back as objects, as done by
+    `SupersetResultSet.to_pandas_df`, instead of being cast to floats.
+    """
+    if (buffer := cache_value.get("df_arrow")) is not None:
+        return read_ipc_buffer(buffer).to_pandas(
+            integer_object_nulls=True,
+            split_blocks=True,
+        )
+    return cache_value["df"]
+
+
 class QueryCacheManager:
     """
     Class for manage query-cache getting and setting
@@ -114,7 +185,7 @@ class QueryCacheManager:
                 self.is_loaded = True
 
             value = {
-                "df": self.df,
+                **serialize_df(self.df),
                 "query": self.query,
                 "applied_template_filters": self.applied_template_filters,
                 "applied_filter_columns": self.applied_filter_columns,
@@ -144,19 +215,29 @@ class QueryCacheManager:
         region: CacheRegion = CacheRegion.DEFAULT,
         force_query: bool | None = False,
         force_cached: bool | None = False,
+        fallback_key: str | None = None,
     ) -> QueryCacheManager:
         """
         Initialize QueryCacheManager by query-cache key
+
+        :param fallback_key: Key looked up when `key` isn't cached, e.g. the key of
+            the query in the legacy format while migrating cache key formats
         """
         query_cache = cls()
         if not key or not _cache[region] or force_query:
             return query_cache
 
-        if cache_value := _cache[region].get(key):
+        cache_value = _cache[region].get(key)
+        if not cache_value and fallback_key:
+            if cache_value := _cache[region].get(fallback_key):
+                logger.debug("Cache key: %s (fallback of %s)", fallback_key, key)
+                stats_logger.incr("loading_from_cache_fallback_key")
+
+        if cache_value:
             logger.debug("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
-                query_cache.df = cache_value["df"]
+                query_cache.df = deserialize_df(cache_value)
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
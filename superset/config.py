@@ -47,6 +47,7 @@ from pandas import Series
 from pandas._libs.parsers import STR_NA_VALUES
 from sqlalchemy.engine.url import URL
 from sqlalchemy.orm.query import Query
+from sqlalchemy.pool import QueuePool
 
 from superset.advanced_data_type.plugins.internet_address import internet_address
 from superset.advanced_data_type.plugins.internet_port import internet_port
@@ -83,6 +84,11 @@ STATS_LOGGER = DummyStatsLogger()
 # Note that you can use `StdOutEventLogger` for debugging
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
+# To keep the metadata database writes out of the requests, `BufferedDBEventLogger`
+# writes the logs in batches from a background thread instead, e.g.
+# EVENT_LOGGER = BufferedDBEventLogger(
+#     max_queue_size=10000, batch_size=500, flush_interval=5
+# )
 EVENT_LOGGER = DBEventLogger()
 
 SUPERSET_LOG_VIEW = True
@@ -255,6 +261,12 @@ SQLALCHEMY_ENCRYPTED_FIELD_TYPE_ADAPTER = (  # pylint: disable=invalid-name
 # Extends the default SQLGlot dialects with additional dialects
 SQLGLOT_DIALECTS_EXTENSIONS: DialectExtensions | Callable[[], DialectExtensions] = {}
 
+# The number of SQL parse trees kept in the in-process LRU cache shared by `sqlparse`
+# and `sqlglot`, since the same SQL is parsed several times while it's validated,
+# has RLS applied and is executed. Hits and misses are reported to the stats logger
+# as `sql_parse_cache.<parser>.hit|miss`. Set to 0 to disable the cache.
+SQL_PARSE_CACHE_SIZE = 128
+
 # The limit of queries fetched for query search
 QUERY_SEARCH_LIMIT = 1000
 
@@ -702,6 +714,16 @@ EXTRA_SEQUENTIAL_COLOR_SCHEMES: list[dict[str, Any]] = []
 # CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER, FixedExecutor("admin")]
 CACHE_WARMUP_EXECUTORS = [ExecutorType.OWNER]
 
+# Run the cache warmup of charts in the Celery worker, instead of scheduling one
+# request per chart to the `/api/v1/chart/warm_up_cache` endpoint. Charts whose
+# queries have the same cache keys are only warmed up once, charts whose queries are
+# all cached are skipped, and at most CACHE_WARMUP_MAX_QUERIES_PER_DATABASE queries run
+# concurrently on each database, for up to CACHE_WARMUP_MAX_DATABASES databases at a
+# time.
+CACHE_WARMUP_IN_PROCESS = False
+CACHE_WARMUP_MAX_QUERIES_PER_DATABASE = 2
+CACHE_WARMUP_MAX_DATABASES = 4
+
 # ---------------------------------------------------
 # Thumbnail config (behind feature flag)
 # ---------------------------------------------------
@@ -767,6 +789,12 @@ SCREENSHOT_PLAYWRIGHT_WAIT_EVENT = "load"
 SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT = int(
     timedelta(seconds=30).total_seconds() * 1000
 )
+# Number of idle browsers (or Selenium drivers) that each worker process keeps warm
+# to take screenshots, instead of starting a browser per screenshot. Pooled browsers
+# get a fresh authenticated context for each screenshot. Set to 0 to disable pooling
+SCREENSHOT_BROWSER_POOL_SIZE = 0
+# Recycle a pooled browser after this number of screenshots
+SCREENSHOT_BROWSER_POOL_MAX_USES = 20
 
 # ---------------------------------------------------
 # Image and file configuration
@@ -788,6 +816,26 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Store the DataFrames of cached query results as Arrow IPC buffers instead of
+# pickling them, which is considerably cheaper to write and read for large results.
+# Frames that Arrow can't round-trip faithfully (e.g. nested values or non-string
+# column labels) are still pickled. Entries written in the legacy format remain
+# readable either way.
+DATA_CACHE_ARROW_SERIALIZATION = True
+# Buffer compression codec for the Arrow IPC payloads: "lz4", "zstd" or None
+DATA_CACHE_ARROW_COMPRESSION: Literal["lz4", "zstd"] | None = "lz4"
+
+# Cache keys of query results are hashes of the JSON representation of the query.
+# The legacy format (MD5 over simplejson output) is kept by default; enabling the
+# compact format encodes the query with the much faster standard library encoder
+# and hashes it with QUERY_CACHE_KEY_HASH_ALGORITHM: "md5", "blake2b" or "xxh128"
+# (non cryptographic, requires the `xxhash` package). Either change invalidates the
+# existing keys, unless QUERY_CACHE_KEY_LEGACY_FALLBACK is enabled while migrating:
+# results missing under the new key are then also looked up under the legacy one.
+QUERY_CACHE_KEY_COMPACT_FORMAT = False
+QUERY_CACHE_KEY_HASH_ALGORITHM: Literal["md5", "blake2b", "xxh128"] = "md5"
+QUERY_CACHE_KEY_LEGACY_FALLBACK = False
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -797,9 +845,20 @@ FILTER_STATE_CACHE_CONFIG: CacheConfig = {
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=90).total_seconds()),
     # Should the timeout be reset when retrieving a cached value?
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
-    # The following parameter only applies to `MetastoreCache`:
+    # The following parameters only apply to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # How many entries should be kept in a per-process cache in front of the
+    # metastore, and for how many seconds? Requires `CACHE_CONFIG` to be set, as
+    # entries are invalidated across processes through the Superset cache.
+    "LOCAL_CACHE_SIZE": 0,
+    "LOCAL_CACHE_TIMEOUT": 60,
+    # When the per-process cache is enabled, only persist the refreshed timeout of
+    # an unchanged value once every REFRESH_INTERVAL seconds
+    "REFRESH_INTERVAL": 0,
+    # Should expired entries be deleted when adding a value? If disabled, schedule
+    # the `prune_metastore_cache` Celery task instead.
+    "PRUNE_EXPIRED_ON_ADD": True,
 }
 
 # Cache for explore form data state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
@@ -811,11 +870,39 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "CACHE_DEFAULT_TIMEOUT": int(timedelta(days=7).total_seconds()),
     # Should the timeout be reset when retrieving a cached value?
     "REFRESH_TIMEOUT_ON_RETRIEVAL": True,
-    # The following parameter only applies to `MetastoreCache`:
+    # The following parameters only apply to `MetastoreCache`:
     # How should entries be serialized/deserialized?
     "CODEC": JsonKeyValueCodec(),
+    # How many entries should be kept in a per-process cache in front of the
+    # metastore, and for how many seconds? Requires `CACHE_CONFIG` to be set, as
+    # entries are invalidated across processes through the Superset cache.
+    "LOCAL_CACHE_SIZE": 0,
+    "LOCAL_CACHE_TIMEOUT": 60,
+    # When the per-process cache is enabled, only persist the refreshed timeout of
+    # an unchanged value once every REFRESH_INTERVAL seconds
+    "REFRESH_INTERVAL": 0,
+    # Should expired entries be deleted when adding a value? If disabled, schedule
+    # the `prune_metastore_cache` Celery task instead.
+    "PRUNE_EXPIRED_ON_ADD": True,
 }
 
+# Maximum number of query objects of a single chart data request that are processed
+# concurrently, e.g. the queries of mixed timeseries or big number with trendline
+# charts. The same limit applies to the time comparison (time offset) queries of each
+# query object that are missing from the cache, the workers being split between the
+# query objects processed concurrently so that at most this many queries run at once.
+# Each query runs in its own thread, holding its own database connection. The default
+# of 1 processes them serially.
+CHART_DATA_QUERY_MAX_WORKERS = 1
+
+# Row level security filters and the permissions of the current user are memoized for
+# the duration of each request. Setting this to a number of seconds also shares the
+# row level security filters of each dataset and set of roles between the requests
+# handled by a process for that long. Changes made by the process itself invalidate
+# the shared entries, while changes made by other processes are picked up once they
+# expire. The default of 0 disables sharing.
+RLS_FILTERS_CACHE_TTL = 0
+
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
@@ -861,11 +948,23 @@ CSV_EXTENSIONS = {"csv", "tsv", "txt"}
 COLUMNAR_EXTENSIONS = {"parquet", "zip"}
 ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 
+# When set, CSV and columnar files uploaded on the Database view are read and inserted
+# in chunks of this many rows, in a single transaction, instead of being loaded in
+# memory as a whole. The column types of the table are then inferred from the first
+# chunk, unless they are set in the upload options.
+UPLOAD_STREAMING_CHUNK_SIZE: int | None = None
+
 # CSV Options: key/value pairs that will be passed as argument to DataFrame.to_csv
 # method.
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# When set, single query CSV exports of chart data, and CSV exports of SQL Lab
+# results stored in the results backend with RESULTS_BACKEND_USE_MSGPACK, are
+# streamed to the client in chunks of this many rows instead of building the whole
+# file in memory first.
+CSV_EXPORT_STREAMING_CHUNK_SIZE: int | None = None
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -978,6 +1077,12 @@ TABLE_VIZ_MAX_ROW_SERVER = 500000
 # exported CSVs
 DISPLAY_MAX_ROW = 10000
 
+# Fetch query results in batches of rows that are converted to Arrow one batch at a
+# time, instead of fetching all the rows at once, so that memory scales with the
+# batch size. Engine specs whose driver supports it fetch results natively as Arrow.
+# See `BaseEngineSpec.fetch_data_batches` and `BaseEngineSpec.fetch_arrow_table`.
+FETCH_RESULTS_IN_BATCHES = False
+
 # Default row limit for SQL Lab queries. Is overridden by setting a new limit in
 # the SQL Lab UI
 DEFAULT_SQLLAB_LIMIT = 1000
@@ -1056,6 +1161,12 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         #     "schedule": crontab(minute="*", hour="*"),
         #     "kwargs": {"retention_period_days": 180},
         # },
+        # Uncomment to prune expired metastore cache entries, when the metastore
+        # caches are configured with `PRUNE_EXPIRED_ON_ADD` disabled
+        # "prune_metastore_cache": {
+        #     "task": "prune_metastore_cache",
+        #     "schedule": crontab(minute="*/10", hour="*"),
+        # },
         # Uncomment to enable Slack channel cache warm-up
         # "slack.cache_channels": {
         #     "task": "slack.cache_channels",
@@ -1169,6 +1280,21 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Number of rows per Arrow record batch when storing SQL Lab results with
+# RESULTS_BACKEND_USE_MSGPACK. Pages of results requested with the `offset` and
+# `limit` parameters of `/api/v1/sqllab/results/` only decode the batches they span.
+RESULTS_BACKEND_ARROW_BATCH_SIZE = 10_000
+
+# Codec used to compress the SQL Lab results stored in the results backend: "zlib",
+# a codec supported by `pyarrow.compress` such as "zstd" or "lz4", or None. Stored
+# results name their codec, so results written with another codec remain readable.
+RESULTS_BACKEND_COMPRESSION: str | None = "zlib"
+
+# Compression of the Arrow record batches of SQL Lab results stored with
+# RESULTS_BACKEND_USE_MSGPACK. Batches are then decompressed one at a time when
+# reading pages of results, and RESULTS_BACKEND_COMPRESSION can be set to None.
+RESULTS_BACKEND_ARROW_COMPRESSION: Literal["lz4", "zstd"] | None = None
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1302,6 +1428,13 @@ DB_POLL_INTERVAL_SECONDS: dict[str, int] = {}
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
 PRESTO_POLL_INTERVAL = int(timedelta(seconds=1).total_seconds())
 
+# Minimum interval in seconds between two commits of the progress of a running SQL Lab
+# query polled from the engine (Presto, Trino, Hive and Impala), unless the progress
+# increased by at least SQLLAB_PROGRESS_UPDATE_MIN_DELTA percent. By default every
+# change of progress is committed.
+SQLLAB_PROGRESS_UPDATE_INTERVAL = 0
+SQLLAB_PROGRESS_UPDATE_MIN_DELTA = 0
+
 # Allow list of custom authentications for each DB engine.
 # Example:
 # from your.module import AuthClass
@@ -1350,6 +1483,25 @@ ENGINE_CONTEXT_MANAGER = engine_context_manager
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Keep a pooled SQLAlchemy engine per database and effective connection parameters
+# (URL, engine params and impersonated user), instead of creating an engine without
+# a connection pool every time a database is used. Databases connecting through an
+# SSH tunnel are never pooled.
+ENGINE_REGISTRY_ENABLED = False
+# The maximum number of engines kept; the least recently used ones are disposed of
+ENGINE_REGISTRY_MAX_ENGINES = 100
+# Engines unused for this many seconds are disposed of
+ENGINE_REGISTRY_IDLE_TIMEOUT = 600
+# Parameters of the connection pool of each engine, unless the `engine_params` of the
+# database set a `poolclass`
+ENGINE_REGISTRY_POOL_PARAMS: dict[str, Any] = {
+    "poolclass": QueuePool,
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
 
 # A callable that is invoked for every invocation of DB Engine Specs
 # which allows for custom validation of the engine URI.
@@ -1483,12 +1635,19 @@ ALERT_REPORTS_DEFAULT_CRON_VALUE = "0 0 * * *"  # every day
 # If set to true no notification is sent, the worker will just log a message.
 # Useful for debugging
 ALERT_REPORTS_NOTIFICATION_DRY_RUN = False
+# If set to true, the CSV and text data of chart reports is built by running the
+# chart's query context in the worker, as the executor and with the same permission
+# checks as the chart data API, instead of requesting it from the web server over
+# HTTP with machine auth cookies.
+ALERT_REPORTS_CHART_DATA_IN_PROCESS = False
 # Max tries to run queries to prevent false errors caused by transient errors
 # being returned to users. Set to a value >1 to enable retries.
 ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
+# Number of screenshots taken concurrently for the tabs of a dashboard report
+ALERT_REPORTS_MAX_CONCURRENT_SCREENSHOTS = 1
 # Set a minimum interval threshold between executions (for each Alert/Report)
 # Value should be an integer i.e. int(timedelta(minutes=5).total_seconds())
 # You can also assign a function to the config that returns the expected integer
@@ -1773,10 +1932,19 @@ GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE: None | (Literal["None", "Lax", "Strict
 )
 GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN = None
 GLOBAL_ASYNC_QUERIES_JWT_SECRET = "test-secret-change-me"  # noqa: S105
-GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "ws"] = "polling"
+GLOBAL_ASYNC_QUERIES_TRANSPORT: Literal["polling", "long-polling", "ws"] = "polling"
 GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
+# With the "long-polling" transport, requests for async events wait on the Redis
+# stream of the channel (with a blocking XREAD) for up to this number of seconds, and
+# return as soon as there are new events. Requests waiting on the same channel share
+# a single read. This ties up a web server thread per waiting request, so prefer
+# threaded or async workers.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = int(timedelta(seconds=25).total_seconds())
+# Maximum number of requests of a web server process waiting for events at the same
+# time, after which requests return right away like with the "polling" transport.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_MAX_CONNECTIONS = 100
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
 
 # Global async queries cache backend configuration options:
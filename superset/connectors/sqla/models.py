@@ -18,9 +18,11 @@
 from __future__ import annotations
 
 import builtins
+import copy
 import dataclasses
 import logging
 import re
+import threading
 from collections import defaultdict
 from collections.abc import Hashable
 from dataclasses import dataclass, field
@@ -72,14 +74,13 @@ from sqlalchemy.sql.selectable import Alias, TableClause
 from sqlalchemy.types import JSON
 
 from superset import app, db, is_feature_enabled, security_manager
-from superset.commands.dataset.exceptions import DatasetNotFoundError
 from superset.common.db_query_status import QueryStatus
 from superset.connectors.sqla.utils import (
     get_columns_description,
     get_physical_table_metadata,
     get_virtual_table_metadata,
 )
-from superset.constants import EMPTY_STRING, NULL_STRING
+from superset.constants import EMPTY_STRING, LRU_CACHE_MAX_SIZE, NULL_STRING
 from superset.db_engine_specs.base import BaseEngineSpec, TimestampExpression
 from superset.exceptions import (
     ColumnNotFoundException,
@@ -140,6 +141,28 @@ class MetadataResult:
     modified: list[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class ExtraCacheExpressions:
+    """
+    The templatable expressions of a dataset calling `ExtraCache` methods.
+    """
+
+    dataset: bool
+    columns: frozenset[str]
+    metrics: frozenset[str]
+
+
+# `ExtraCacheExpressions` of the most recently added dataset versions, evicted in
+# insertion order
+_extra_cache_expressions: dict[Hashable, ExtraCacheExpressions] = {}
+_extra_cache_expressions_lock = threading.Lock()
+
+# `data_for_slices` payloads of the most recently added dataset versions, evicted in
+# insertion order
+_data_for_slices: dict[Hashable, dict[str, Any]] = {}
+_data_for_slices_lock = threading.Lock()
+
+
 logger = logging.getLogger(__name__)
 
 METRIC_FORM_DATA_PARAMS = [
@@ -370,6 +393,17 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
     @property
     def data(self) -> dict[str, Any]:
         """Data representation of the datasource sent to the frontend"""
+        return self.get_data(self.columns, self.metrics)
+
+    def get_data(
+        self,
+        columns: list[TableColumn],
+        metrics: list[SqlMetric],
+    ) -> dict[str, Any]:
+        """
+        Data representation of the datasource sent to the frontend, including only the
+        given columns and metrics.
+        """
         return {
             # simple fields
             "id": self.id,
@@ -394,8 +428,8 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             # sqla-specific
             "sql": self.sql,
             # one to many
-            "columns": [o.data for o in self.columns],
-            "metrics": [o.data for o in self.metrics],
+            "columns": [o.data for o in columns],
+            "metrics": [o.data for o in metrics],
             "folders": self.folders,
             # TODO deprecate, move logic to JS
             "order_by_choices": self.order_by_choices,
@@ -404,16 +438,65 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             "select_star": self.select_star,
         }
 
-    def data_for_slices(  # pylint: disable=too-many-locals  # noqa: C901
-        self, slices: list[Slice]
-    ) -> dict[str, Any]:
+    def get_query_context_columns(self, slc: Slice) -> list[Any] | None:
         """
-        The representation of the datasource containing only the required data
-        to render the provided slices.
+        The columns of the queries in the query context of a chart, read without
+        building the query context.
 
-        Used to reduce the payload when loading a dashboard.
+        As when building it, the x-axis is replaced with the granularity.
+
+        :param slc: The chart
+        :returns: The columns, or None if the chart has no valid query context
         """
-        data = self.data
+        if not slc.query_context:
+            return None
+
+        try:
+            query_context = json.loads(slc.query_context)
+        except json.JSONDecodeError:
+            logger.error("Malformed json in slice's query context", exc_info=True)
+            return None
+
+        # legacy dashboard imports may have the query context of another dataset
+        datasource = query_context.get("datasource") or {}
+        if str(datasource.get("id", self.id)) != str(self.id):
+            return None
+
+        x_axis = (query_context.get("form_data") or {}).get("x_axis")
+        if isinstance(x_axis, dict):
+            x_axis = x_axis.get("sqlExpression")
+        if x_axis and x_axis not in {
+            column_.column_name for column_ in self.columns if column_.is_dttm
+        }:
+            x_axis = None
+
+        columns: list[Any] = []
+        for query in query_context.get("queries") or []:
+            query_columns = query.get("groupby") or query.get("columns") or []
+            granularity = query.get("granularity_sqla") or query.get("granularity")
+            if granularity and x_axis:
+                query_columns = [
+                    granularity
+                    if column_ == x_axis
+                    or (
+                        isinstance(column_, dict)
+                        and column_.get("sqlExpression") == x_axis
+                    )
+                    else column_
+                    for column_ in query_columns
+                ]
+            columns.extend(query_columns)
+
+        return columns
+
+    def get_slices_column_and_metric_names(
+        self, slices: list[Slice]
+    ) -> tuple[set[str], set[str]]:
+        """
+        The names of the columns and metrics of the datasource required to render the
+        provided slices.
+        """
+        verbose_map = self.verbose_map
         metric_names = set()
         column_names = set()
         for slc in slices:
@@ -421,7 +504,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             # pull out all required metrics from the form_data
             for metric_param in METRIC_FORM_DATA_PARAMS:
                 for metric in utils.as_list(form_data.get(metric_param) or []):
-                    metric_names.add(utils.get_metric_name(metric, self.verbose_map))
+                    metric_names.add(utils.get_metric_name(metric, verbose_map))
                     if utils.is_adhoc_metric(metric):
                         column_ = metric.get("column") or {}
                         if column_name := column_.get("column_name"):
@@ -441,21 +524,11 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
                 if "column" in filter_config
             )
 
-            # for legacy dashboard imports which have the wrong query_context in them
-            try:
-                query_context = slc.get_query_context()
-            except DatasetNotFoundError:
-                query_context = None
-
             # legacy charts don't have query_context charts
-            if query_context:
+            query_context_columns = self.get_query_context_columns(slc)
+            if query_context_columns is not None:
                 column_names.update(
-                    [
-                        utils.get_column_name(column_)
-                        for query in query_context.queries
-                        for column_ in query.columns
-                    ]
-                    or []
+                    utils.get_column_name(column_) for column_ in query_context_columns
                 )
             else:
                 _columns = [
@@ -469,43 +542,77 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
                 ]
                 column_names.update(_columns)
 
+        return column_names, metric_names
+
+    def data_for_slices(self, slices: list[Slice]) -> dict[str, Any]:
+        """
+        The representation of the datasource containing only the required data
+        to render the provided slices.
+
+        Used to reduce the payload when loading a dashboard. Payloads are memoized per
+        dataset version and required columns and metrics.
+        """
+        column_names, metric_names = self.get_slices_column_and_metric_names(slices)
+        key: Hashable = (
+            (
+                self.uid,
+                self.changed_on,
+                self.database.changed_on,  # pylint: disable=no-member
+                tuple(owner.id for owner in self.owners),
+                tuple((column_.id, column_.changed_on) for column_ in self.columns),
+                tuple((metric.id, metric.changed_on) for metric in self.metrics),
+                frozenset(column_names),
+                frozenset(metric_names),
+            )
+            if self.id and self.changed_on
+            else None
+        )
+        if key is not None and (data := _data_for_slices.get(key)):
+            return copy.deepcopy(data)
+
         filtered_metrics = [
             metric
-            for metric in data["metrics"]
-            if metric["metric_name"] in metric_names
-            or metric["verbose_name"] in metric_names
+            for metric in self.metrics
+            if metric.metric_name in metric_names or metric.verbose_name in metric_names
         ]
+        filtered_columns = [
+            column_ for column_ in self.columns if column_.column_name in column_names
+        ]
+        data = self.get_data(filtered_columns, filtered_metrics)
 
-        filtered_columns: list[Column] = []
+        # the generic type only depends on these, and is costly to infer
         column_types: set[utils.GenericDataType] = set()
-        for column_ in data["columns"]:
-            generic_type = column_.get("type_generic")
-            if generic_type is not None:
-                column_types.add(generic_type)
-            if column_["column_name"] in column_names:
-                filtered_columns.append(column_)
+        column_type_keys: set[tuple[bool | None, str | None]] = set()
+        for column_ in self.columns:
+            if (column_.is_dttm, column_.type) not in column_type_keys:
+                column_type_keys.add((column_.is_dttm, column_.type))
+                if (generic_type := column_.type_generic) is not None:
+                    column_types.add(generic_type)
 
         data["column_types"] = list(column_types)
         del data["description"]
-        data.update({"metrics": filtered_metrics})
-        data.update({"columns": filtered_columns})
 
         all_columns = {
             column_["column_name"]: column_["verbose_name"] or column_["column_name"]
-            for column_ in filtered_columns
+            for column_ in data["columns"]
         }
         verbose_map = {"__timestamp": "Time"}
         verbose_map.update(
             {
                 metric["metric_name"]: metric["verbose_name"] or metric["metric_name"]
-                for metric in filtered_metrics
+                for metric in data["metrics"]
             }
         )
         verbose_map.update(all_columns)
         data["verbose_map"] = verbose_map
         data["column_names"] = set(all_columns.values()) | set(self.column_names)
 
-        return data
+        if key is not None:
+            with _data_for_slices_lock:
+                if len(_data_for_slices) >= LRU_CACHE_MAX_SIZE:
+                    del _data_for_slices[next(iter(_data_for_slices))]
+                _data_for_slices[key] = data
+        return copy.deepcopy(data)
 
     @staticmethod
     def filter_values_handler(  # pylint: disable=too-many-arguments  # noqa: C901
@@ -1406,9 +1513,12 @@ class SqlaTable(
     def time_grain_sqla(self) -> list[tuple[Any, Any]]:
         return [(g.duration, g.name) for g in self.database.grains() or []]
 
-    @property
-    def data(self) -> dict[str, Any]:
-        data_ = super().data
+    def get_data(
+        self,
+        columns: list[TableColumn],
+        metrics: list[SqlMetric],
+    ) -> dict[str, Any]:
+        data_ = super().get_data(columns, metrics)
         if self.type == "table":
             data_["granularity_sqla"] = self.granularity_sqla
             data_["time_grain_sqla"] = self.time_grain_sqla
@@ -1927,6 +2037,23 @@ class SqlaTable(
             .one()
         )
 
+    @classmethod
+    def get_eager_sqlatable_datasources(
+        cls, datasource_ids: set[int]
+    ) -> list[SqlaTable]:
+        """Returns SqlaTables with their columns, metrics, database and owners."""
+        return (
+            db.session.query(cls)
+            .options(
+                sa.orm.subqueryload(cls.columns),
+                sa.orm.subqueryload(cls.metrics),
+                sa.orm.joinedload(cls.database),
+                sa.orm.subqueryload(cls.owners),
+            )
+            .filter(cls.id.in_(datasource_ids))
+            .all()
+        )
+
     @classmethod
     def get_all_datasources(cls) -> list[SqlaTable]:
         qry = db.session.query(cls)
@@ -1937,6 +2064,55 @@ class SqlaTable(
     def default_query(qry: Query) -> Query:
         return qry.filter_by(is_sqllab_view=False)
 
+    def get_extra_cache_expressions(self) -> ExtraCacheExpressions:
+        """
+        Returns which templatable expressions of the dataset itself, as opposed to
+        those of a query, call `ExtraCache` methods. They only change along with the
+        dataset, so they are memoized per dataset version.
+
+        :return: The expressions calling `ExtraCache` methods
+        """
+        version: Hashable = (
+            (
+                self.uid,
+                self.changed_on,
+                self.sql,
+                self.fetch_values_predicate,
+                tuple((column_.id, column_.changed_on) for column_ in self.columns),
+                tuple((metric.id, metric.changed_on) for metric in self.metrics),
+            )
+            if self.id and self.changed_on
+            else None
+        )
+        if version is not None and (
+            expressions := _extra_cache_expressions.get(version)
+        ):
+            return expressions
+
+        expressions = ExtraCacheExpressions(
+            dataset=any(
+                ExtraCache.regex.search(statement)
+                for statement in (self.sql, self.fetch_values_predicate)
+                if statement
+            ),
+            columns=frozenset(
+                col.column_name
+                for col in self.columns
+                if col.expression and ExtraCache.regex.search(col.expression)
+            ),
+            metrics=frozenset(
+                metric.metric_name
+                for metric in self.metrics
+                if metric.expression and ExtraCache.regex.search(metric.expression)
+            ),
+        )
+        if version is not None:
+            with _extra_cache_expressions_lock:
+                if len(_extra_cache_expressions) >= LRU_CACHE_MAX_SIZE:
+                    del _extra_cache_expressions[next(iter(_extra_cache_expressions))]
+                _extra_cache_expressions[version] = expressions
+        return expressions
+
     def has_extra_cache_key_calls(self, query_obj: QueryObjectDict) -> bool:  # noqa: C901
         """
         Detects the presence of calls to `ExtraCache` methods in items in query_obj that
@@ -1948,44 +2124,33 @@ class SqlaTable(
         :param query_obj: query object to analyze
         :return: True if there are call(s) to an `ExtraCache` method, False otherwise
         """
+        expressions = self.get_extra_cache_expressions()
+        if expressions.dataset:
+            return True
+
         templatable_statements: list[str] = []
-        if self.sql:
-            templatable_statements.append(self.sql)
-        if self.fetch_values_predicate:
-            templatable_statements.append(self.fetch_values_predicate)
         extras = query_obj.get("extras", {})
         if "where" in extras:
             templatable_statements.append(extras["where"])
         if "having" in extras:
             templatable_statements.append(extras["having"])
-        if columns := query_obj.get("columns"):
-            calculated_columns: dict[str, Any] = {
-                c.column_name: c.expression for c in self.columns if c.expression
-            }
-            for column_ in columns:
-                if utils.is_adhoc_column(column_):
-                    templatable_statements.append(column_["sqlExpression"])
-                elif isinstance(column_, str) and column_ in calculated_columns:
-                    templatable_statements.append(calculated_columns[column_])
-        if metrics := query_obj.get("metrics"):
-            metrics_by_name: dict[str, Any] = {
-                m.metric_name: m.expression for m in self.metrics
-            }
-            for metric in metrics:
-                if utils.is_adhoc_metric(metric) and (
-                    sql := metric.get("sqlExpression")
-                ):
-                    templatable_statements.append(sql)
-                elif isinstance(metric, str) and metric in metrics_by_name:
-                    templatable_statements.append(metrics_by_name[metric])
+        for column_ in query_obj.get("columns") or []:
+            if utils.is_adhoc_column(column_):
+                templatable_statements.append(column_["sqlExpression"])
+            elif isinstance(column_, str) and column_ in expressions.columns:
+                return True
+        for metric in query_obj.get("metrics") or []:
+            if utils.is_adhoc_metric(metric) and (sql := metric.get("sqlExpression")):
+                templatable_statements.append(sql)
+            elif isinstance(metric, str) and metric in expressions.metrics:
+                return True
         if self.is_rls_supported:
             templatable_statements += [
                 f.clause for f in security_manager.get_rls_filters(self)
             ]
-        for statement in templatable_statements:
-            if ExtraCache.regex.search(statement):
-                return True
-        return False
+        return any(
+            ExtraCache.regex.search(statement) for statement in templatable_statements
+        )
 
     def get_extra_cache_keys(self, query_obj: QueryObjectDict) -> list[Hashable]:
         """
@@ -1997,7 +2162,7 @@ class SqlaTable(
         """
         extra_cache_keys = super().get_extra_cache_keys(query_obj)
         if self.has_extra_cache_key_calls(query_obj):
-            sqla_query = self.get_sqla_query(**query_obj)
+            sqla_query = self.get_memoized_sqla_query(query_obj)
             extra_cache_keys += sqla_query.extra_cache_keys
         return list(set(extra_cache_keys))
 
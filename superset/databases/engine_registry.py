@@ -0,0 +1,264 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Registry of pooled SQLAlchemy engines shared between uses of a database.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine.base import Connection, Engine
+from sqlalchemy.engine.url import URL
+from sqlalchemy.orm.mapper import Mapper
+from sqlalchemy.pool import NullPool
+
+from superset.utils import json
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+    from superset.stats_logger import BaseStatsLogger
+
+logger = logging.getLogger(__name__)
+
+EngineKey = tuple[int | None, str, str, str | None, tuple[str, ...]]
+
+
+@dataclass
+class RegisteredEngine:
+    database_id: int | None
+    engine: Engine
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class EngineRegistry:
+    """
+    Keeps one pooled engine per database and effective connection parameters.
+
+    Engines are keyed by the final URL and engine parameters (after catalog/schema
+    adjustments, user impersonation and the connection mutator), by the effective
+    user and by the pre-session queries run on their connections (e.g. to set the
+    search path to the selected schema), so that two uses of a database share
+    connections only if they would have connected identically. At most
+    `ENGINE_REGISTRY_MAX_ENGINES` engines are kept; the least recently used ones, and
+    those idle for `ENGINE_REGISTRY_IDLE_TIMEOUT` seconds, are disposed of. The
+    engines of a database are also disposed of when the database is updated or
+    deleted.
+
+    Engine parameters that can't be serialized to JSON (e.g. SSL contexts or
+    callables set by the connection mutator) can't be compared, so such engines are
+    created without a pool and aren't registered.
+    """
+
+    def __init__(self) -> None:
+        self._engines: OrderedDict[EngineKey, RegisteredEngine] = OrderedDict()
+        self._lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    @staticmethod
+    def get_key(
+        database_id: int | None,
+        url: URL,
+        engine_kwargs: dict[str, Any],
+        username: str | None,
+        prequeries: Sequence[str] = (),
+    ) -> EngineKey | None:
+        try:
+            serialized_kwargs = json.dumps(engine_kwargs, sort_keys=True)
+        except TypeError:
+            return None
+        return (
+            database_id,
+            url.render_as_string(hide_password=False),
+            serialized_kwargs,
+            username,
+            tuple(prequeries),
+        )
+
+    def get_engine(
+        self,
+        database_id: int | None,
+        url: URL,
+        engine_kwargs: dict[str, Any],
+        username: str | None,
+        prequeries: Sequence[str] = (),
+    ) -> Engine:
+        """
+        Return the pooled engine for the given connection parameters, creating it
+        if needed.
+
+        :param database_id: The ID of the database
+        :param url: The effective URL of the connection
+        :param engine_kwargs: The effective engine parameters
+        :param username: The effective user of the connection
+        :param prequeries: The pre-session queries run on the connections, which
+            change their state
+        :returns: The pooled engine
+        """
+        config = current_app.config
+        stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
+        key = self.get_key(database_id, url, engine_kwargs, username, prequeries)
+        if key is None:
+            stats_logger.incr("engine_registry.skip")
+            return create_engine(url, **{"poolclass": NullPool, **engine_kwargs})
+
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict(now, config["ENGINE_REGISTRY_IDLE_TIMEOUT"], stats_logger)
+            if registered := self._engines.get(key):
+                self._engines.move_to_end(key)
+                registered.last_used = now
+                stats_logger.incr("engine_registry.hit")
+                return registered.engine
+
+            stats_logger.incr("engine_registry.miss")
+            if "poolclass" not in engine_kwargs:
+                engine_kwargs = {
+                    **config["ENGINE_REGISTRY_POOL_PARAMS"],
+                    **engine_kwargs,
+                }
+            engine = create_engine(url, **engine_kwargs)
+            self._instrument(database_id, engine, stats_logger)
+            self._engines[key] = RegisteredEngine(database_id, engine, now)
+
+            while len(self._engines) > config["ENGINE_REGISTRY_MAX_ENGINES"]:
+                _, evicted = self._engines.popitem(last=False)
+                self._dispose(evicted, stats_logger)
+            stats_logger.gauge("engine_registry.engines", len(self._engines))
+
+            return engine
+
+    def invalidate(self, database_id: int | None = None) -> None:
+        """
+        Dispose of the engines of a database, or of all engines.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, registered in self._engines.items()
+                if database_id is None or registered.database_id == database_id
+            ]
+            for key in keys:
+                self._engines.pop(key).engine.dispose()
+
+    def on_database_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Database,
+    ) -> None:
+        """
+        Dispose of the engines of a database when it's updated or deleted.
+        """
+        self.invalidate(target.id)
+
+    def _evict(
+        self,
+        now: float,
+        idle_timeout: int,
+        stats_logger: BaseStatsLogger,
+    ) -> None:
+        # engines are ordered by last use, so the idle ones come first
+        while self._engines:
+            key, registered = next(iter(self._engines.items()))
+            if now - registered.last_used < idle_timeout:
+                break
+            del self._engines[key]
+            self._dispose(registered, stats_logger)
+
+    @staticmethod
+    def _dispose(registered: RegisteredEngine, stats_logger: BaseStatsLogger) -> None:
+        # connections still checked out are closed when they are returned
+        registered.engine.dispose()
+        stats_logger.incr("engine_registry.evict")
+
+    def _get_checked_out(
+        self,
+        database_id: int | None,
+        returning: Engine | None,
+    ) -> int:
+        """
+        Return the number of connections checked out of the registered engines of a
+        database, not counting the connection being returned to the pool of the
+        `returning` engine.
+        """
+        with self._lock:
+            engines = [
+                registered.engine
+                for registered in self._engines.values()
+                if registered.database_id == database_id
+            ]
+        return sum(
+            checkedout() - (1 if engine_ is returning else 0)
+            for engine_ in engines
+            if (checkedout := getattr(engine_.pool, "checkedout", None))
+        )
+
+    def _instrument(
+        self,
+        database_id: int | None,
+        engine: Engine,
+        stats_logger: BaseStatsLogger,
+    ) -> None:
+        """
+        Report the activity of the engine pool through the stats logger.
+        """
+
+        def report_checked_out(returning: bool = False) -> None:
+            stats_logger.gauge(
+                f"engine_pool.{database_id}.checked_out",
+                self._get_checked_out(database_id, engine if returning else None),
+            )
+
+        def on_connect(*args: Any) -> None:
+            stats_logger.incr("engine_pool.connect")
+
+        def on_checkout(*args: Any) -> None:
+            stats_logger.incr("engine_pool.checkout")
+            report_checked_out()
+
+        def on_checkin(*args: Any) -> None:
+            # the event fires before the connection is returned to the pool
+            report_checked_out(returning=True)
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+
+    def _reset_after_fork(self) -> None:
+        """
+        Drop the engines inherited from the parent process, without closing the
+        connections the parent is still using.
+        """
+        self._lock = threading.Lock()
+        for registered in self._engines.values():
+            registered.engine.dispose(close=False)
+        self._engines.clear()
+
+
+engine_registry = EngineRegistry()
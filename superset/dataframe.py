@@ -22,21 +22,11 @@ from typing import Any
 import pandas as pd
 
 from superset.utils.core import JS_MAX_INTEGER
+from superset.utils.sanitization import stringify_large_numbers
 
 logger = logging.getLogger(__name__)
 
 
-def _convert_big_integers(val: Any) -> Any:
-    """
-    Cast integers larger than ``JS_MAX_INTEGER`` to strings.
-
-    :param val: the value to process
-    :returns: the same value but recast as a string if it was an integer over
-        ``JS_MAX_INTEGER``
-    """
-    return str(val) if isinstance(val, int) and abs(val) > JS_MAX_INTEGER else val
-
-
 def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
     """
     Convert a DataFrame to a set of records.
@@ -48,10 +38,11 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         logger.warning(
             "DataFrame columns are not unique, some columns will be omitted."
         )
-    records = dframe.to_dict(orient="records")
-
-    for record in records:
-        for key in record:
-            record[key] = _convert_big_integers(record[key])
+    # cast integers larger than ``JS_MAX_INTEGER`` to strings
+    dframe = dframe.copy(deep=False)
+    for idx in range(len(dframe.columns)):
+        dframe.isetitem(
+            idx, stringify_large_numbers(dframe.iloc[:, idx], JS_MAX_INTEGER)
+        )
 
-    return records
+    return dframe.to_dict(orient="records")
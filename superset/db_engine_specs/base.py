@@ -21,9 +21,11 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from inspect import signature
 from re import Match, Pattern
+from time import monotonic
 from typing import (
     Any,
     Callable,
@@ -38,8 +40,8 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
-import sqlparse
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from deprecation import deprecated
@@ -67,6 +69,7 @@ from superset.exceptions import DisallowedSQLFunction, OAuth2Error, OAuth2Redire
 from superset.sql.parse import BaseSQLStatement, SQLScript, Table
 from superset.sql_parse import ParsedQuery
 from superset.superset_typing import (
+    DbapiDescription,
     OAuth2ClientConfig,
     OAuth2State,
     OAuth2TokenResponse,
@@ -174,6 +177,36 @@ class LimitMethod:  # pylint: disable=too-few-public-methods
     FORCE_LIMIT = "force_limit"
 
 
+class QueryProgressTracker:  # pylint: disable=too-few-public-methods
+    """
+    Commit the progress of a running query to the metadata database at most every
+    `SQLLAB_PROGRESS_UPDATE_INTERVAL` seconds, unless it increased by at least
+    `SQLLAB_PROGRESS_UPDATE_MIN_DELTA` percent since the last committed progress.
+    """
+
+    def __init__(self) -> None:
+        self.interval = current_app.config["SQLLAB_PROGRESS_UPDATE_INTERVAL"]
+        self.min_delta = current_app.config["SQLLAB_PROGRESS_UPDATE_MIN_DELTA"]
+        self.committed_at: float | None = None
+
+    def update(self, query: Query, progress: float) -> None:
+        committed_progress = query.progress or 0
+        if progress <= committed_progress:
+            return
+
+        now = monotonic()
+        if (
+            self.committed_at is not None
+            and now - self.committed_at < self.interval
+            and not (self.min_delta and progress - committed_progress >= self.min_delta)
+        ):
+            return
+
+        query.progress = progress
+        db.session.commit()  # pylint: disable=consider-using-transaction
+        self.committed_at = now
+
+
 class MetricType(TypedDict, total=False):
     """
     Type for metrics return by `get_metrics`.
@@ -395,6 +428,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     force_column_alias_quotes = False
     arraysize = 0
+    # Number of rows fetched at a time by `fetch_data_batches` when `arraysize` is
+    # not set
+    fetch_batch_size = 10000
     max_column_name_length: int | None = None
     try_remove_schema_from_table_name = True  # pylint: disable=invalid-name
     run_multiple_statements_as_one = False
@@ -963,6 +999,29 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             )
         )
 
+    @classmethod
+    def get_column_mutators(
+        cls,
+        description: DbapiDescription,
+    ) -> dict[int, Callable[[Any], Any]]:
+        """
+        Map the index of the columns of a cursor description to the function, if
+        any, used to normalize their values, see `column_type_mutators`.
+
+        :param description: Cursor description
+        :return: The mutator of each column that has one, by column index
+        """
+        # The first two items in the description row are the column name and type.
+        return {
+            idx: func
+            for idx, row in enumerate(description or [])
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+                )
+            )
+        }
+
     @classmethod
     def fetch_data(cls, cursor: Any, limit: int | None = None) -> list[tuple[Any, ...]]:
         """
@@ -977,25 +1036,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
+            if column_mutators := cls.get_column_mutators(cursor.description):
                 for row_idx, row in enumerate(data):
                     new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
+                    for col_idx, func in column_mutators.items():
                         new_row[col_idx] = func(row[col_idx])
                     data[row_idx] = tuple(new_row)
 
@@ -1003,6 +1047,73 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> Iterator[list[list[Any]]]:
+        """
+        Fetch the result of a query in batches of `arraysize` rows, each batch being
+        transposed into a list of column values.
+
+        Column type mutators are applied column-wise. Engine specs customizing
+        `fetch_data` get their whole result as a single batch, so that their
+        customizations still apply.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: An iterator of batches, each a list of column values
+        """
+        if any(
+            "fetch_data" in vars(klass)
+            for klass in cls.__mro__[: cls.__mro__.index(BaseEngineSpec)]
+        ):
+            if rows := cls.fetch_data(cursor, limit):
+                yield [list(column) for column in zip(*rows, strict=True)]
+            return
+
+        batch_size = cls.arraysize or cls.fetch_batch_size
+        cursor.arraysize = batch_size
+        try:
+            column_mutators = cls.get_column_mutators(cursor.description)
+            remaining = limit
+            while remaining is None or remaining > 0:
+                rows = cursor.fetchmany(
+                    batch_size if remaining is None else min(batch_size, remaining)
+                )
+                if not rows:
+                    break
+                if remaining is not None:
+                    remaining -= len(rows)
+
+                columns = [list(column) for column in zip(*rows, strict=True)]
+                for col_idx, func in column_mutators.items():
+                    columns[col_idx] = [func(value) for value in columns[col_idx]]
+                yield columns
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def fetch_arrow_table(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | None:
+        """
+        Fetch the result of a query natively as an Arrow table, skipping the
+        conversion of rows to Python objects.
+
+        Engine specs whose driver supports fetching Arrow data should override this
+        method; by default `None` is returned and the result is fetched with
+        `fetch_data_batches` instead.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: The result of the query, or `None` if not supported
+        """
+        return None
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1246,7 +1357,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
         """
         if not cls.allows_cte_in_subquery:
-            stmt = sqlparse.parse(sql)[0]
+            stmt = sql_parse.parse_statements(sql)[0]
 
             # The first meaningful token for CTE will be with WITH
             idx, token = stmt.token_next(-1, skip_ws=True, skip_cm=True)
@@ -1302,6 +1413,71 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
                 to_sql_kwargs["method"] = "multi"
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def dfs_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from chunks of Pandas DataFrames to a database.
+
+        The chunks are inserted one at a time in a single transaction, the table being
+        created from the first chunk. Engines overriding `df_to_sql` receive the
+        concatenated chunks instead.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param dfs: The dataframes with the data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        if cls.df_to_sql.__func__ is not BaseEngineSpec.df_to_sql.__func__:  # type: ignore
+            dfs = list(dfs)
+            df = dfs[0] if len(dfs) == 1 else pd.concat(dfs)
+            cls.df_to_sql(database, table, df, to_sql_kwargs)
+            return
+
+        to_sql_kwargs["name"] = table.table
+
+        if table.schema:
+            # Only add schema when it is preset and non-empty.
+            to_sql_kwargs["schema"] = table.schema
+
+        with cls.get_engine(
+            database,
+            catalog=table.catalog,
+            schema=table.schema,
+        ) as engine:
+            if method := cls.get_to_sql_method(engine):
+                to_sql_kwargs["method"] = method
+            with engine.begin() as connection:
+                for df in dfs:
+                    df.to_sql(con=connection, **to_sql_kwargs)
+                    to_sql_kwargs["if_exists"] = "append"
+
+    @classmethod
+    def get_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        """
+        Return the `method` used by `pandas.DataFrame.to_sql` to insert the chunks of
+        uploaded data in `dfs_to_sql`.
+
+        Multi-values inserts are used when supported. Engines can override this to use
+        a bulk-load fast path instead.
+
+        :param engine: The engine the data is uploaded with
+        :return: The insertion method, or None for `executemany` inserts
+        """
+        if (
+            engine.dialect.supports_multivalues_insert
+            or cls.supports_multivalues_insert
+        ):
+            return "multi"
+        return None
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -2203,7 +2379,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     @classmethod
     def parse_sql(cls, sql: str) -> list[str]:
-        return [str(s).strip(" ;") for s in sqlparse.parse(sql)]
+        return [str(s).strip(" ;") for s in sql_parse.parse_statements(sql)]
 
     @classmethod
     def get_impersonation_key(cls, user: User | None) -> Any:
@@ -22,6 +22,7 @@ from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -237,6 +238,30 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
     ) -> set[str]:
         return set(inspector.get_table_names(schema))
 
+    @classmethod
+    def fetch_arrow_table(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | None:
+        """
+        Fetch the result as Arrow record batches, which DuckDB produces natively.
+        """
+        if not hasattr(cursor, "fetch_record_batch"):
+            return None
+
+        reader = cursor.fetch_record_batch(cls.arraysize or cls.fetch_batch_size)
+        batches: list[pa.RecordBatch] = []
+        num_rows = 0
+        for batch in reader:
+            if limit is not None and num_rows + batch.num_rows >= limit:
+                batches.append(batch.slice(0, limit - num_rows))
+                break
+            batches.append(batch)
+            num_rows += batch.num_rows
+
+        return pa.Table.from_batches(batches, schema=reader.schema)
+
     @staticmethod
     def get_extra_params(
         database: Database, source: QuerySource | None = None
@@ -39,7 +39,7 @@ from sqlalchemy.sql.expression import ColumnClause, Select
 from superset import db
 from superset.common.db_query_status import QueryStatus
 from superset.constants import TimeGrain
-from superset.db_engine_specs.base import BaseEngineSpec
+from superset.db_engine_specs.base import BaseEngineSpec, QueryProgressTracker
 from superset.db_engine_specs.presto import PrestoEngineSpec
 from superset.exceptions import SupersetException
 from superset.extensions import cache_manager
@@ -352,6 +352,7 @@ class HiveEngineSpec(PrestoEngineSpec):
         tracking_url = None
         job_id = None
         query_id = query.id
+        progress_tracker = QueryProgressTracker()
         while polled.operationState in unfinished_states:
             # Queries don't terminate when user clicks the STOP button on SQL LAB.
             # Refresh session so that the `query.status` modified in stop_query in
@@ -376,9 +377,7 @@ class HiveEngineSpec(PrestoEngineSpec):
                     "Query %s: Progress total: %s", str(query_id), str(progress)
                 )
                 needs_commit = False
-                if progress > query.progress:
-                    query.progress = progress
-                    needs_commit = True
+                progress_tracker.update(query, progress)
                 if not tracking_url:
                     tracking_url = cls.get_tracking_url_from_logs(log_lines)
                     if tracking_url:
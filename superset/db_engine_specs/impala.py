@@ -30,7 +30,7 @@ from sqlalchemy.engine.reflection import Inspector
 
 from superset import db
 from superset.constants import QUERY_EARLY_CANCEL_KEY, TimeGrain
-from superset.db_engine_specs.base import BaseEngineSpec
+from superset.db_engine_specs.base import BaseEngineSpec, QueryProgressTracker
 from superset.models.sql_lab import Query
 
 if TYPE_CHECKING:
@@ -118,6 +118,7 @@ class ImpalaEngineSpec(BaseEngineSpec):
             "INITIALIZED_STATE",
             "RUNNING_STATE",
         )
+        progress_tracker = QueryProgressTracker()
 
         try:
             status = cursor.status()
@@ -148,13 +149,7 @@ class ImpalaEngineSpec(BaseEngineSpec):
                     logger.debug(
                         "Query %s: Progress total: %s", str(query_id), str(progress)
                     )
-                    needs_commit = False
-                    if progress > query.progress:
-                        query.progress = progress
-                        needs_commit = True
-
-                    if needs_commit:
-                        db.session.commit()  # pylint: disable=consider-using-transaction
+                    progress_tracker.update(query, progress)
                 sleep_interval = current_app.config["DB_POLL_INTERVAL_SECONDS"].get(
                     cls.engine, 5
                 )
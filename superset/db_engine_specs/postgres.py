@@ -19,13 +19,16 @@ from __future__ import annotations
 
 import logging
 import re
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from io import StringIO
 from re import Pattern
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -94,6 +97,47 @@ def parse_options(connect_args: dict[str, Any]) -> dict[str, str]:
     return {token[0]: token[1] for token in tokens}
 
 
+def _format_copy_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # hex format of ``bytea``
+        value = "\\x" + bytes(value).hex()
+    elif isinstance(value, timedelta):
+        value = f"{value.total_seconds()} seconds"
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def copy_from_csv(
+    table: Any,
+    conn: Connection,
+    keys: list[str],
+    data_iter: Iterable[tuple[Any, ...]],
+) -> int:
+    """
+    Insert the rows of a chunk of a dataframe with ``COPY``.
+
+    Used as the ``method`` of ``pandas.DataFrame.to_sql``. Values are quoted and
+    NULLs written as unquoted empty fields, so that empty strings are not loaded as
+    NULL and NULLs are not loaded as empty strings.
+    """
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    buffer = StringIO()
+    for row in data_iter:
+        buffer.write(",".join(_format_copy_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {preparer.format_table(table.table)} ({columns}) "  # noqa: S608
+            "FROM STDIN WITH CSV",
+            buffer,
+        )
+        return cursor.rowcount
+
+
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
 
@@ -461,6 +505,14 @@ WHERE datistemplate = false;
         row = cursor.fetchone()
         return row[0]
 
+    @classmethod
+    def get_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        # ``COPY`` from a file-like object is only available with psycopg2, and the
+        # support of ``COPY`` varies across Postgres compatible databases
+        if cls.engine == "postgresql" and engine.dialect.driver == "psycopg2":
+            return copy_from_csv
+        return super().get_to_sql_method(engine)
+
     @classmethod
     def cancel_query(cls, cursor: Any, query: Query, cancel_query_id: str) -> bool:
         """
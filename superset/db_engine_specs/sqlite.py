@@ -20,10 +20,11 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from re import Pattern
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask_babel import gettext as __
 from sqlalchemy import types
+from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.reflection import Inspector
 
 from superset.constants import TimeGrain
@@ -112,6 +113,11 @@ class SqliteEngineSpec(BaseEngineSpec):
     def epoch_to_dttm(cls) -> str:
         return "datetime({col}, 'unixepoch')"
 
+    @classmethod
+    def get_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        # `executemany` inserts are faster than multi-values inserts with SQLite
+        return None
+
     @classmethod
     def convert_dttm(
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
@@ -15,12 +15,16 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Optional
-from uuid import UUID, uuid3
+from time import monotonic
+from typing import Any, NamedTuple, Optional
+from uuid import UUID, uuid3, uuid4
 
 from flask import current_app, Flask, has_app_context
 from flask_caching import BaseCache
+from flask_caching.backends import NullCache
 from sqlalchemy.exc import SQLAlchemyError
 
 from superset import db
@@ -38,16 +42,46 @@ RESOURCE = KeyValueResource.METASTORE_CACHE
 logger = logging.getLogger(__name__)
 
 
-class SupersetMetastoreCache(BaseCache):
-    def __init__(
+class LocalEntry(NamedTuple):
+    value: bytes
+    expires_on: Optional[datetime]
+    version: str
+    cached_at: float
+
+
+class SupersetMetastoreCache(BaseCache):  # pylint: disable=too-many-instance-attributes
+    """
+    A cache that stores its values in the key-value table of the metastore.
+
+    Values can also be kept in a per-process LRU cache (`local_cache_size` entries for
+    up to `local_cache_timeout` seconds). Entries of the local cache are only used
+    while their version matches the version of the key in the shared Superset cache
+    (`CACHE_CONFIG`), which is changed on each write, so that reads remain consistent
+    across processes. While the local cache is enabled, setting an unchanged value
+    only persists the refreshed timeout once every `refresh_interval` seconds.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         namespace: UUID,
         codec: KeyValueCodec,
         default_timeout: int = 300,
+        local_cache_size: int = 0,
+        local_cache_timeout: int = 60,
+        refresh_interval: int = 0,
+        prune_on_add: bool = True,
+        version_cache: Optional[BaseCache] = None,
     ) -> None:
         super().__init__(default_timeout)
         self.namespace = namespace
         self.codec = codec
+        self.local_cache_size = local_cache_size
+        self.local_cache_timeout = local_cache_timeout
+        self.refresh_interval = refresh_interval
+        self.prune_on_add = prune_on_add
+        self._version_cache = version_cache
+        self._local_cache: OrderedDict[str, LocalEntry] = OrderedDict()
+        self._lock = threading.Lock()
 
     @classmethod
     def factory(
@@ -66,6 +100,10 @@ class SupersetMetastoreCache(BaseCache):
                 "use at your own risk."
             )
         kwargs["codec"] = codec
+        kwargs["local_cache_size"] = config.get("LOCAL_CACHE_SIZE", 0)
+        kwargs["local_cache_timeout"] = config.get("LOCAL_CACHE_TIMEOUT", 60)
+        kwargs["refresh_interval"] = config.get("REFRESH_INTERVAL", 0)
+        kwargs["prune_on_add"] = config.get("PRUNE_EXPIRED_ON_ADD", True)
         return cls(*args, **kwargs)
 
     def get_key(self, key: str) -> UUID:
@@ -77,44 +115,186 @@ class SupersetMetastoreCache(BaseCache):
             return datetime.now() + timedelta(seconds=timeout)
         return None
 
+    @property
+    def version_cache(self) -> Optional[BaseCache]:
+        """
+        The shared cache holding the versions of the keys, or None when the local
+        cache is disabled or there is no shared cache to keep it consistent.
+        """
+        if self.local_cache_size <= 0:
+            return None
+
+        if self._version_cache is None:
+            # pylint: disable=import-outside-toplevel
+            from superset.extensions import cache_manager
+
+            shared_cache = cache_manager.cache.cache
+            if isinstance(shared_cache, NullCache):
+                logger.warning(
+                    "The local cache of SupersetMetastoreCache requires CACHE_CONFIG "
+                    "to be configured, and is disabled"
+                )
+                self.local_cache_size = 0
+                return None
+            self._version_cache = shared_cache
+
+        return self._version_cache
+
+    def _get_version_key(self, key: str) -> str:
+        return f"metastore_cache_version_{self.get_key(key)}"
+
+    def _get_version(self, version_cache: BaseCache, key: str) -> str:
+        version_key = self._get_version_key(key)
+        if version := version_cache.get(version_key):
+            return version
+
+        # versions can be evicted from the shared cache, so a new version is set
+        # rather than using a missing version, which another write could also miss
+        version = uuid4().hex
+        if not version_cache.add(version_key, version, self.local_cache_timeout):
+            version = version_cache.get(version_key) or version
+        return version
+
+    def _get_local_entry(self, key: str, version: str) -> Optional[LocalEntry]:
+        with self._lock:
+            entry = self._local_cache.get(key)
+            if entry is None:
+                return None
+
+            if (
+                entry.version != version
+                or monotonic() - entry.cached_at > self.local_cache_timeout
+            ):
+                del self._local_cache[key]
+                return None
+
+            self._local_cache.move_to_end(key)
+            return entry
+
+    def _set_local_entry(
+        self,
+        key: str,
+        value: bytes,
+        expires_on: Optional[datetime],
+        version: str,
+    ) -> None:
+        with self._lock:
+            self._local_cache[key] = LocalEntry(value, expires_on, version, monotonic())
+            self._local_cache.move_to_end(key)
+            while len(self._local_cache) > self.local_cache_size:
+                self._local_cache.popitem(last=False)
+
+    def _invalidate(
+        self,
+        key: str,
+        value: Optional[bytes] = None,
+        expires_on: Optional[datetime] = None,
+    ) -> None:
+        """Change the version of a key once its new value has been committed"""
+        if not (version_cache := self.version_cache):
+            return
+
+        version = uuid4().hex
+        version_cache.set(self._get_version_key(key), version, self.local_cache_timeout)
+        if value is None:
+            with self._lock:
+                self._local_cache.pop(key, None)
+        else:
+            self._set_local_entry(key, value, expires_on, version)
+
+    def _is_timeout_refresh(
+        self,
+        key: str,
+        value: bytes,
+        expires_on: Optional[datetime],
+    ) -> bool:
+        """
+        Whether setting a value only refreshes the timeout of the stored value by less
+        than `refresh_interval` seconds, in which case the write can be skipped.
+        """
+        if not (version_cache := self.version_cache) or self.refresh_interval <= 0:
+            return False
+
+        entry = self._get_local_entry(key, self._get_version(version_cache, key))
+        return (
+            entry is not None
+            and entry.value == value
+            and entry.expires_on is not None
+            and expires_on is not None
+            and expires_on - entry.expires_on < timedelta(seconds=self.refresh_interval)
+        )
+
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
+        expires_on = self._get_expiry(timeout)
+        encoded_value = self.codec.encode(value) if self.version_cache else None
+        if encoded_value is not None and self._is_timeout_refresh(
+            key, encoded_value, expires_on
+        ):
+            return True
+
         KeyValueDAO.upsert_entry(
             resource=RESOURCE,
             key=self.get_key(key),
             value=value,
             codec=self.codec,
-            expires_on=self._get_expiry(timeout),
+            expires_on=expires_on,
         )
         db.session.commit()  # pylint: disable=consider-using-transaction
+        self._invalidate(key, encoded_value, expires_on)
         return True
 
     def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
+        expires_on = self._get_expiry(timeout)
         try:
-            KeyValueDAO.delete_expired_entries(RESOURCE)
-            KeyValueDAO.create_entry(
+            if self.prune_on_add:
+                KeyValueDAO.delete_expired_entries(RESOURCE)
+            elif (
+                entry := KeyValueDAO.get_entry(RESOURCE, self.get_key(key))
+            ) and entry.is_expired():
+                # other expired entries are deleted by the `prune_metastore_cache`
+                # task, but an expired entry with the same key has to go first
+                db.session.delete(entry)
+                db.session.flush()
+            encoded_value = KeyValueDAO.create_entry(
                 resource=RESOURCE,
                 value=value,
                 codec=self.codec,
                 key=self.get_key(key),
-                expires_on=self._get_expiry(timeout),
-            )
+                expires_on=expires_on,
+            ).value
             db.session.commit()  # pylint: disable=consider-using-transaction
-            return True
         except (SQLAlchemyError, KeyValueCreateFailedError):
             db.session.rollback()  # pylint: disable=consider-using-transaction
             return False
 
+        self._invalidate(key, encoded_value, expires_on)
+        return True
+
     def get(self, key: str) -> Any:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
-        return KeyValueDAO.get_value(RESOURCE, self.get_key(key), self.codec)
+        if not (version_cache := self.version_cache):
+            return KeyValueDAO.get_value(RESOURCE, self.get_key(key), self.codec)
+
+        version = self._get_version(version_cache, key)
+        if local_entry := self._get_local_entry(key, version):
+            if local_entry.expires_on and local_entry.expires_on <= datetime.now():
+                return None
+            return self.codec.decode(local_entry.value)
+
+        entry = KeyValueDAO.get_entry(RESOURCE, self.get_key(key))
+        if not entry or entry.is_expired():
+            return None
+
+        self._set_local_entry(key, entry.value, entry.expires_on, version)
+        return self.codec.decode(entry.value)
 
     def has(self, key: str) -> bool:
         entry = self.get(key)
@@ -122,8 +302,13 @@ class SupersetMetastoreCache(BaseCache):
             return True
         return False
 
-    @transaction()
     def delete(self, key: str) -> Any:
+        deleted = self._delete(key)
+        self._invalidate(key)
+        return deleted
+
+    @transaction()
+    def _delete(self, key: str) -> Any:
         # pylint: disable=import-outside-toplevel
         from superset.daos.key_value import KeyValueDAO
 
@@ -56,7 +56,7 @@ from superset.extensions import (
     talisman,
 )
 from superset.security import SupersetSecurityManager
-from superset.sql.parse import SQLGLOT_DIALECTS
+from superset.sql.parse import parse_cache, SQLGLOT_DIALECTS
 from superset.superset_typing import FlaskResponse
 from superset.tags.core import register_sqla_event_listeners
 from superset.utils.core import is_test, pessimistic_connection_handling
@@ -566,6 +566,9 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
 
         SQLGLOT_DIALECTS.update(extensions)
 
+        parse_cache.maxsize = self.config["SQL_PARSE_CACHE_SIZE"]
+        parse_cache.clear()
+
     @transaction()
     def configure_fab(self) -> None:
         if self.config["SILENCE_FAB"]:
@@ -583,6 +586,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         appbuilder.base_template = "superset/base.html"
         appbuilder.security_manager_class = custom_sm
         appbuilder.init_app(self.superset_app, db.session)
+        appbuilder.sm.register_security_cache_listeners()
 
     def configure_url_map_converters(self) -> None:
         #
@@ -22,13 +22,24 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache, partial
-from typing import Any, Callable, cast, Optional, TYPE_CHECKING, TypedDict, Union
+from types import CodeType
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Iterable,
+    Optional,
+    TYPE_CHECKING,
+    TypedDict,
+    Union,
+)
 
 import dateutil
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined, Environment
+from jinja2 import DebugUndefined, Environment, meta, Template
 from jinja2.sandbox import SandboxedEnvironment
+from jinja2.utils import LRUCache
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.expression import bindparam
 from sqlalchemy.types import String
@@ -73,6 +84,11 @@ ALLOWED_TYPES = (
 )
 COLLECTION_TYPES = ("list", "dict", "tuple", "set")
 
+# Compiled templates and the names they reference, keyed by processor class, engine
+# and template source. Compiling is much slower than rendering, and the SQL of a
+# virtual dataset is rendered for every chart built on it.
+compiled_templates = LRUCache(LRU_CACHE_MAX_SIZE)
+
 
 @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
 def context_addons() -> dict[str, Any]:
@@ -499,6 +515,13 @@ def safe_proxy(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
     return return_value
 
 
+def lazy_proxy(func: Callable[..., Any]) -> Callable[[], Any]:
+    """
+    Return a factory of the ``safe_proxy`` wrapper of a macro, to bind it lazily.
+    """
+    return partial(partial, safe_proxy, func)
+
+
 def validate_context_types(context: dict[str, Any]) -> dict[str, Any]:
     for key in context:
         arg_type = type(context[key]).__name__
@@ -629,7 +652,9 @@ class BaseTemplateProcessor:
         self._extra_cache_keys = extra_cache_keys
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
-        self._context: dict[str, Any] = {}
+        self._bound_context: dict[str, Any] = {}
+        # context values which are only built when a template references them
+        self._lazy_context: dict[str, Callable[[], Any]] = {}
         self.env: Environment = SandboxedEnvironment(undefined=DebugUndefined)
         self.set_context(**kwargs)
 
@@ -637,9 +662,59 @@ class BaseTemplateProcessor:
         self.env.filters["where_in"] = WhereInMacro(database.get_dialect())
         self.env.filters["to_datetime"] = to_datetime
 
+    @property
+    def _context(self) -> dict[str, Any]:
+        """
+        The template context, with all the lazy context values bound.
+        """
+        self._bind_context(list(self._lazy_context))
+        return self._bound_context
+
+    def _bind_context(self, names: Iterable[str]) -> None:
+        for name in names:
+            if factory := self._lazy_context.pop(name, None):
+                self._bound_context[name] = factory()
+
     def set_context(self, **kwargs: Any) -> None:
-        self._context.update(kwargs)
-        self._context.update(context_addons())
+        self._bound_context.update(kwargs)
+        self._bound_context.update(context_addons())
+
+    def get_template(self, sql: str) -> tuple[Template, frozenset[str]]:
+        """
+        Return the template of the SQL, and the context names it references.
+
+        Compiled templates are cached across processors, and bound to the environment
+        of this processor.
+        """
+        key = (type(self), self.engine, sql)
+        compiled: tuple[CodeType, frozenset[str]] | None = compiled_templates.get(key)
+        if compiled is None:
+            source = self.env.parse(sql)
+            compiled = (
+                self.env.compile(source),
+                frozenset(meta.find_undeclared_variables(source)),
+            )
+            compiled_templates[key] = compiled
+
+        code, names = compiled
+        template = self.env.template_class.from_code(
+            self.env,
+            code,
+            self.env.make_globals(None),
+        )
+        return template, names
+
+    def get_template_context(
+        self,
+        names: Iterable[str],
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Return the validated context to render a template referencing the names.
+        """
+        self._bind_context(names)
+        kwargs.update(self._bound_context)
+        return validate_template_context(self.engine, kwargs)
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
@@ -648,10 +723,8 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
-        template = self.env.from_string(sql)
-        kwargs.update(self._context)
-
-        context = validate_template_context(self.engine, kwargs)
+        template, names = self.get_template(sql)
+        context = self.get_template_context(names, **kwargs)
         try:
             return template.render(context)
         except RecursionError as ex:
@@ -687,12 +760,12 @@ class JinjaTemplateProcessor(BaseTemplateProcessor):
 
         from_dttm = (
             self._parse_datetime(dttm)
-            if (dttm := self._context.get("from_dttm"))
+            if (dttm := self._bound_context.get("from_dttm"))
             else None
         )
         to_dttm = (
             self._parse_datetime(dttm)
-            if (dttm := self._context.get("to_dttm"))
+            if (dttm := self._bound_context.get("to_dttm"))
             else None
         )
 
@@ -702,33 +775,29 @@ class JinjaTemplateProcessor(BaseTemplateProcessor):
             to_dttm=to_dttm,
         )
 
-        self._context.update(
+        self._lazy_context.update(
             {
-                "url_param": partial(safe_proxy, extra_cache.url_param),
-                "current_user_id": partial(safe_proxy, extra_cache.current_user_id),
-                "current_username": partial(safe_proxy, extra_cache.current_username),
-                "current_user_email": partial(
-                    safe_proxy, extra_cache.current_user_email
-                ),
-                "current_user_roles": partial(
-                    safe_proxy, extra_cache.current_user_roles
+                "url_param": lazy_proxy(extra_cache.url_param),
+                "current_user_id": lazy_proxy(extra_cache.current_user_id),
+                "current_username": lazy_proxy(extra_cache.current_username),
+                "current_user_email": lazy_proxy(extra_cache.current_user_email),
+                "current_user_roles": lazy_proxy(extra_cache.current_user_roles),
+                "cache_key_wrapper": lazy_proxy(extra_cache.cache_key_wrapper),
+                "filter_values": lazy_proxy(extra_cache.filter_values),
+                "get_filters": lazy_proxy(extra_cache.get_filters),
+                "dataset": lazy_proxy(dataset_macro_with_context),
+                "get_time_filter": lazy_proxy(extra_cache.get_time_filter),
+                # The `metric` filter needs the full context, in order to expand other
+                # filters
+                "metric": lambda: partial(
+                    safe_proxy,
+                    metric_macro,
+                    self.env,
+                    self._context,
                 ),
-                "cache_key_wrapper": partial(safe_proxy, extra_cache.cache_key_wrapper),
-                "filter_values": partial(safe_proxy, extra_cache.filter_values),
-                "get_filters": partial(safe_proxy, extra_cache.get_filters),
-                "dataset": partial(safe_proxy, dataset_macro_with_context),
-                "get_time_filter": partial(safe_proxy, extra_cache.get_time_filter),
             }
         )
 
-        # The `metric` filter needs the full context, in order to expand other filters
-        self._context["metric"] = partial(
-            safe_proxy,
-            metric_macro,
-            self.env,
-            self._context,
-        )
-
 
 class NoOpTemplateProcessor(BaseTemplateProcessor):
     def process_template(self, sql: str, **kwargs: Any) -> str:
@@ -749,7 +818,7 @@ class PrestoTemplateProcessor(JinjaTemplateProcessor):
 
     def set_context(self, **kwargs: Any) -> None:
         super().set_context(**kwargs)
-        self._context[self.engine] = {
+        self._lazy_context[cast(str, self.engine)] = lambda: {
             "first_latest_partition": partial(safe_proxy, self.first_latest_partition),
             "latest_partitions": partial(safe_proxy, self.latest_partitions),
             "latest_sub_partition": partial(safe_proxy, self.latest_sub_partition),
@@ -815,11 +884,10 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
-        kwargs.update(self._context)
+        template, names = self.get_template(sql)
 
         # Backwards compatibility if migrating from Hive.
-        context = validate_template_context(self.engine, kwargs)
+        context = self.get_template_context(names | {"spark"}, **kwargs)
         context["hive"] = context["spark"]
         return template.render(context)
 
@@ -828,11 +896,10 @@ class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self.env.from_string(sql)
-        kwargs.update(self._context)
+        template, names = self.get_template(sql)
 
         # Backwards compatibility if migrating from Presto.
-        context = validate_template_context(self.engine, kwargs)
+        context = self.get_template_context(names | {"trino"}, **kwargs)
         context["presto"] = context["trino"]
         return template.render(context)
 
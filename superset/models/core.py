@@ -64,6 +64,7 @@ from sqlalchemy.sql import ColumnElement, expression, Select
 from superset import app, db, db_engine_specs, is_feature_enabled
 from superset.commands.database.exceptions import DatabaseInvalidError
 from superset.constants import LRU_CACHE_MAX_SIZE, PASSWORD_MASK
+from superset.databases.engine_registry import engine_registry
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
@@ -463,6 +464,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                         nullpool=nullpool,
                         source=source,
                         sqlalchemy_uri=sqlalchemy_uri,
+                        # engines connecting through a tunnel can't outlive it
+                        pooled=config["ENGINE_REGISTRY_ENABLED"] and not ssh_tunnel,
                     )
 
     def _get_sqla_engine(  # pylint: disable=too-many-locals  # noqa: C901
@@ -472,7 +475,15 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        pooled: bool = False,
     ) -> Engine:
+        """
+        Build the SQLAlchemy engine of the database.
+
+        When `pooled` is set the engine is taken from the engine registry, which
+        keeps a pooled engine per set of effective connection parameters, and
+        `nullpool` is ignored.
+        """
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
         )
@@ -480,7 +491,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+        if nullpool and not pooled:
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -534,6 +545,19 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 source,
             )
         try:
+            if pooled:
+                # connections of the pool keep the session state set by prequeries
+                return engine_registry.get_engine(
+                    self.id,
+                    sqlalchemy_url,
+                    engine_kwargs,
+                    effective_username if self.impersonate_user else None,
+                    self.db_engine_spec.get_prequeries(
+                        database=self,
+                        catalog=catalog,
+                        schema=schema,
+                    ),
+                )
             return create_engine(sqlalchemy_url, **engine_kwargs)
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
@@ -687,8 +711,10 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 ):
                     self.db_engine_spec.execute(cursor, sql_, self)
 
-                rows = self.fetch_rows(cursor, i == len(sqls) - 1)
-                if rows is not None:
+                last = i == len(sqls) - 1
+                if last and config["FETCH_RESULTS_IN_BATCHES"]:
+                    df = self.fetch_dataframe(cursor)
+                elif (rows := self.fetch_rows(cursor, last)) is not None:
                     df = self.load_into_dataframe(cursor.description, rows)
 
             if mutator:
@@ -717,6 +743,15 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         )
         return result_set.to_pandas_df()
 
+    @event_logger.log_this
+    def fetch_dataframe(self, cursor: Any) -> pd.DataFrame:
+        """
+        Fetch the result of a query in batches directly into a dataframe, see
+        `SupersetResultSet.from_cursor`.
+        """
+        result_set = SupersetResultSet.from_cursor(cursor, self.db_engine_spec)
+        return result_set.to_pandas_df()
+
     def compile_sqla_query(
         self,
         qry: Select,
@@ -1165,6 +1200,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+sqla.event.listen(Database, "after_update", engine_registry.on_database_change)
+sqla.event.listen(Database, "after_delete", engine_registry.on_database_change)
 
 
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
@@ -274,16 +274,31 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
         for slc in self.slices:
             slices_by_datasource[(slc.cls_model, slc.datasource_id)].add(slc)
 
-        result: list[dict[str, Any]] = []
-
-        for (cls_model, datasource_id), slices in slices_by_datasource.items():
-            datasource = (
-                db.session.query(cls_model).filter_by(id=datasource_id).one_or_none()
+        datasource_ids_by_model: dict[type[BaseDatasource], set[int]] = defaultdict(set)
+        for cls_model, datasource_id in slices_by_datasource:
+            datasource_ids_by_model[cls_model].add(datasource_id)
+
+        # Load the datasources of each type, and their columns and metrics, in bulk
+        datasources: dict[tuple[type[BaseDatasource], int], BaseDatasource] = {}
+        for cls_model, datasource_ids in datasource_ids_by_model.items():
+            if issubclass(cls_model, SqlaTable):
+                models = cls_model.get_eager_sqlatable_datasources(datasource_ids)
+            else:
+                models = (
+                    db.session.query(cls_model)
+                    .filter(cls_model.id.in_(datasource_ids))
+                    .all()
+                )
+            datasources.update(
+                {(cls_model, datasource.id): datasource for datasource in models}
             )
 
-            if datasource:
+        result: list[dict[str, Any]] = []
+
+        for key, slices in slices_by_datasource.items():
+            if datasource := datasources.get(key):
                 # Filter out unneeded fields from the datasource payload
-                result.append(datasource.data_for_slices(slices))
+                result.append(datasource.data_for_slices(list(slices)))
 
         return result
 
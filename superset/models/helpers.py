@@ -34,7 +34,7 @@ import pytz
 import sqlalchemy as sa
 import sqlparse
 import yaml
-from flask import g
+from flask import g, has_app_context
 from flask_appbuilder import Model
 from flask_appbuilder.models.decorators import renders
 from flask_appbuilder.models.mixins import AuditMixin
@@ -51,7 +51,7 @@ from sqlalchemy.sql.expression import Label, Select, TextAsFrom
 from sqlalchemy.sql.selectable import Alias, TableClause
 from sqlalchemy_utils import UUIDType
 
-from superset import app, db, is_feature_enabled
+from superset import app, db, is_feature_enabled, security_manager
 from superset.advanced_data_type.types import AdvancedDataTypeResponse
 from superset.common.db_query_status import QueryStatus
 from superset.common.utils.time_range_utils import get_since_until_from_time_range
@@ -96,7 +96,11 @@ from superset.utils.core import (
 from superset.utils.dates import datetime_to_epoch
 
 if TYPE_CHECKING:
-    from superset.connectors.sqla.models import SqlMetric, TableColumn
+    from superset.connectors.sqla.models import (
+        BaseDatasource,
+        SqlMetric,
+        TableColumn,
+    )
     from superset.db_engine_specs import BaseEngineSpec
     from superset.models.core import Database
 
@@ -879,12 +883,48 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             sql = f"{cte}\n{sql}"
         return sql
 
+    def get_memoized_sqla_query(self, query_obj: QueryObjectDict) -> SqlaQuery:
+        """
+        Build the SQLAlchemy query of a query object, memoized for the duration of the
+        request (more precisely of the app context).
+
+        When the dataset calls `ExtraCache` methods the query is already built, and
+        its templates rendered, to compute the cache key of the query object; the
+        execution of the query on a cache miss then reuses the same build.
+
+        The memo is keyed by user, as the query depends on the RLS filters and user
+        macros of the current user, which can be overridden within the app context.
+
+        :param query_obj: The dict representation of a query object
+        :returns: The SQLAlchemy query along with its labels and extra cache keys
+        """
+        if not has_app_context():
+            return self.get_sqla_query(**query_obj)
+
+        try:
+            key = (
+                self.__class__.__name__,
+                getattr(self, "id", None),
+                getattr(self, "changed_on", None),
+                json.dumps_canonical(query_obj),
+                get_user_id(),
+                tuple(security_manager.get_rls_cache_key(cast("BaseDatasource", self))),
+            )
+        except (TypeError, ValueError):
+            return self.get_sqla_query(**query_obj)
+
+        if "sqla_queries" not in g:
+            g.sqla_queries = {}
+        if key not in g.sqla_queries:
+            g.sqla_queries[key] = self.get_sqla_query(**query_obj)
+        return g.sqla_queries[key]
+
     def get_query_str_extended(
         self,
         query_obj: QueryObjectDict,
         mutate: bool = True,
     ) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
+        sqlaq = self.get_memoized_sqla_query(query_obj)
         sql = self.database.compile_sqla_query(
             sqlaq.sqla_query,
             catalog=self.catalog,
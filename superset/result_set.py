@@ -16,8 +16,11 @@
 # under the License.
 """Superset wrapper around pyarrow.Table."""
 
+from __future__ import annotations
+
 import datetime
 import logging
+from collections.abc import Sequence
 from typing import Any, Optional
 
 import numpy as np
@@ -99,20 +102,61 @@ def convert_to_string(value: Any) -> str:
     return str(value)
 
 
+def to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+    """
+    Build a one dimensional object array, without numpy unpacking nested sequences.
+    """
+    array = np.empty(len(values), dtype=object)
+    for idx, value in enumerate(values):
+        array[idx] = value
+    return array
+
+
+def combine_chunks(chunks: list[pa.Array]) -> pa.ChunkedArray:
+    """
+    Combine the arrays converted from each batch of a column into a chunked array.
+
+    Batches may have been inferred with different types, e.g. a batch of nulls or of
+    integers followed by a batch of floats. Those are promoted to a common type, and
+    columns with incompatible types are cast to strings, as when converting all the
+    values at once.
+    """
+    try:
+        schema = pa.unify_schemas(
+            [pa.schema([("column", chunk.type)]) for chunk in chunks],
+            promote_options="permissive",
+        )
+        return pa.chunked_array(
+            [chunk.cast(schema.field("column").type) for chunk in chunks]
+        )
+    except (
+        pa.lib.ArrowInvalid,
+        pa.lib.ArrowTypeError,
+        pa.lib.ArrowNotImplementedError,
+    ):
+        return pa.chunked_array(
+            [chunk.cast(pa.string()) for chunk in chunks], type=pa.string()
+        )
+
+
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals  # noqa: C901
+    def __init__(
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
+        """
+        :param data: The rows returned by the cursor, or an Arrow table for drivers
+            that fetch results natively as Arrow, see `from_cursor`
+        :param cursor_description: The description of the cursor
+        :param db_engine_spec: The engine spec of the database
+        """
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
+        pa_data: list[pa.Array | pa.ChunkedArray] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
         numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
 
         if cursor_description:
             # get deduped list of column names
@@ -131,52 +175,20 @@ class SupersetResultSet:
             # generate numpy structured array dtype
             numpy_dtype = [(column_name, "object") for column_name in column_names]
 
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            if data.num_rows:
+                column_names = column_names or dedup(data.column_names)
+                pa_data = [self.convert_arrow_column(column) for column in data.columns]
+        else:
+            data = data or []
+            # only do expensive recasting if datatype is not standard list of tuples
+            if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
+                data = [tuple(row) for row in data]
+            array = np.array(data, dtype=numpy_dtype)
+            if array.size > 0:
+                pa_data = [
+                    self.convert_column(array[column]) for column in column_names
+                ]
 
         if not pa_data:
             column_names = []
@@ -193,6 +205,97 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @classmethod
+    def from_cursor(
+        cls,
+        cursor: Any,
+        db_engine_spec: type[BaseEngineSpec],
+        limit: int | None = None,
+    ) -> SupersetResultSet:
+        """
+        Fetch the result of a query and build the result set one batch at a time.
+
+        Results are fetched natively as Arrow when the engine spec supports it, and
+        otherwise in batches of rows which are converted to Arrow as they come, so
+        that memory scales with the size of a batch rather than the number of rows.
+
+        :param cursor: Cursor instance
+        :param db_engine_spec: The engine spec of the database
+        :param limit: Maximum number of rows to be returned by the cursor
+        :returns: The result set
+        """
+        table = db_engine_spec.fetch_arrow_table(cursor, limit)
+        if table is None:
+            chunks: list[list[pa.Array]] = []
+            for columns in db_engine_spec.fetch_data_batches(cursor, limit):
+                if not chunks:
+                    chunks = [[] for _ in columns]
+                for column_chunks, values in zip(chunks, columns, strict=True):
+                    column_chunks.append(cls.convert_column(to_object_array(values)))
+
+            table = pa.Table.from_arrays(
+                [combine_chunks(column_chunks) for column_chunks in chunks],
+                names=[str(idx) for idx in range(len(chunks))],
+            )
+
+        return cls(table, cursor.description, db_engine_spec)
+
+    @classmethod
+    def convert_column(cls, values: NDArray[Any]) -> pa.Array:
+        """
+        Convert the values of a column returned by the cursor to an Arrow array.
+        """
+        try:
+            array = pa.array(values.tolist())
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # attempt serialization of values as strings
+            return pa.array(stringify_values(values).tolist())
+
+        if pa.types.is_nested(array.type):
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Superset
+            #  (superset.utils.core.GenericDataType).
+            return pa.array(stringify_values(values).tolist())
+
+        if pa.types.is_temporal(array.type):
+            # workaround for bug converting
+            # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+            # related: https://issues.apache.org/jira/browse/ARROW-5248
+            sample = cls.first_nonempty(values)
+            if sample and isinstance(sample, datetime.datetime):
+                try:
+                    if sample.tzinfo:
+                        tz = sample.tzinfo
+                        series = pd.Series(values)
+                        series = pd.to_datetime(series)
+                        return pa.Array.from_pandas(
+                            series,
+                            type=pa.timestamp("ns", tz=tz),
+                        )
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.exception(ex)
+
+        return array
+
+    @classmethod
+    def convert_arrow_column(
+        cls, column: pa.Array | pa.ChunkedArray
+    ) -> pa.Array | pa.ChunkedArray:
+        """
+        Convert a column fetched natively as Arrow, serializing nested values to
+        strings as for columns returned by the cursor.
+        """
+        if pa.types.is_nested(column.type):
+            return cls.convert_column(to_object_array(column.to_pylist()))
+        return column
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -0,0 +1,166 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Memoization of the security lookups performed repeatedly while handling a request,
+like the row level security filters of a dataset or the permissions of the user.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Hashable
+from typing import Any, Callable, TypeVar
+
+from flask import current_app, g, has_app_context
+from sqlalchemy.engine.base import Connection
+from sqlalchemy.orm.mapper import Mapper
+
+T = TypeVar("T")
+
+
+class SecurityCache:
+    """
+    Two level cache for security lookups.
+
+    Values are always memoized for the duration of the request (more precisely of
+    the app context) in `g`. Values of namespaces given a TTL are also kept in a
+    process wide cache, shared between requests, for that many seconds; those must
+    only depend on their key, never on the current user.
+
+    Both levels are cleared when roles, permissions or row level security filters
+    change in this process; other processes pick up the changes once the TTL of
+    their entries expires.
+    """
+
+    def __init__(self) -> None:
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self._shared: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_request_cache() -> dict[tuple[str, Hashable], Any] | None:
+        if not has_app_context():
+            return None
+        if "security_cache" not in g:
+            g.security_cache = {}
+        return g.security_cache
+
+    def _record(self, namespace: str, hit: bool) -> None:
+        if hit:
+            self.hits[namespace] += 1
+        else:
+            self.misses[namespace] += 1
+
+        if has_app_context():
+            stats_logger = current_app.config["STATS_LOGGER"]
+            stats_logger.incr(f"security_cache.{namespace}.{'hit' if hit else 'miss'}")
+
+    def get(
+        self,
+        namespace: str,
+        key: Hashable,
+        func: Callable[[], T],
+        ttl: int = 0,
+    ) -> T:
+        """
+        Return the memoized value of `func` for the given namespace and key.
+
+        :param namespace: The kind of value, e.g. `rls_filters`
+        :param key: The key of the value within the namespace
+        :param func: Function computing the value on a cache miss
+        :param ttl: Seconds the value is shared between requests, 0 to disable
+        :returns: The cached or computed value
+        """
+        cache_key = (namespace, key)
+        request_cache = self._get_request_cache()
+        if request_cache is not None and cache_key in request_cache:
+            self._record(namespace, hit=True)
+            return request_cache[cache_key]
+
+        if ttl > 0:
+            with self._lock:
+                expires_at, value = self._shared.get(cache_key, (0, None))
+            if expires_at > time.monotonic():
+                self._record(namespace, hit=True)
+                if request_cache is not None:
+                    request_cache[cache_key] = value
+                return value
+
+        self._record(namespace, hit=False)
+        value = func()
+        if request_cache is not None:
+            request_cache[cache_key] = value
+        if ttl > 0:
+            with self._lock:
+                self._shared[cache_key] = (time.monotonic() + ttl, value)
+        return value
+
+    def invalidate(self, request_only: bool = False) -> None:
+        """
+        Clear the cached values.
+
+        :param request_only: Only clear the values cached for the current request
+        """
+        if has_app_context():
+            g.pop("security_cache", None)
+        if not request_only:
+            with self._lock:
+                self._shared.clear()
+
+    def on_model_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Any,
+    ) -> None:
+        """
+        SQLAlchemy event listener clearing the cache when a model it depends on, like
+        row level security filters, is changed.
+        """
+        self.invalidate()
+
+    def on_user_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Any,
+    ) -> None:
+        """
+        SQLAlchemy event listener clearing the values cached for the current request
+        when a user, and potentially its roles, is changed.
+
+        The values shared between requests don't depend on the user.
+        """
+        self.invalidate(request_only=True)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Return the number of hits and misses per namespace since the process started.
+        """
+        return {
+            namespace: {
+                "hits": self.hits[namespace],
+                "misses": self.misses[namespace],
+            }
+            for namespace in sorted(set(self.hits) | set(self.misses))
+        }
+
+
+security_cache = SecurityCache()
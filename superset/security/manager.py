@@ -47,7 +47,7 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import eagerload
 from sqlalchemy.orm.mapper import Mapper
@@ -60,6 +60,7 @@ from superset.exceptions import (
     DatasetInvalidPermissionEvaluationException,
     SupersetSecurityException,
 )
+from superset.security.cache import security_cache
 from superset.security.guest_token import (
     GuestToken,
     GuestTokenResources,
@@ -761,6 +762,23 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
+        """
+        Return the names of the view menus the current user has the given permission
+        on, memoized for the duration of the request.
+
+        :param permission_name: The permission name, e.g. `datasource_access`
+        :returns: The view menu names
+        """
+        user_key = "anonymous" if g.user.is_anonymous else get_user_id()
+        return set(
+            security_cache.get(
+                "view_menu_names",
+                (user_key, permission_name),
+                lambda: self._get_user_view_menu_names(permission_name),
+            )
+        )
+
+    def _get_user_view_menu_names(self, permission_name: str) -> set[str]:
         base_query = (
             self.get_session.query(self.viewmenu_model.name)
             .join(self.permissionview_model)
@@ -2083,6 +2101,22 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         permission_view_model.view_menu = view_menu
         self.on_permission_view_after_insert(mapper, connection, permission_view_model)
 
+    def register_security_cache_listeners(self) -> None:
+        """
+        Register the SQLAlchemy event listeners invalidating the memoized security
+        lookups (see `superset.security.cache`) when roles, users or row level
+        security filters change.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.connectors.sqla.models import RowLevelSecurityFilter
+
+        event.listen(self.role_model, "after_update", self.on_role_after_update)
+        event.listen(self.user_model, "after_update", security_cache.on_user_change)
+        for identifier in ("after_insert", "after_update", "after_delete"):
+            event.listen(
+                RowLevelSecurityFilter, identifier, security_cache.on_model_change
+            )
+
     def on_role_after_update(
         self, mapper: Mapper, connection: Connection, target: Role
     ) -> None:
@@ -2098,6 +2132,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being changed
         """
+        security_cache.invalidate()
 
     def on_view_menu_after_insert(
         self, mapper: Mapper, connection: Connection, target: ViewMenu
@@ -2162,6 +2197,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        security_cache.invalidate()
 
     def on_permission_view_after_delete(
         self, mapper: Mapper, connection: Connection, target: PermissionView
@@ -2178,6 +2214,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        security_cache.invalidate()
 
     @staticmethod
     def get_exclude_users_from_lists() -> list[str]:
@@ -2474,7 +2511,12 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if user.is_anonymous:
             public_role = current_app.config.get("AUTH_ROLE_PUBLIC")
             return [self.get_public_role()] if public_role else []
-        return super().get_user_roles(user)
+        if getattr(user, "is_guest_user", False) or not getattr(user, "id", None):
+            return super().get_user_roles(user)
+        get_user_roles = super().get_user_roles
+        return list(
+            security_cache.get("user_roles", user.id, lambda: get_user_roles(user))
+        )
 
     def get_guest_rls_filters(
         self, dataset: "BaseDatasource"
@@ -2506,6 +2548,19 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = [role.id for role in self.get_user_roles(g.user)]
+        return list(
+            security_cache.get(
+                "rls_filters",
+                (table.id, frozenset(user_roles)),
+                lambda: self._get_rls_filters(table, user_roles),
+                ttl=current_app.config["RLS_FILTERS_CACHE_TTL"],
+            )
+        )
+
+    def _get_rls_filters(
+        self, table: "BaseDatasource", user_roles: list[int]
+    ) -> list[SqlaQuery]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2513,7 +2568,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
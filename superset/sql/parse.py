@@ -21,14 +21,17 @@ import copy
 import enum
 import logging
 import re
+import threading
 import urllib.parse
+from collections import Counter, OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 
 import sqlglot
 import sqlparse
 from deprecation import deprecated
+from flask import current_app, has_app_context
 from sqlglot import exp
 from sqlglot.dialects.dialect import Dialect, Dialects
 from sqlglot.errors import ParseError
@@ -41,6 +44,8 @@ from superset.sql.dialects.firebolt import Firebolt
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # mapping between DB engine specs and sqlglot dialects
 SQLGLOT_DIALECTS = {
@@ -126,6 +131,84 @@ class Table:
         return str(self) == str(other)
 
 
+class ParseCache:
+    """
+    Bounded LRU cache of parse results, keyed by parser, engine/dialect and SQL.
+
+    The same SQL is typically parsed many times while it's validated, has RLS applied
+    and a limit set, and is executed. Parse trees are mutable, so values are shared
+    between callers: these must copy the trees they modify.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self._values: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _record(self, parser: str, hit: bool) -> None:
+        if hit:
+            self.hits[parser] += 1
+        else:
+            self.misses[parser] += 1
+
+        if has_app_context():
+            stats_logger = current_app.config["STATS_LOGGER"]
+            stats_logger.incr(f"sql_parse_cache.{parser}.{'hit' if hit else 'miss'}")
+
+    def get(self, parser: str, sql: str, engine: str, parse: Callable[[], T]) -> T:
+        """
+        Return the cached parse result of the SQL, calling `parse` on a cache miss.
+
+        :param parser: The parser, e.g. `sqlglot`
+        :param sql: The parsed SQL
+        :param engine: The engine or dialect the SQL is parsed for
+        :param parse: Function parsing the SQL; exceptions are not cached
+        :returns: The parse result, shared with other callers
+        """
+        if self.maxsize <= 0:
+            return parse()
+
+        key = (parser, engine, sql)
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                value = self._values[key]
+                self._record(parser, hit=True)
+                return value
+
+        self._record(parser, hit=False)
+        value = parse()
+        with self._lock:
+            self._values[key] = value
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Return the number of hits and misses, and the hit ratio, per parser since the
+        process started.
+        """
+        stats: dict[str, dict[str, float]] = {}
+        for parser in sorted(set(self.hits) | set(self.misses)):
+            hits, misses = self.hits[parser], self.misses[parser]
+            stats[parser] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses),
+            }
+        return stats
+
+
+parse_cache = ParseCache()
+
+
 # To avoid unnecessary parsing/formatting of queries, the statement has the concept of
 # an "internal representation", which is the AST of the SQL statement. For most of the
 # engines supported by Superset this is `sqlglot.exp.Expression`, but there is a special
@@ -264,7 +347,12 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         """
         dialect = SQLGLOT_DIALECTS.get(engine)
         try:
-            return sqlglot.parse(script, dialect=dialect)
+            asts = parse_cache.get(
+                "sqlglot",
+                script,
+                str(dialect),
+                lambda: tuple(sqlglot.parse(script, dialect=dialect)),
+            )
         except sqlglot.errors.ParseError as ex:
             error = ex.errors[0]
             raise SupersetParseError(
@@ -281,6 +369,9 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
                 message="Unable to parse script",
             ) from ex
 
+        # the cached trees are shared, while statements may modify theirs
+        return [ast.copy() if ast else ast for ast in asts]
+
     @classmethod
     def split_script(
         cls,
@@ -64,9 +64,9 @@ from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.utils import write_ipc_buffer
 from superset.utils import json
 from superset.utils.core import (
+    compress_blob,
     override_user,
     QuerySource,
-    zlib_compress,
 )
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
@@ -286,6 +286,7 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
 
     # Hook to allow environment-specific mutation (usually comments) to the SQL
     sql = database.mutate_sql_based_on_config(sql)
+    result_set: Optional[SupersetResultSet] = None
     try:
         query.executed_sql = sql
         if log_query:
@@ -312,9 +313,19 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
                     query.id,
                     str(query.to_dict()),
                 )
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
-                if query.limit is None or len(data) <= query.limit:
+                if config["FETCH_RESULTS_IN_BATCHES"]:
+                    result_set = SupersetResultSet.from_cursor(
+                        cursor, db_engine_spec, increased_limit
+                    )
+                    num_rows = result_set.size
+                else:
+                    data = db_engine_spec.fetch_data(cursor, increased_limit)
+                    num_rows = len(data)
+                if query.limit is None or num_rows <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
+                elif result_set is not None:
+                    # return 1 row less than increased_query
+                    result_set.table = result_set.table.slice(0, query.limit)
                 else:
                     # return 1 row less than increased_query
                     data = data[:-1]
@@ -347,6 +358,9 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
         logger.debug("Query %d: %s", query.id, ex)
         raise SqlLabException(db_engine_spec.extract_error_message(ex)) from ex
 
+    if result_set is not None:
+        return result_set
+
     logger.debug("Query %d: Fetching cursor description", query.id)
     cursor_description = cursor.description
     return SupersetResultSet(data, cursor_description, db_engine_spec)
@@ -389,7 +403,11 @@ def _serialize_and_expand_data(
         with stats_timing(
             "sqllab.query.results_backend_pa_serialization", stats_logger
         ):
-            data = write_ipc_buffer(result_set.pa_table).to_pybytes()
+            data = write_ipc_buffer(
+                result_set.pa_table,
+                compression=config["RESULTS_BACKEND_ARROW_COMPRESSION"],
+                max_chunksize=config["RESULTS_BACKEND_ARROW_BATCH_SIZE"],
+            ).to_pybytes()
 
         # expand when loading data from results backend
         all_columns, expanded_columns = (selected_columns, [])
@@ -624,7 +642,9 @@ def execute_sql_statements(  # noqa: C901
             if cache_timeout is None:
                 cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
 
-            compressed = zlib_compress(serialized_payload)
+            compressed = compress_blob(
+                serialized_payload, config["RESULTS_BACKEND_COMPRESSION"]
+            )
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from typing import Any, cast, TYPE_CHECKING
 
 import sqlparse
@@ -35,6 +35,7 @@ from sqlparse.sql import (
     IdentifierList,
     Parenthesis,
     remove_quotes,
+    Statement,
     Token,
     TokenList,
     Where,
@@ -61,6 +62,7 @@ from superset.exceptions import (
 )
 from superset.sql.parse import (
     extract_tables_from_statement,
+    parse_cache,
     SQLGLOT_DIALECTS,
     SQLScript,
     SQLStatement,
@@ -92,6 +94,20 @@ sqlparser_sql_regex.insert(25, (r"'(''|\\\\|\\|[^'])*'", sqlparse.tokens.String.
 lex.set_SQL_REGEX(sqlparser_sql_regex)
 
 
+def parse_statements(sql: str) -> tuple[Statement, ...]:
+    """
+    Parse SQL with sqlparse, memoized in the shared parse cache.
+
+    The statements are shared between callers and must not be modified; callers that
+    need to modify them should parse the SQL with `sqlparse.parse` instead. Note that
+    `copy.deepcopy` is not an option, since it breaks the identity of token types.
+
+    :param sql: The SQL to parse
+    :returns: The parsed statements
+    """
+    return parse_cache.get("sqlparse", sql, "", lambda: tuple(sqlparse.parse(sql)))
+
+
 class CtasMethod(StrEnum):
     TABLE = "TABLE"
     VIEW = "VIEW"
@@ -152,7 +168,7 @@ def get_cte_remainder_query(sql: str) -> tuple[str | None, str]:
     """
     cte: str | None = None
     remainder = sql
-    stmt = sqlparse.parse(sql)[0]
+    stmt = parse_statements(sql)[0]
 
     # The first meaningful token for CTE will be with WITH
     idx, token = stmt.token_next(-1, skip_ws=True, skip_cm=True)
@@ -218,10 +234,31 @@ class ParsedQuery:
         self._limit: int | None = None
 
         logger.debug("Parsing with sqlparse statement: %s", self.sql)
-        self._parsed = sqlparse.parse(self.stripped())
-        for statement in self._parsed:
+        self._statements = parse_statements(self.stripped())
+        self._parsed_copy: list[Statement] | None = None
+        for statement in self._statements:
             self._limit = _extract_limit_from_query(statement)
 
+    @property
+    def _parsed(self) -> list[Statement]:
+        """
+        The parsed statements, which callers may modify, e.g. to insert RLS predicates.
+
+        The statements in the parse cache are shared, so a private copy is parsed on
+        first access.
+        """
+        if self._parsed_copy is None:
+            self._parsed_copy = list(sqlparse.parse(self.stripped()))
+        return self._parsed_copy
+
+    def _get_statements(self) -> Sequence[Statement]:
+        """
+        The parsed statements, for reading only.
+        """
+        if self._parsed_copy is not None:
+            return self._parsed_copy
+        return self._statements
+
     @property
     def tables(self) -> set[Table]:
         if not self._tables:
@@ -292,7 +329,7 @@ class ParsedQuery:
 
     def is_select(self) -> bool:  # noqa: C901
         # make sure we strip comments; prevents a bug with comments in the CTE
-        parsed = sqlparse.parse(self.strip_comments())
+        parsed = parse_statements(self.strip_comments())
         seen_select = False
 
         for statement in parsed:
@@ -358,11 +395,11 @@ class ParsedQuery:
         return None
 
     def is_valid_ctas(self) -> bool:
-        parsed = sqlparse.parse(self.strip_comments())
+        parsed = parse_statements(self.strip_comments())
         return parsed[-1].get_type() == "SELECT"
 
     def is_valid_cvas(self) -> bool:
-        parsed = sqlparse.parse(self.strip_comments())
+        parsed = parse_statements(self.strip_comments())
         return len(parsed) == 1 and parsed[0].get_type() == "SELECT"
 
     def is_explain(self) -> bool:
@@ -391,7 +428,7 @@ class ParsedQuery:
         return statements_without_comments.upper().startswith("SET")
 
     def is_unknown(self) -> bool:
-        return self._parsed[0].get_type() == "UNKNOWN"
+        return self._get_statements()[0].get_type() == "UNKNOWN"
 
     def stripped(self) -> str:
         return self.sql.strip(" \t\r\n;")
@@ -402,7 +439,7 @@ class ParsedQuery:
     def get_statements(self) -> list[str]:
         """Returns a list of SQL statements as strings, stripped"""
         statements = []
-        for statement in self._parsed:
+        for statement in self._get_statements():
             if statement:
                 sql = str(statement).strip(" \n;\t")
                 if sql:
@@ -505,7 +542,7 @@ class ParsedQuery:
 
 def sanitize_clause(clause: str) -> str:
     # clause = sqlparse.format(clause, strip_comments=True)
-    statements = sqlparse.parse(clause)
+    statements = parse_statements(clause)
     if len(statements) != 1:
         raise QueryClauseValidationException("Clause contains multiple statements")
     open_parens = 0
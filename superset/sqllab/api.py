@@ -337,7 +337,14 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        offset = params.get("offset", 0)
+        limit = params.get("limit")
+        result = SqlExecutionResultsCommand(
+            key=key,
+            rows=rows,
+            offset=offset,
+            limit=limit,
+        ).run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
@@ -71,15 +71,60 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
     return sql_results
 
 
-def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
+def write_ipc_buffer(
+    table: pa.Table,
+    compression: str | None = None,
+    max_chunksize: int | None = None,
+) -> pa.Buffer:
     sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
 
-    with pa.ipc.new_stream(sink, table.schema) as writer:
-        writer.write_table(table)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table, max_chunksize=max_chunksize)
 
     return sink.getvalue()
 
 
+def read_ipc_buffer(buffer: bytes | pa.Buffer) -> pa.Table:
+    """
+    Read an Arrow IPC stream written by `write_ipc_buffer`.
+
+    Uncompressed buffers are read without copying; the compression codec, if any, is
+    detected from the stream itself.
+    """
+    return pa.ipc.open_stream(pa.py_buffer(buffer)).read_all()
+
+
+def slice_ipc_buffer(
+    buffer: bytes | pa.Buffer,
+    offset: int = 0,
+    limit: int | None = None,
+) -> pa.Table:
+    """
+    Read the rows `[offset, offset + limit)` of an Arrow IPC stream.
+
+    The stream is walked batch by batch using the row counts of the batch headers, so
+    that only the batches spanning the requested rows are kept, and reading stops
+    after the last of them.
+    """
+    reader = pa.ipc.open_stream(pa.py_buffer(buffer))
+    end = None if limit is None else offset + limit
+    batches = []
+    skipped = 0
+    read = 0
+    for batch in reader:
+        if end is not None and read >= end:
+            break
+        if read + batch.num_rows <= offset:
+            skipped += batch.num_rows
+        else:
+            batches.append(batch)
+        read += batch.num_rows
+
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+    return table.slice(offset - skipped, limit)
+
+
 def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
     tabs_state: list[Any] = []
     active_tab: Any = None
@@ -17,7 +17,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional, TypedDict, Union
+from collections import defaultdict
+from typing import Any, cast, Optional, TypedDict, Union
 from urllib import request
 from urllib.error import URLError
 
@@ -27,6 +28,9 @@ from flask import current_app
 from sqlalchemy import and_, func
 
 from superset import db, security_manager
+from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
 from superset.extensions import celery_app
 from superset.models.core import Log
 from superset.models.dashboard import Dashboard
@@ -35,9 +39,12 @@ from superset.tags.models import Tag, TaggedObject
 from superset.tasks.exceptions import ExecutorNotFoundError, InvalidExecutorError
 from superset.tasks.utils import fetch_csrf_token, get_executor
 from superset.utils import json
+from superset.utils.concurrency import map_in_app_context
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path, is_secure_url
+from superset.viz import viz_types
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.INFO)
@@ -278,6 +285,117 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
     return result
 
 
+def get_query_cache_keys(chart: Slice) -> Optional[tuple[int, tuple[str, ...]]]:
+    """
+    Return the database and the cache keys of the queries of a chart, for the current
+    user.
+
+    Legacy charts, and charts without a query context, return None since their cache
+    keys aren't known before running them.
+    """
+    if chart.viz_type in viz_types or not (query_context := chart.get_query_context()):
+        return None
+
+    keys = tuple(
+        query_context.query_cache_key(query_obj) for query_obj in query_context.queries
+    )
+    if not keys or not all(keys):
+        return None
+
+    return query_context.datasource.database.id, cast(tuple[str, ...], keys)
+
+
+def warm_up_chart(task: CacheWarmupTask) -> dict[str, Any]:
+    """Warm up the cache of a chart, as the executor of the task."""
+    user = security_manager.get_user_by_username(cast(str, task["username"]))
+    with override_user(user):
+        return ChartWarmUpCacheCommand(
+            task["payload"]["chart_id"],
+            task["payload"].get("dashboard_id"),
+            None,
+        ).run()
+
+
+def warm_up_charts(
+    tasks: list[CacheWarmupTask],
+) -> list[Union[dict[str, Any], BaseException]]:
+    """Warm up the cache of charts of the same database, with bounded concurrency."""
+    return map_in_app_context(
+        warm_up_chart,
+        tasks,
+        max_workers=current_app.config["CACHE_WARMUP_MAX_QUERIES_PER_DATABASE"],
+        return_exceptions=True,
+    )
+
+
+def warm_up_in_process(tasks: list[CacheWarmupTask]) -> dict[str, list[str]]:
+    """
+    Warm up the cache of the charts of the tasks in the worker.
+
+    Charts whose queries have the same cache keys as those of a previous chart, and
+    charts whose queries are all cached, are skipped.
+    """
+    results: dict[str, list[str]] = {"success": [], "skipped": [], "errors": []}
+    seen: set[Union[str, tuple[str, ...]]] = set()
+    tasks_by_database: dict[Optional[int], list[CacheWarmupTask]] = defaultdict(list)
+
+    for task in tasks:
+        payload = json.dumps(task["payload"])
+        if not task["username"]:
+            logger.warning("Executor not found for %s", payload)
+            continue
+
+        try:
+            chart = (
+                db.session.query(Slice).filter_by(id=task["payload"]["chart_id"]).one()
+            )
+            user = security_manager.get_user_by_username(task["username"])
+            with override_user(user):
+                queries = get_query_cache_keys(chart)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error computing the cache keys for payload: %s", payload)
+            results["errors"].append(payload)
+            continue
+
+        database_id, keys = queries or (None, None)
+        if (keys or payload) in seen or (
+            keys
+            and all(QueryCacheManager.has(key, region=CacheRegion.DATA) for key in keys)
+        ):
+            logger.info("Skipping %s, its queries are already cached", payload)
+            results["skipped"].append(payload)
+            continue
+
+        seen.add(keys or payload)
+        tasks_by_database[database_id].append(task)
+
+    databases = list(tasks_by_database.values())
+    for database_tasks, database_results in zip(
+        databases,
+        map_in_app_context(
+            warm_up_charts,
+            databases,
+            max_workers=current_app.config["CACHE_WARMUP_MAX_DATABASES"],
+            return_exceptions=True,
+        ),
+        strict=True,
+    ):
+        if isinstance(database_results, BaseException):
+            database_results = [database_results] * len(database_tasks)
+
+        for task, result in zip(database_tasks, database_results, strict=True):
+            payload = json.dumps(task["payload"])
+            if isinstance(result, BaseException) or result["viz_error"]:
+                logger.error(
+                    "Error warming up cache for payload %s: %s", payload, result
+                )
+                results["errors"].append(payload)
+            else:
+                results["success"].append(payload)
+
+    return results
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
@@ -307,6 +425,9 @@ def cache_warmup(
         logger.exception(message)
         return message
 
+    if current_app.config["CACHE_WARMUP_IN_PROCESS"]:
+        return warm_up_in_process(strategy.get_tasks())
+
     results: dict[str, list[str]] = {"scheduled": [], "errors": []}
     for task in strategy.get_tasks():
         username = task["username"]
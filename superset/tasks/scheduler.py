@@ -22,16 +22,19 @@ from typing import Any
 
 from celery import Task
 from celery.exceptions import SoftTimeLimitExceeded
+from sqlalchemy.exc import SQLAlchemyError
 
-from superset import app, is_feature_enabled
+from superset import app, db, is_feature_enabled
 from superset.commands.exceptions import CommandException
 from superset.commands.logs.prune import LogPruneCommand
 from superset.commands.report.exceptions import ReportScheduleUnexpectedError
 from superset.commands.report.execute import AsyncExecuteReportScheduleCommand
 from superset.commands.report.log_prune import AsyncPruneReportScheduleLogCommand
 from superset.commands.sql_lab.query import QueryPruneCommand
+from superset.daos.key_value import KeyValueDAO
 from superset.daos.report import ReportScheduleDAO
 from superset.extensions import celery_app
+from superset.key_value.types import KeyValueResource
 from superset.stats_logger import BaseStatsLogger
 from superset.tasks.cron_util import cron_schedule_window
 from superset.utils.core import LoggerLevel
@@ -170,3 +173,20 @@ def prune_logs(
         LogPruneCommand(retention_period_days).run()
     except CommandException as ex:
         logger.exception("An error occurred while pruning logs: %s", ex)
+
+
+@celery_app.task(name="prune_metastore_cache")
+def prune_metastore_cache() -> None:
+    """
+    Delete the expired entries of the metastore caches, for caches configured with
+    `PRUNE_EXPIRED_ON_ADD` disabled
+    """
+    stats_logger: BaseStatsLogger = app.config["STATS_LOGGER"]
+    stats_logger.incr("prune_metastore_cache")
+
+    try:
+        KeyValueDAO.delete_expired_entries(KeyValueResource.METASTORE_CACHE)
+        db.session.commit()  # pylint: disable=consider-using-transaction
+    except SQLAlchemyError as ex:
+        db.session.rollback()  # pylint: disable=consider-using-transaction
+        logger.exception("An error occurred while pruning the metastore cache: %s", ex)
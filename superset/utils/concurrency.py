@@ -0,0 +1,104 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from flask import current_app, g, has_request_context
+from flask.globals import request_ctx
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def with_app_context(func: Callable[[T], R]) -> Callable[[T], R]:
+    """
+    Wrap a function so that it can be called from another thread.
+
+    Flask contexts are local to the thread handling the request, so each call pushes
+    a copy of the current request context (or a new app context outside of requests)
+    and copies over the attributes of `g`, like the logged in user.
+    """
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    g_attributes = dict(g.__dict__)
+    request_context = (
+        request_ctx._get_current_object()  # pylint: disable=protected-access
+        if has_request_context()
+        else None
+    )
+
+    def wrapper(item: T) -> R:
+        context = request_context.copy() if request_context else app.app_context()
+        with context:
+            g.__dict__.update(g_attributes)
+            return func(item)
+
+    return wrapper
+
+
+def map_in_app_context(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    return_exceptions: bool = False,
+) -> list[R | BaseException]:
+    """
+    Apply a function to each item using a bounded thread pool.
+
+    Results are returned in the same order as the items. Each call runs in its own
+    app context (see `with_app_context`) and is isolated from the others: when a
+    call fails the remaining ones still run to completion, after which the first
+    exception (in item order) is raised, or returned in place of the result when
+    `return_exceptions` is set.
+
+    With a single worker, or a single item, the calls are made serially in the
+    current thread, and unless `return_exceptions` is set the first exception is
+    raised right away.
+
+    :param func: The function to apply to each item
+    :param items: The items to process
+    :param max_workers: The maximum number of concurrent calls
+    :param return_exceptions: Return exceptions instead of raising them
+    :returns: The results of each call
+    """
+    items = list(items)
+    results: list[R | BaseException] = []
+
+    if max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            try:
+                results.append(func(item))
+            except Exception as ex:  # pylint: disable=broad-except
+                if not return_exceptions:
+                    raise
+                results.append(ex)
+        return results
+
+    wrapped_func = with_app_context(func)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(wrapped_func, item) for item in items]
+
+    for future in futures:
+        if (exception := future.exception()) is not None:
+            if not return_exceptions:
+                raise exception
+            results.append(exception)
+        else:
+            results.append(future.result())
+    return results
@@ -30,6 +30,7 @@ import signal
 import smtplib
 import sqlite3
 import ssl
+import struct
 import tempfile
 import threading
 import traceback
@@ -55,6 +56,7 @@ from zipfile import ZipFile
 import markdown as md
 import nh3
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sa
 from cryptography.hazmat.backends import default_backend
 from cryptography.x509 import Certificate, load_pem_x509_certificate
@@ -858,6 +860,67 @@ def zlib_decompress(blob: bytes, decode: bool | None = True) -> bytes | str:
     return decompressed.decode("utf-8") if decode else decompressed
 
 
+COMPRESSED_BLOB_MAGIC = b"SPCB"
+
+
+def compress_blob(data: bytes | str, codec: str | None = "zlib") -> bytes:
+    """
+    Compress things with the given codec
+
+    Blobs compressed with zlib are plain zlib streams, as written by `zlib_compress`.
+    Blobs compressed with other codecs (any codec supported by `pyarrow.compress`,
+    such as "zstd" or "lz4", or None to leave the data uncompressed) start with a
+    header naming the codec, so that `decompress_blob` reads blobs of any codec.
+
+    >>> blob = compress_blob('{"test": 1}', "zstd")
+    >>> decompress_blob(blob)
+    '{"test": 1}'
+    """
+    if isinstance(data, str):
+        data = bytes(data, "utf-8")
+    if codec == "zlib":
+        return zlib.compress(data)
+
+    name = bytes(codec or "none", "utf-8")
+    header = (
+        COMPRESSED_BLOB_MAGIC
+        + struct.pack("!B", len(name))
+        + name
+        + struct.pack("!Q", len(data))
+    )
+    if codec is None:
+        return header + data
+    return header + pa.compress(data, codec=codec, asbytes=True)
+
+
+def decompress_blob(blob: bytes, decode: bool | None = True) -> bytes | str:
+    """
+    Decompress things compressed with `compress_blob` or `zlib_compress`
+    """
+    if isinstance(blob, str):
+        blob = bytes(blob, "utf-8")
+    if not blob.startswith(COMPRESSED_BLOB_MAGIC):
+        return zlib_decompress(blob, decode)
+
+    offset = len(COMPRESSED_BLOB_MAGIC)
+    (length,) = struct.unpack_from("!B", blob, offset)
+    codec = blob[offset + 1 : offset + 1 + length].decode("utf-8")
+    offset += 1 + length
+    (size,) = struct.unpack_from("!Q", blob, offset)
+    offset += 8
+
+    if codec == "none":
+        decompressed = blob[offset:]
+    else:
+        decompressed = pa.decompress(
+            pa.py_buffer(blob)[offset:],
+            decompressed_size=size,
+            codec=codec,
+            asbytes=True,
+        )
+    return decompressed.decode("utf-8") if decode else decompressed
+
+
 def simple_filter_to_adhoc(
     filter_clause: QueryObjectFilterClause,
     clause: str = "where",
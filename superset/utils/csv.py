@@ -15,29 +15,25 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-import re
 import urllib.request
+from collections.abc import Iterator
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
-import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from superset.utils import json
-from superset.utils.core import GenericDataType
+from superset.utils.core import GenericDataType, JS_MAX_INTEGER
+from superset.utils.sanitization import (
+    escape_formulas,
+    negative_number_re,
+    problematic_chars_re,
+    stringify_large_numbers,
+)
 
 logger = logging.getLogger(__name__)
 
-negative_number_re = re.compile(r"^-[0-9.]+$")
-
-# This regex will match if the string starts with:
-#
-#     1. one of -, @, +, |, =, %
-#     2. two double quotes immediately followed by one of -, @, +, |, =, %
-#     3. one or more spaces immediately followed by one of -, @, +, |, =, %
-#
-problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
-
 
 def escape_value(value: str) -> str:
     """
@@ -64,7 +60,11 @@ def escape_value(value: str) -> str:
     return value
 
 
-def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+def escape_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of the dataframe with its column names and string values escaped.
+    """
+
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
 
@@ -72,13 +72,120 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     df = df.rename(columns=escape_values)
 
     # Escape csv values
-    for name, column in df.items():
-        if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+    for idx in range(len(df.columns)):
+        df.isetitem(idx, escape_formulas(df.iloc[:, idx]))
+
+    return df
+
 
-    return df.to_csv(escapechar="\\", **kwargs)
+def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    return escape_df(df).to_csv(escapechar="\\", **kwargs)
+
+
+def format_temporal_columns(
+    df: pd.DataFrame,
+    date_format: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Returns a shallow copy of the dataframe with its datetime and timedelta columns
+    formatted as strings.
+
+    `DataFrame.to_csv` picks the format of these columns from all of their values
+    (e.g. dates only when all datetimes are at midnight), so serializing a dataframe
+    in chunks would format each chunk differently. The columns are formatted as they
+    would be in the whole dataframe instead.
+
+    :param df: The dataframe to format
+    :param date_format: The format of datetimes, as passed to `DataFrame.to_csv`
+    :returns: The dataframe with its temporal columns formatted
+    """
+    df = df.copy(deep=False)
+    for idx in range(len(df.columns)):
+        column = df.iloc[:, idx]
+        if pd.api.types.is_timedelta64_dtype(column.dtype) or (
+            date_format is None and pd.api.types.is_datetime64_any_dtype(column.dtype)
+        ):
+            df.isetitem(idx, column.astype(str).where(column.notna()))
+    return df
+
+
+def df_to_escaped_csv_chunks(
+    df: pd.DataFrame,
+    chunk_size: int,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Yields the escaped CSV representation of a dataframe in chunks of rows.
+
+    Only one chunk is escaped and serialized at a time, so that the memory needed
+    on top of the dataframe itself is bounded by the chunk size, besides temporal
+    columns which are formatted upfront to be consistent across chunks.
+
+    :param df: The dataframe to serialize
+    :param chunk_size: The number of rows per chunk
+    :param kwargs: Extra arguments passed to `DataFrame.to_csv`
+    :returns: An iterator of CSV chunks, the first one including the header
+    """
+    header = kwargs.pop("header", True)
+    df = format_temporal_columns(df, kwargs.get("date_format"))
+    for start in range(0, max(len(df.index), 1), chunk_size):
+        chunk = df.iloc[start : start + chunk_size]
+        yield df_to_escaped_csv(chunk, header=header if start == 0 else False, **kwargs)
+
+
+def arrow_to_escaped_csv_chunks(
+    reader: pa.RecordBatchStreamReader,
+    chunk_size: int,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Yields the escaped CSV representation of an Arrow stream in chunks of rows.
+
+    Only one chunk is converted to a dataframe, escaped and serialized at a time.
+    Values are formatted as in the dataframes of objects SQL Lab results are
+    exported from without streaming: large integers are cast to strings, and
+    temporal values are formatted one by one rather than from all the values of
+    their chunk, so that they're formatted the same way whatever the chunk they're
+    in.
+
+    :param reader: The reader of the Arrow stream
+    :param chunk_size: The maximum number of rows per chunk
+    :param kwargs: Extra arguments passed to `DataFrame.to_csv`
+    :returns: An iterator of CSV chunks, the first one including the header
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.result_set import SupersetResultSet
+
+    def to_df(table: pa.Table) -> pd.DataFrame:
+        df = SupersetResultSet.convert_table_to_df(table)
+        for idx in range(len(df.columns)):
+            column = df.iloc[:, idx]
+            if pd.api.types.is_datetime64_any_dtype(
+                column.dtype
+            ) or pd.api.types.is_timedelta64_dtype(column.dtype):
+                df.isetitem(idx, column.astype(object))
+            else:
+                df.isetitem(idx, stringify_large_numbers(column, JS_MAX_INTEGER))
+        return df
+
+    header = kwargs.pop("header", True)
+    is_first = True
+    for batch in reader:
+        for start in range(0, batch.num_rows, chunk_size):
+            table = pa.Table.from_batches([batch.slice(start, chunk_size)])
+            yield df_to_escaped_csv(
+                to_df(table),
+                header=header if is_first else False,
+                **kwargs,
+            )
+            is_first = False
+
+    if is_first:
+        yield df_to_escaped_csv(
+            to_df(reader.schema.empty_table()),
+            header=header,
+            **kwargs,
+        )
 
 
 def get_chart_csv_data(
@@ -101,16 +208,26 @@ def get_chart_csv_data(
 def get_chart_dataframe(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[pd.DataFrame]:
-    # Disable all the unnecessary-lambda violations in this function
-    # pylint: disable=unnecessary-lambda
     content = get_chart_csv_data(chart_url, auth_cookies)
     if content is None:
         return None
 
     result = json.loads(content.decode("utf-8"))
+    return chart_data_to_dataframe(result["result"][0])
+
+
+def chart_data_to_dataframe(query: dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Build the dataframe of the post-processed JSON payload of a chart data query.
+
+    :param query: The payload, with its data, column and index names and types
+    :returns: The dataframe, or None if there's no data
+    """
+    # Disable all the unnecessary-lambda violations in this function
+    # pylint: disable=unnecessary-lambda
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
-    df = pd.DataFrame.from_dict(result["result"][0]["data"])
+    df = pd.DataFrame.from_dict(query["data"])
 
     if df.empty:
         return None
@@ -118,22 +235,22 @@ def get_chart_dataframe(
     try:
         # if any column type is equal to 2, need to convert data into
         # datetime timestamp for that column.
-        if GenericDataType.TEMPORAL in result["result"][0]["coltypes"]:
-            for i in range(len(result["result"][0]["coltypes"])):
-                if result["result"][0]["coltypes"][i] == GenericDataType.TEMPORAL:
-                    df[result["result"][0]["colnames"][i]] = df[
-                        result["result"][0]["colnames"][i]
-                    ].astype("datetime64[ms]")
+        if GenericDataType.TEMPORAL in query["coltypes"]:
+            for i in range(len(query["coltypes"])):
+                if query["coltypes"][i] == GenericDataType.TEMPORAL:
+                    df[query["colnames"][i]] = df[query["colnames"][i]].astype(
+                        "datetime64[ms]"
+                    )
     except BaseException as err:
         logger.error(err)
 
     # rebuild hierarchical columns and index
     df.columns = pd.MultiIndex.from_tuples(
-        tuple(colname) if isinstance(colname, list) else (colname,)
-        for colname in result["result"][0]["colnames"]
+        tuple(colname) if isinstance(colname, (list, tuple)) else (colname,)
+        for colname in query["colnames"]
     )
     df.index = pd.MultiIndex.from_tuples(
-        tuple(indexname) if isinstance(indexname, list) else (indexname,)
-        for indexname in result["result"][0]["indexnames"]
+        tuple(indexname) if isinstance(indexname, (list, tuple)) else (indexname,)
+        for indexname in query["indexnames"]
     )
     return df
@@ -19,9 +19,11 @@ from __future__ import annotations
 import calendar
 import logging
 import re
+import threading
 from datetime import datetime, timedelta
 from functools import lru_cache
 from time import struct_time
+from typing import Any
 
 import pandas as pd
 import parsedatetime
@@ -53,9 +55,27 @@ ParserElement.enable_packrat()
 
 logger = logging.getLogger(__name__)
 
+_calendars = threading.local()
+
+
+def get_calendar() -> parsedatetime.Calendar:
+    """
+    Return the parsedatetime calendar of the current thread, since building one is
+    costly and calendars can't be shared between threads.
+    """
+    if not hasattr(_calendars, "calendar"):
+        _calendars.calendar = parsedatetime.Calendar()
+    return _calendars.calendar
+
 
 def parse_human_datetime(human_readable: str) -> datetime:
     """Returns ``datetime.datetime`` from human readable strings"""
+    # fast path for the most common relative bases
+    if (keyword := human_readable.strip().lower()) == "now":
+        return datetime.now().replace(microsecond=0)
+    if keyword == "today":
+        return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
     x_periods = r"^\s*([0-9]+)\s+(second|minute|hour|day|week|month|quarter|year)s?\s*$"
     if re.search(x_periods, human_readable, re.IGNORECASE):
         raise TimeRangeAmbiguousError(human_readable)
@@ -63,7 +83,7 @@ def parse_human_datetime(human_readable: str) -> datetime:
         default = datetime(year=datetime.now().year, month=1, day=1)
         dttm = parse(human_readable, default=default)
     except (ValueError, OverflowError) as ex:
-        cal = parsedatetime.Calendar()
+        cal = get_calendar()
         parsed_dttm, parsed_flags = cal.parseDT(human_readable)
         # 0 == not parsed at all
         if parsed_flags == 0:
@@ -103,7 +123,7 @@ def get_past_or_future(
     human_readable: str | None,
     source_time: datetime | None = None,
 ) -> datetime:
-    cal = parsedatetime.Calendar()
+    cal = get_calendar()
     source_dttm = dttm_from_timetuple(
         source_time.timetuple() if source_time else datetime.now().timetuple()
     )
@@ -143,6 +163,15 @@ def parse_past_timedelta(
     )
 
 
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def shift_datetime(dttm: datetime, time_shift: str) -> datetime:
+    """
+    Shift a datetime to the past by a time delta. The result only depends on the
+    arguments, so it is cached.
+    """
+    return dttm - parse_past_timedelta(time_shift, dttm)
+
+
 def get_relative_base(unit: str, relative_start: str | None = None) -> str:
     """
     Determines the relative base (`now` or `today`) based on the granularity of the unit
@@ -311,6 +340,108 @@ def handle_scope_and_unit(scope: str, delta: str, unit: str, relative_base: str)
         raise ValueError(f"Invalid scope: {scope}")
 
 
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def get_time_range_expressions(  # pylint: disable=too-many-branches  # noqa: C901
+    time_range: str,
+    relative_start: str | None = None,
+    relative_end: str | None = None,
+) -> tuple[str | None, str | None] | None:
+    """
+    Translate a time range to the datetime expressions of its start and end, or
+    return None when it isn't a range.
+
+    The expressions only depend on the arguments, and not on the current time, so
+    they are cached.
+    """
+    separator = " : "
+    _relative_start = relative_start if relative_start else "today"
+    _relative_end = relative_end if relative_end else "today"
+
+    if time_range.startswith("Last") and separator not in time_range:
+        time_range = time_range + separator + _relative_end
+
+    if time_range.startswith("Next") and separator not in time_range:
+        time_range = _relative_start + separator + time_range
+
+    if time_range.startswith("previous calendar week") and separator not in time_range:
+        time_range = "DATETRUNC(DATEADD(DATETIME('today'), -1, WEEK), WEEK) : DATETRUNC(DATETIME('today'), WEEK)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+    if time_range.startswith("previous calendar month") and separator not in time_range:
+        time_range = "DATETRUNC(DATEADD(DATETIME('today'), -1, MONTH), MONTH) : DATETRUNC(DATETIME('today'), MONTH)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+    if (
+        time_range.startswith("previous calendar quarter")
+        and separator not in time_range
+    ):
+        time_range = (
+            "DATETRUNC(DATEADD(DATETIME('today'), -1, QUARTER), QUARTER) : "
+            "DATETRUNC(DATETIME('today'), QUARTER)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+        )
+    if time_range.startswith("previous calendar year") and separator not in time_range:
+        time_range = "DATETRUNC(DATEADD(DATETIME('today'), -1, YEAR), YEAR) : DATETRUNC(DATETIME('today'), YEAR)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+    if time_range.startswith("Current day") and separator not in time_range:
+        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, DAY), DAY) : DATETRUNC(DATEADD(DATETIME('today'), 1, DAY), DAY)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+    if time_range.startswith("Current week") and separator not in time_range:
+        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, WEEK), WEEK) : DATETRUNC(DATEADD(DATETIME('today'), 1, WEEK), WEEK)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+    if time_range.startswith("Current month") and separator not in time_range:
+        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, MONTH), MONTH) : DATETRUNC(DATEADD(DATETIME('today'), 1, MONTH), MONTH)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+    if time_range.startswith("Current quarter") and separator not in time_range:
+        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, QUARTER), QUARTER) : DATETRUNC(DATEADD(DATETIME('today'), 1, QUARTER), QUARTER)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+    if time_range.startswith("Current year") and separator not in time_range:
+        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, YEAR), YEAR) : DATETRUNC(DATEADD(DATETIME('today'), 1, YEAR), YEAR)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+
+    if separator not in time_range:
+        return None
+
+    time_range_lookup = [
+        (
+            r"^(start of|beginning of|end of)\s+"
+            r"(this|last|next|prior)\s+"
+            r"([0-9]+)?\s*"
+            r"(day|week|month|quarter|year)s?$",  # Matches phrases like "start of next month" # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+            lambda modifier, scope, delta, unit: handle_modifier_and_unit(
+                modifier,
+                scope,
+                delta,
+                unit,
+                get_relative_base(unit, relative_start),
+            ),
+        ),
+        (
+            r"^(this|last|next|prior)\s+"
+            r"([0-9]+)?\s*"
+            r"(second|minute|day|week|month|quarter|year)s?$",  # Matches "next 5 days" or "last 2 weeks" # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+            lambda scope, delta, unit: handle_scope_and_unit(
+                scope, delta, unit, get_relative_base(unit, relative_start)
+            ),
+        ),
+        (
+            r"^(DATETIME.*|DATEADD.*|DATETRUNC.*|LASTDAY.*|HOLIDAY.*)$",  # Matches date-related keywords # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+            lambda text: text,
+        ),
+    ]
+
+    since_and_until_partition = [_.strip() for _ in time_range.split(separator, 1)]
+    since_and_until: list[str | None] = []
+    for part in since_and_until_partition:
+        if not part:
+            # if since or until is "", set as None
+            since_and_until.append(None)
+            continue
+
+        # Is it possible to match to time_range_lookup
+        matched = False
+        for pattern, fn in time_range_lookup:
+            result = re.search(pattern, part, re.IGNORECASE)
+            if result:
+                matched = True
+                # converted matched time_range to "formal time expressions"
+                since_and_until.append(fn(*result.groups()))  # type: ignore
+        if not matched:
+            # default matched case
+            since_and_until.append(f"DATETIME('{part}')")
+
+    return since_and_until[0], since_and_until[1]
+
+
 def get_since_until(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements  # noqa: C901
     time_range: str | None = None,
     since: str | None = None,
@@ -344,127 +475,16 @@ def get_since_until(  # pylint: disable=too-many-arguments,too-many-locals,too-m
         - Next X seconds/minutes/hours/days/weeks/months/years
 
     """
-    separator = " : "
-    _relative_start = relative_start if relative_start else "today"
-    _relative_end = relative_end if relative_end else "today"
-
     if time_range == NO_TIME_RANGE or time_range == _(NO_TIME_RANGE):
         return None, None
 
-    if time_range and time_range.startswith("Last") and separator not in time_range:
-        time_range = time_range + separator + _relative_end
-
-    if time_range and time_range.startswith("Next") and separator not in time_range:
-        time_range = _relative_start + separator + time_range
-
-    if (
-        time_range
-        and time_range.startswith("previous calendar week")
-        and separator not in time_range
-    ):
-        time_range = "DATETRUNC(DATEADD(DATETIME('today'), -1, WEEK), WEEK) : DATETRUNC(DATETIME('today'), WEEK)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-    if (
-        time_range
-        and time_range.startswith("previous calendar month")
-        and separator not in time_range
-    ):
-        time_range = "DATETRUNC(DATEADD(DATETIME('today'), -1, MONTH), MONTH) : DATETRUNC(DATETIME('today'), MONTH)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-    if (
-        time_range
-        and time_range.startswith("previous calendar quarter")
-        and separator not in time_range
-    ):
-        time_range = (
-            "DATETRUNC(DATEADD(DATETIME('today'), -1, QUARTER), QUARTER) : "
-            "DATETRUNC(DATETIME('today'), QUARTER)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
+    _relative_end = relative_end if relative_end else "today"
+    if time_range and (
+        expressions := get_time_range_expressions(
+            time_range, relative_start, relative_end
         )
-    if (
-        time_range
-        and time_range.startswith("previous calendar year")
-        and separator not in time_range
-    ):
-        time_range = "DATETRUNC(DATEADD(DATETIME('today'), -1, YEAR), YEAR) : DATETRUNC(DATETIME('today'), YEAR)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-    if (
-        time_range
-        and time_range.startswith("Current day")
-        and separator not in time_range
-    ):
-        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, DAY), DAY) : DATETRUNC(DATEADD(DATETIME('today'), 1, DAY), DAY)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-    if (
-        time_range
-        and time_range.startswith("Current week")
-        and separator not in time_range
     ):
-        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, WEEK), WEEK) : DATETRUNC(DATEADD(DATETIME('today'), 1, WEEK), WEEK)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-    if (
-        time_range
-        and time_range.startswith("Current month")
-        and separator not in time_range
-    ):
-        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, MONTH), MONTH) : DATETRUNC(DATEADD(DATETIME('today'), 1, MONTH), MONTH)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-    if (
-        time_range
-        and time_range.startswith("Current quarter")
-        and separator not in time_range
-    ):
-        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, QUARTER), QUARTER) : DATETRUNC(DATEADD(DATETIME('today'), 1, QUARTER), QUARTER)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-    if (
-        time_range
-        and time_range.startswith("Current year")
-        and separator not in time_range
-    ):
-        time_range = "DATETRUNC(DATEADD(DATETIME('today'), 0, YEAR), YEAR) : DATETRUNC(DATEADD(DATETIME('today'), 1, YEAR), YEAR)"  # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-
-    if time_range and separator in time_range:
-        time_range_lookup = [
-            (
-                r"^(start of|beginning of|end of)\s+"
-                r"(this|last|next|prior)\s+"
-                r"([0-9]+)?\s*"
-                r"(day|week|month|quarter|year)s?$",  # Matches phrases like "start of next month" # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-                lambda modifier, scope, delta, unit: handle_modifier_and_unit(
-                    modifier,
-                    scope,
-                    delta,
-                    unit,
-                    get_relative_base(unit, relative_start),
-                ),
-            ),
-            (
-                r"^(this|last|next|prior)\s+"
-                r"([0-9]+)?\s*"
-                r"(second|minute|day|week|month|quarter|year)s?$",  # Matches "next 5 days" or "last 2 weeks" # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-                lambda scope, delta, unit: handle_scope_and_unit(
-                    scope, delta, unit, get_relative_base(unit, relative_start)
-                ),
-            ),
-            (
-                r"^(DATETIME.*|DATEADD.*|DATETRUNC.*|LASTDAY.*|HOLIDAY.*)$",  # Matches date-related keywords # pylint: disable=line-too-long,useless-suppression  # noqa: E501
-                lambda text: text,
-            ),
-        ]
-
-        since_and_until_partition = [_.strip() for _ in time_range.split(separator, 1)]
-        since_and_until: list[str | None] = []
-        for part in since_and_until_partition:
-            if not part:
-                # if since or until is "", set as None
-                since_and_until.append(None)
-                continue
-
-            # Is it possible to match to time_range_lookup
-            matched = False
-            for pattern, fn in time_range_lookup:
-                result = re.search(pattern, part, re.IGNORECASE)
-                if result:
-                    matched = True
-                    # converted matched time_range to "formal time expressions"
-                    since_and_until.append(fn(*result.groups()))  # type: ignore
-            if not matched:
-                # default matched case
-                since_and_until.append(f"DATETIME('{part}')")
-
-        _since, _until = map(datetime_eval, since_and_until)
+        _since, _until = map(datetime_eval, expressions)
     else:
         since = since or ""
         if since:
@@ -477,10 +497,8 @@ def get_since_until(  # pylint: disable=too-many-arguments,too-many-locals,too-m
         )
 
     if time_shift:
-        time_delta_since = parse_past_timedelta(time_shift, _since)
-        time_delta_until = parse_past_timedelta(time_shift, _until)
-        _since = _since if _since is None else (_since - time_delta_since)
-        _until = _until if _until is None else (_until - time_delta_until)
+        _since = _since if _since is None else shift_datetime(_since, time_shift)
+        _until = _until if _until is None else shift_datetime(_until, time_shift)
 
     if instant_time_comparison_range:
         # This is only set using the new time comparison controls
@@ -775,12 +793,21 @@ def datetime_parser() -> ParseResults:  # pylint: disable=too-many-locals
     return date_expr | datediff_func
 
 
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def compile_datetime_expression(datetime_expression: str) -> Any:
+    """
+    Parse a datetime expression into a tree that is evaluated against the current
+    time on each call of its `eval` method, so that it can be cached.
+    """
+    try:
+        return datetime_parser().parseString(datetime_expression)[0]
+    except ParseException as ex:
+        raise ValueError(ex) from ex
+
+
 def datetime_eval(datetime_expression: str | None = None) -> datetime | None:
     if datetime_expression:
-        try:
-            return datetime_parser().parseString(datetime_expression)[0].eval()
-        except ParseException as ex:
-            raise ValueError(ex) from ex
+        return compile_datetime_expression(datetime_expression).eval()
     return None
 
 
@@ -19,23 +19,19 @@ from typing import Any
 
 import pandas as pd
 
+from superset.utils import sanitization
 from superset.utils.core import GenericDataType
 
+# Excel does not support numbers larger than 10^15
+EXCEL_MAX_NUMBER = 10**15
+
 
 def quote_formulas(df: pd.DataFrame) -> pd.DataFrame:
     """
     Make sure to quote any formulas for security reasons.
     """
-    formula_prefixes = {"=", "+", "-", "@"}
-
-    for col in df.select_dtypes(include="object").columns:
-        df[col] = df[col].apply(
-            lambda x: (
-                f"'{x}"
-                if isinstance(x, str) and len(x) and x[0] in formula_prefixes
-                else x
-            )
-        )
+    for idx in range(len(df.columns)):
+        df.isetitem(idx, sanitization.quote_formulas(df.iloc[:, idx]))
 
     return df
 
@@ -68,11 +64,10 @@ def apply_column_types(
             try:
                 df[column] = pd.to_numeric(df[column])
                 # if the number is too large, convert it to a string
-                # Excel does not support numbers larger than 10^15
-                df[column] = df[column].apply(
-                    lambda x: str(x)
-                    if isinstance(x, (int, float)) and abs(x) > 10**15
-                    else x
+                df[column] = sanitization.stringify_large_numbers(
+                    df[column],
+                    EXCEL_MAX_NUMBER,
+                    include_floats=True,
                 )
             except ValueError:
                 df[column] = df[column].astype(str)
@@ -34,3 +34,42 @@ def md5_sha_from_dict(
     )
 
     return md5_sha_from_str(json_data)
+
+
+def hash_from_str(val: str, algorithm: str = "md5") -> str:
+    """
+    Hash a string with the given algorithm.
+
+    :param val: The string to hash
+    :param algorithm: "md5", "blake2b" (with a 128 bit digest) or "xxh128", a non
+        cryptographic hash that requires the `xxhash` package
+    :returns: The hexadecimal digest
+    :raises ValueError: If the algorithm is not supported or not installed
+    """
+    data = val.encode("utf-8")
+    if algorithm == "md5":
+        return hashlib.md5(data).hexdigest()  # noqa: S324
+    if algorithm == "blake2b":
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    if algorithm == "xxh128":
+        try:
+            # pylint: disable=import-outside-toplevel
+            import xxhash
+        except ModuleNotFoundError as ex:
+            raise ValueError("`xxhash` package not installed") from ex
+        return xxhash.xxh3_128_hexdigest(data)
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+
+
+def hash_from_dict(
+    obj: dict[Any, Any],
+    default: Optional[Callable[[Any], Any]] = None,
+    algorithm: str = "md5",
+) -> str:
+    """
+    Hash the canonical JSON representation of a dict.
+
+    Unlike `md5_sha_from_dict` the compact encoding of `json.dumps_canonical` is
+    used, so the digests of both functions differ even with the same algorithm.
+    """
+    return hash_from_str(json.dumps_canonical(obj, default=default), algorithm)
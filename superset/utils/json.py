@@ -16,6 +16,7 @@
 # under the License.
 import copy
 import decimal
+import json as std_json
 import logging
 import uuid
 from datetime import date, datetime, time, timedelta
@@ -228,6 +229,41 @@ def dumps(  # pylint: disable=too-many-arguments
     return results_string
 
 
+def dumps_canonical(
+    obj: Any,
+    default: Optional[Callable[[Any], Any]] = json_int_dttm_ser,
+) -> str:
+    """
+    Dumps object to a compact JSON string with sorted keys, meant to be hashed rather
+    than read back.
+
+    The C accelerated encoder of the standard library is considerably faster than
+    simplejson; the latter is only used for objects the former can't sort, like dicts
+    with keys of mixed types.
+
+    :param obj: The serializable object
+    :param default: function that should return a serializable version of obj
+    :returns: String object in the JSON compatible form
+    """
+    try:
+        return std_json.dumps(
+            obj,
+            default=default,
+            allow_nan=True,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+    except TypeError:
+        return dumps(
+            obj,
+            default=default,
+            allow_nan=True,
+            ignore_nan=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
+
 def loads(
     obj: Union[bytes, bytearray, str],
     encoding: Union[str, None] = None,
@@ -16,17 +16,23 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
+import contextlib
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
-from flask import g, has_request_context, request
+from flask import current_app, Flask, g, has_request_context, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -369,45 +375,235 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
-    def log(  # pylint: disable=too-many-arguments,too-many-locals
-        self,
+    @staticmethod
+    def get_log_mappings(  # pylint: disable=too-many-arguments
         user_id: int | None,
         action: str,
         dashboard_id: int | None,
         duration_ms: int | None,
         slice_id: int | None,
         referrer: str | None,
-        *args: Any,
-        **kwargs: Any,
-    ) -> None:
-        # pylint: disable=import-outside-toplevel
-        from superset import db
-        from superset.models.core import Log
-
-        records = kwargs.get("records", [])
-        logs = []
+        records: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Return the column values of the `Log` rows of the given records.
+        """
+        dttm = datetime.utcnow()
+        mappings = []
         for record in records:
             json_string: str | None
             try:
                 json_string = json.dumps(record)
             except Exception:  # pylint: disable=broad-except
                 json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id or record.get("dashboard_id"),
-                slice_id=slice_id or record.get("slice_id"),
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
+            mappings.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id or record.get("dashboard_id"),
+                    "slice_id": slice_id or record.get("slice_id"),
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                    "dttm": dttm,
+                }
             )
-            logs.append(log)
+        return mappings
+
+    @staticmethod
+    def save_logs(mappings: list[dict[str, Any]]) -> bool:
+        """
+        Insert `Log` rows into the metadata database.
+
+        :param mappings: The column values of the rows
+        :returns: Whether the rows were committed
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
         try:
-            db.session.bulk_save_objects(logs)
+            db.session.bulk_insert_mappings(Log, mappings)
             db.session.commit()  # pylint: disable=consider-using-transaction
         except SQLAlchemyError as ex:
+            db.session.rollback()
             logging.error("DBEventLogger failed to log event(s)")
             logging.exception(ex)
+            return False
+        return True
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self.save_logs(
+            self.get_log_mappings(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                kwargs.get("records", []),
+            )
+        )
+
+
+class BufferedDBEventLogger(DBEventLogger):
+    """
+    Event logger that commits logs to Superset DB in batches from a background
+    thread, keeping the writes to the metadata database out of the requests.
+
+    Logs are queued in process and written once `batch_size` of them are pending,
+    or at least every `flush_interval` seconds. When `max_queue_size` logs are
+    already pending, new logs are dropped and counted rather than blocking the
+    request. The pending logs are written when the process exits.
+    """
+
+    # `None` is queued to wake the background thread up when shutting down
+    _queue: queue.Queue[dict[str, Any] | None]
+    _thread: threading.Thread | None
+    _app: Flask | None
+    _stopped: threading.Event
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 5,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._reset()
+        atexit.register(self.shutdown)
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        # logs queued before forking are written by the parent process
+        self._queue = queue.Queue(self.max_queue_size)
+        self._thread = None
+        self._app = None
+        self._stopped = threading.Event()
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        mappings = self.get_log_mappings(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        )
+        if self._stopped.is_set():
+            self.save_logs(mappings)
+            return
+
+        for mapping in mappings:
+            try:
+                self._queue.put_nowait(mapping)
+            except queue.Full:
+                self.dropped += 1
+                stats_logger_manager.instance.incr("event_logger.dropped")
+        self._start()
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._app = current_app._get_current_object()  # pylint: disable=protected-access
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="event-logger",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            if batch := self._get_batch(timeout=self.flush_interval):
+                self._write(batch)
+
+    def _get_batch(self, timeout: float) -> list[dict[str, Any]]:
+        """
+        Dequeue up to `batch_size` logs, waiting at most `timeout` seconds for them.
+        """
+        batch: list[dict[str, Any]] = []
+        deadline = time.monotonic() + timeout
+        while len(batch) < self.batch_size:
+            try:
+                mapping = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if mapping is None:
+                break
+            batch.append(mapping)
+        return batch
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        if self._app is None:
+            return
+
+        with self._app.app_context():
+            try:
+                saved = self.save_logs(batch)
+            except Exception:  # pylint: disable=broad-except
+                # drop the batch rather than stopping the background thread
+                logger.exception("Failed to write %i event logs", len(batch))
+                saved = False
+            if not saved:
+                self.failed += len(batch)
+                stats_logger_manager.instance.incr("event_logger.failed")
+            stats_logger_manager.instance.gauge(
+                "event_logger.queue_size", self._queue.qsize()
+            )
+
+    def flush(self) -> None:
+        """
+        Write all the pending logs.
+        """
+        while batch := self._get_batch(timeout=0):
+            self._write(batch)
+
+    def shutdown(self) -> None:
+        """
+        Stop the background thread and write the pending logs; logs are written
+        synchronously from then on.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            with contextlib.suppress(queue.Full):
+                self._queue.put_nowait(None)
+            self._thread.join(timeout=self.flush_interval)
+            if self._thread.is_alive():
+                logger.warning(
+                    "The event logger thread didn't stop within %s seconds, writing "
+                    "the pending logs from the current thread",
+                    self.flush_interval,
+                )
+        self.flush()
 
 
 class StdOutEventLogger(AbstractEventLogger):
@@ -0,0 +1,180 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Columnar sanitization of dataframes before they are serialized.
+
+The functions in this module operate on whole columns so that the checks are
+vectorized, and return columns whose dtype makes a check impossible (e.g. escaping
+a float column) unchanged, without inspecting their values.
+"""
+
+import re
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from numpy.typing import NDArray
+
+negative_number_re = re.compile(r"^-[0-9.]+$")
+
+# This regex will match if the string starts with:
+#
+#     1. one of -, @, +, |, =, %
+#     2. two double quotes immediately followed by one of -, @, +, |, =, %
+#     3. one or more spaces immediately followed by one of -, @, +, |, =, %
+#
+problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
+
+# Values starting with one of these characters are interpreted as formulas by
+# spreadsheet software.
+formula_prefixes_re = re.compile(r"^[=+\-@]")
+
+# RE2 equivalents of the patterns above, used to match string columns with Arrow.
+# RE2 doesn't support lookaheads, and its `\s` only matches ASCII whitespace so the
+# whitespace characters matched by Python are listed explicitly.
+RE2_PATTERNS = {
+    negative_number_re: negative_number_re.pattern,
+    problematic_chars_re: r'^(?:"{2}|[\t\n\x0b\f\r\x1c-\x1f\x85\p{Z}]+)?[\-@+|=%]',
+    formula_prefixes_re: formula_prefixes_re.pattern,
+}
+
+
+def _can_hold_strings(column: pd.Series) -> bool:
+    return column.dtype == np.dtype(object) or pd.api.types.is_string_dtype(
+        column.dtype
+    )
+
+
+def _match(column: pd.Series, pattern: re.Pattern[str]) -> NDArray[np.bool_]:
+    """
+    Return a boolean mask of the string values of a column matching a pattern.
+
+    Columns holding only strings are matched by Arrow, other columns value by value.
+    """
+    if pd.api.types.infer_dtype(column, skipna=True) == "string":
+        array = pa.array(column, type=pa.string(), from_pandas=True)
+        matches = pc.match_substring_regex(array, RE2_PATTERNS[pattern])
+        return matches.fill_null(False).to_numpy(zero_copy_only=False)
+
+    return np.array(
+        [isinstance(value, str) and bool(pattern.match(value)) for value in column],
+        dtype=bool,
+    )
+
+
+def _stringify(column: pd.Series, mask: pd.Series | NDArray[np.bool_]) -> pd.Series:
+    """
+    Convert the values of a column selected by a mask to strings.
+    """
+    if not mask.any():
+        return column
+
+    column = column.astype(object)
+    column[mask] = column[mask].map(str)
+    return column
+
+
+def escape_formulas(column: pd.Series) -> pd.Series:
+    """
+    Escape the string values of a column that could be interpreted as formulas, see
+    `csv.escape_value`.
+    """
+    if not _can_hold_strings(column):
+        return column
+
+    needs_escaping = _match(column, problematic_chars_re)
+    if not needs_escaping.any():
+        return column
+
+    needs_escaping &= ~_match(column, negative_number_re)
+    if not needs_escaping.any():
+        return column
+
+    column = column.copy()
+    column[needs_escaping] = [
+        "'" + value.replace("|", "\\|") for value in column[needs_escaping]
+    ]
+    return column
+
+
+def quote_formulas(column: pd.Series) -> pd.Series:
+    """
+    Precede the string values of a column starting with a formula prefix with a
+    single quote.
+    """
+    if not _can_hold_strings(column):
+        return column
+
+    needs_quoting = _match(column, formula_prefixes_re)
+    if not needs_quoting.any():
+        return column
+
+    column = column.copy()
+    column[needs_quoting] = ["'" + value for value in column[needs_quoting]]
+    return column
+
+
+def stringify_large_numbers(
+    column: pd.Series,
+    limit: int,
+    include_floats: bool = False,
+) -> pd.Series:
+    """
+    Cast the numbers of a column whose absolute value is larger than `limit` to
+    strings.
+
+    Numeric columns are checked vectorized. Object columns may hold integers that
+    don't fit in 64 bits, so the ones holding numbers are checked value by value.
+
+    :param column: The column to process
+    :param limit: The largest absolute value that is kept as a number
+    :param include_floats: Whether floats should be cast as well
+    :returns: The column, recast to an object column if any number was cast
+    """
+    dtype = column.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return column
+
+    if pd.api.types.is_integer_dtype(dtype) or (
+        include_floats and pd.api.types.is_float_dtype(dtype)
+    ):
+        # compare against both bounds since `abs` overflows on the minimum integer
+        return _stringify(column, ((column > limit) | (column < -limit)).fillna(False))
+
+    if dtype == np.dtype(object):
+        inferred_types = {"integer", "mixed-integer", "mixed-integer-float", "mixed"}
+        if include_floats:
+            inferred_types.add("floating")
+        if pd.api.types.infer_dtype(column, skipna=True) not in inferred_types:
+            return column
+
+        types: tuple[type, ...] = (
+            (int, float, np.number) if include_floats else (int, np.integer)
+        )
+
+        def is_large_number(value: Any) -> bool:
+            if isinstance(value, bool) or not isinstance(value, types):
+                return False
+            return abs(cast(Any, value)) > limit
+
+        return _stringify(
+            column, np.array([is_large_number(value) for value in column], dtype=bool)
+        )
+
+    return column
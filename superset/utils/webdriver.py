@@ -17,11 +17,17 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
+from functools import partial
 from time import sleep
-from typing import TYPE_CHECKING
+from typing import Any, Callable, Generic, TYPE_CHECKING, TypeVar
 
 from flask import current_app
 from packaging import version
@@ -40,16 +46,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from superset import feature_flag_manager
 from superset.extensions import machine_auth_provider_factory
+from superset.utils.concurrency import with_app_context
 from superset.utils.retries import retry_call
 
 WindowSize = tuple[int, int]
 logger = logging.getLogger(__name__)
 
+B = TypeVar("B")
+R = TypeVar("R")
+
 if TYPE_CHECKING:
     from flask_appbuilder.security.sqla.models import User
 
 if feature_flag_manager.is_feature_enabled("PLAYWRIGHT_REPORTS_AND_THUMBNAILS"):
     from playwright.sync_api import (
+        Browser,
         BrowserContext,
         Error as PlaywrightError,
         Locator,
@@ -70,6 +81,141 @@ class ChartStandaloneMode(Enum):
     SHOW_NAV = 0
 
 
+class BrowserPool(Generic[B]):
+    """
+    A pool of browsers kept warm across screenshots, to avoid paying the start-up of a
+    browser for each of them.
+
+    Up to `size` idle browsers are kept. A browser is recycled after `max_uses`
+    screenshots, or when a screenshot fails, since the browser may have crashed.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[], B],
+        destroy: Callable[[B], None],
+        size: int,
+        max_uses: int,
+    ):
+        self._create = create
+        self._destroy = destroy
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: list[tuple[B, int]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Iterator[B]:
+        with self._lock:
+            browser, uses = self._idle.pop() if self._idle else (None, 0)
+
+        if browser is None:
+            logger.debug("Starting a browser for the pool")
+            browser = self._create()
+
+        try:
+            yield browser
+        except BaseException:
+            self.destroy(browser)
+            raise
+
+        uses += 1
+        with self._lock:
+            if uses < self.max_uses and len(self._idle) < self.size:
+                self._idle.append((browser, uses))
+                return
+
+        self.destroy(browser)
+
+    def destroy(self, browser: B) -> None:
+        try:
+            self._destroy(browser)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Failed to close a pooled browser", exc_info=True)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+
+        for browser, _ in idle:
+            self.destroy(browser)
+
+
+_browser_pools: dict[str, BrowserPool[Any]] = {}
+_browser_pools_lock = threading.Lock()
+
+
+def get_browser_pool(
+    name: str,
+    create: Callable[[], B],
+    destroy: Callable[[B], None],
+) -> BrowserPool[B] | None:
+    """
+    Return the browser pool of the worker process for a type of browser, or None when
+    pooling is disabled.
+    """
+    if (size := current_app.config["SCREENSHOT_BROWSER_POOL_SIZE"]) <= 0:
+        return None
+
+    with _browser_pools_lock:
+        if name not in _browser_pools:
+            _browser_pools[name] = BrowserPool(
+                create,
+                destroy,
+                size,
+                current_app.config["SCREENSHOT_BROWSER_POOL_MAX_USES"],
+            )
+        return _browser_pools[name]
+
+
+@atexit.register
+def close_browser_pools() -> None:
+    with _browser_pools_lock:
+        pools = list(_browser_pools.values())
+        _browser_pools.clear()
+
+    for pool in pools:
+        pool.close()
+
+
+class PlaywrightBrowser:
+    """
+    A Chromium browser kept alive across screenshots.
+
+    The sync API of Playwright can only be used from the thread that started it, so
+    the browser is started and driven from a thread of its own.
+    """
+
+    def __init__(self, args: list[str]):
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="playwright",
+        )
+        self._playwright, self._browser = self._executor.submit(
+            self._launch, args
+        ).result()
+
+    @staticmethod
+    def _launch(args: list[str]) -> tuple[Any, Browser]:
+        playwright = sync_playwright().start()
+        try:
+            return playwright, playwright.chromium.launch(args=args)
+        except Exception:
+            playwright.stop()
+            raise
+
+    def run(self, func: Callable[[Browser], R]) -> R:
+        """Call a function with the browser, in the thread of the browser"""
+        return self._executor.submit(with_app_context(func), self._browser).result()
+
+    def close(self) -> None:
+        try:
+            self._executor.submit(self._browser.close).result()
+            self._executor.submit(self._playwright.stop).result()
+        finally:
+            self._executor.shutdown(wait=False)
+
+
 # pylint: disable=too-few-public-methods
 class WebDriverProxy(ABC):
     def __init__(self, driver_type: str, window: WindowSize | None = None):
@@ -136,26 +282,46 @@ class WebDriverPlaywright(WebDriverProxy):
 
         return error_messages
 
-    def get_screenshot(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
-        self, url: str, element_name: str, user: User
-    ) -> bytes | None:
-        with sync_playwright() as playwright:
-            browser_args = current_app.config["WEBDRIVER_OPTION_ARGS"]
-            browser = playwright.chromium.launch(args=browser_args)
-            pixel_density = current_app.config["WEBDRIVER_WINDOW"].get(
-                "pixel_density", 1
-            )
-            context = browser.new_context(
-                bypass_csp=True,
-                viewport={
-                    "height": self._window[1],
-                    "width": self._window[0],
-                },
-                device_scale_factor=pixel_density,
-            )
-            context.set_default_timeout(
-                current_app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
+        browser_args = current_app.config["WEBDRIVER_OPTION_ARGS"]
+        pool = get_browser_pool(
+            "playwright",
+            partial(PlaywrightBrowser, browser_args),
+            PlaywrightBrowser.close,
+        )
+        if pool is None:
+            with sync_playwright() as playwright:
+                browser = playwright.chromium.launch(args=browser_args)
+                return self.take_screenshot(browser, url, element_name, user)
+
+        with pool.acquire() as pooled_browser:
+            return pooled_browser.run(
+                partial(
+                    self.take_screenshot,
+                    url=url,
+                    element_name=element_name,
+                    user=user,
+                )
             )
+
+    def take_screenshot(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
+        self, browser: Browser, url: str, element_name: str, user: User
+    ) -> bytes | None:
+        pixel_density = current_app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
+        # each screenshot gets a fresh context, so that pooled browsers don't share
+        # the cookies and the storage of different users
+        context = browser.new_context(
+            bypass_csp=True,
+            viewport={
+                "height": self._window[1],
+                "width": self._window[0],
+            },
+            device_scale_factor=pixel_density,
+        )
+        context.set_default_timeout(
+            current_app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+        )
+        try:
             self.auth(user, context)
             page = context.new_page()
             try:
@@ -242,6 +408,8 @@ class WebDriverPlaywright(WebDriverProxy):
                     "Encountered an unexpected error when requesting url %s", url
                 )
             return img
+        finally:
+            context.close()
 
 
 class WebDriverSelenium(WebDriverProxy):
@@ -383,8 +551,36 @@ class WebDriverSelenium(WebDriverProxy):
 
         return error_messages
 
-    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:  # noqa: C901
-        driver = self.auth(user)
+    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
+        pool = get_browser_pool(
+            self._driver_type,
+            self.create,
+            partial(
+                self.destroy,
+                tries=current_app.config["SCREENSHOT_SELENIUM_RETRIES"],
+            ),
+        )
+        if pool is None:
+            driver = self.auth(user)
+            try:
+                return self.take_screenshot(driver, url, element_name, user)
+            finally:
+                self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
+
+        with pool.acquire() as driver:
+            # don't leak the session of the previous user of the driver, the storage
+            # is cleared on the page the previous screenshot was taken on, if any
+            driver.delete_all_cookies()
+            if driver.current_url.startswith("http"):
+                driver.execute_script(
+                    "window.localStorage.clear(); window.sessionStorage.clear();"
+                )
+            machine_auth_provider_factory.instance.authenticate_webdriver(driver, user)
+            return self.take_screenshot(driver, url, element_name, user)
+
+    def take_screenshot(  # noqa: C901
+        self, driver: WebDriver, url: str, element_name: str, user: User
+    ) -> bytes | None:
         driver.set_window_size(*self._window)
         driver.get(url)
         img: bytes | None = None
@@ -482,6 +678,4 @@ class WebDriverSelenium(WebDriverProxy):
                 "Encountered an unexpected error when requesting url %s", url
             )
             raise
-        finally:
-            self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
         return img
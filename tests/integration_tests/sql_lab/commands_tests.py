@@ -18,6 +18,7 @@ from unittest import mock
 from unittest.mock import Mock, patch
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 from flask_babel import gettext as __
 
@@ -35,6 +36,7 @@ from superset.models.core import Database  # noqa: F401
 from superset.models.sql_lab import Query
 from superset.sqllab.limiting_factor import LimitingFactor
 from superset.sqllab.schemas import EstimateQueryCostSchema
+from superset.sqllab.utils import write_ipc_buffer
 from superset.utils import core as utils
 from superset.utils.database import get_example_database
 from tests.integration_tests.base_tests import SupersetTestCase
@@ -244,6 +246,35 @@ class TestSqlResultExportCommand(SupersetTestCase):
         assert result["count"] == 5
         assert result["query"].client_id == "test"
 
+    @pytest.mark.usefixtures("create_database_and_query")
+    @patch("superset.models.sql_lab.Query.raise_for_access", lambda _: None)
+    @patch("superset.commands.sql_lab.export.results_backend_use_msgpack", True)
+    @patch.dict(
+        "superset.commands.sql_lab.export.config",
+        {"CSV_EXPORT_STREAMING_CHUNK_SIZE": 2},
+    )
+    def test_run_with_results_backend_streaming(self) -> None:
+        command = export.SqlResultExportCommand("test")
+
+        payload = {
+            "columns": [{"name": "foo"}],
+            "data": write_ipc_buffer(
+                pa.table({"foo": list(range(5))}),
+                max_chunksize=3,
+            ).to_pybytes(),
+        }
+        serialized_payload = sql_lab._serialize_payload(payload, True)
+        compressed = utils.zlib_compress(serialized_payload)
+
+        export.results_backend = mock.Mock()
+        export.results_backend.get.return_value = compressed
+
+        result = command.run()
+
+        assert list(result["data"]) == ["foo\n0\n1\n", "2\n", "3\n4\n"]
+        assert result["count"] == 5
+        assert result["query"].client_id == "test"
+
 
 class TestSqlExecutionResultsCommand(SupersetTestCase):
     @pytest.fixture
@@ -14,6 +14,8 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import threading
+import time
 from unittest import mock
 from unittest.mock import ANY, Mock
 
@@ -25,6 +27,7 @@ from superset import security_manager
 from superset.async_events.async_query_manager import (
     AsyncQueryManager,
     AsyncQueryTokenException,
+    StreamListener,
 )
 from superset.async_events.cache_backend import (
     RedisCacheBackend,
@@ -166,3 +169,105 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+def test_update_job_pipelines_events(async_query_manager):
+    cache_backend = mock.Mock(spec=RedisCacheBackend)
+    async_query_manager._cache = cache_backend
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._stream_limit = 1000
+    async_query_manager._stream_limit_firehose = 1000000
+
+    async_query_manager.update_job(
+        {"channel_id": "test_channel_id", "job_id": "test_job_id"},
+        "done",
+    )
+
+    event_data = {
+        "data": '{"channel_id": "test_channel_id", "job_id": "test_job_id", '
+        '"status": "done"}'
+    }
+    cache_backend.xadd_many.assert_called_once_with(
+        [
+            ("async-events-test_channel_id", event_data, 1000),
+            ("async-events-full", event_data, 1000000),
+        ]
+    )
+    cache_backend.xadd.assert_not_called()
+
+
+def test_wait_for_events(async_query_manager):
+    """
+    Wait for events, and return them as soon as they are read.
+    """
+    cache_backend = mock.Mock(spec=RedisCacheBackend)
+    event = (b"1607477697866-0", {b"data": b'{"job_id": "test_job_id"}'})
+    cache_backend.xrange.side_effect = [[], [event]]
+    async_query_manager._cache = cache_backend
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._long_polling_timeout = 10
+    async_query_manager._long_polling_slots = threading.BoundedSemaphore(1)
+
+    assert async_query_manager.wait_for_events(
+        "test_channel_id",
+        "1607477697865-0",
+        60,
+    ) == [{"id": "1607477697866-0", "job_id": "test_job_id"}]
+    cache_backend.xread.assert_called_once_with(
+        "async-events-test_channel_id",
+        "1607477697865-0",
+        ANY,
+    )
+    assert 0 < cache_backend.xread.call_args.args[2] <= 10000
+
+
+def test_wait_for_events_max_connections(async_query_manager):
+    """
+    Requests return right away once all the long polling slots are taken.
+    """
+    cache_backend = mock.Mock(spec=RedisCacheBackend)
+    cache_backend.xrange.return_value = []
+    async_query_manager._cache = cache_backend
+    async_query_manager._long_polling_timeout = 10
+    async_query_manager._long_polling_slots = threading.BoundedSemaphore(1)
+    async_query_manager._long_polling_slots.acquire()
+
+    assert async_query_manager.wait_for_events("test_channel_id", None, 10) == []
+    cache_backend.xrange.assert_called_once()
+    cache_backend.xread.assert_not_called()
+
+
+def test_stream_listener_fan_out():
+    """
+    Waiters on the same stream share a single blocking read.
+    """
+    listener = StreamListener()
+    reading = threading.Event()
+    release = threading.Event()
+    reads = []
+
+    def read(stream_name: str, last_id: str, block: int) -> None:
+        reads.append((stream_name, last_id))
+        reading.set()
+        release.wait(5)
+
+    leader = threading.Thread(
+        target=listener.wait,
+        args=("stream", "1-0", 5, read),
+    )
+    leader.start()
+    assert reading.wait(5)
+
+    follower = threading.Thread(
+        target=listener.wait,
+        args=("stream", "2-0", 5, read),
+    )
+    follower.start()
+    while listener._streams["stream"].waiters < 2:
+        time.sleep(0.01)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert reads == [("stream", "1-0")]
+    assert listener._streams == {}
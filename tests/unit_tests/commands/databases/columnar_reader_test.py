@@ -171,6 +171,34 @@ def test_columnar_reader_invalid_file():
     )
 
 
+def test_columnar_reader_file_to_dataframes():
+    reader = ColumnarReader(
+        options=ColumnarReaderOptions(columns_read=["Name", "Age"]),
+    )
+    dfs = list(
+        reader.file_to_dataframes(create_columnar_file(COLUMNAR_DATA), 2),
+    )
+    assert [df.columns.tolist() for df in dfs] == [["Name", "Age"], ["Name", "Age"]]
+    assert [df.values.tolist() for df in dfs] == [
+        [["name1", 30], ["name2", 25]],
+        [["name3", 20]],
+    ]
+
+
+def test_columnar_reader_file_to_dataframes_empty():
+    reader = ColumnarReader(
+        options=ColumnarReaderOptions(columns_read=["Name", "Age"]),
+    )
+    dfs = list(
+        reader.file_to_dataframes(
+            create_columnar_file({column: [] for column in COLUMNAR_DATA}), 2
+        ),
+    )
+    assert len(dfs) == 1
+    assert dfs[0].columns.tolist() == ["Name", "Age"]
+    assert dfs[0].empty
+
+
 def test_columnar_reader_zip():
     reader = ColumnarReader(
         options=ColumnarReaderOptions(),
@@ -266,6 +266,17 @@ def test_csv_reader_file_to_dataframe(file, options, expected_cols, expected_val
     file.close()
 
 
+def test_csv_reader_file_to_dataframes():
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(columns_read=["Name", "Age"]),
+    )
+    dfs = list(csv_reader.file_to_dataframes(create_csv_file(CSV_DATA), 2))
+    assert [df.values.tolist() for df in dfs] == [
+        [["name1", 30], ["name2", 25]],
+        [["name3", 20]],
+    ]
+
+
 def test_csv_reader_index_column():
     csv_reader = CSVReader(
         options=CSVReaderOptions(index_column="Name"),
@@ -17,6 +17,7 @@
 
 import json
 from datetime import datetime
+from typing import Any
 from unittest.mock import patch
 from uuid import UUID
 
@@ -25,6 +26,7 @@ from pytest_mock import MockerFixture
 
 from superset.app import SupersetApp
 from superset.commands.exceptions import UpdateFailedError
+from superset.commands.report.exceptions import ReportScheduleCsvFailedError
 from superset.commands.report.execute import BaseReportState
 from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.reports.models import (
@@ -557,3 +559,104 @@ def test_update_recipient_to_slack_v2_missing_channels(mocker: MockerFixture):
     )
     with pytest.raises(UpdateFailedError):
         mock_cmmd.update_report_schedule_slack_v2()
+
+
+def mock_chart_data(mocker: MockerFixture, queries: list[dict[str, Any]]) -> Any:
+    """Mock the in-process chart data of the report chart."""
+    mocker.patch.dict(
+        "superset.commands.report.execute.app.config",
+        {"ALERT_REPORTS_CHART_DATA_IN_PROCESS": True},
+    )
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+    security_manager = mocker.patch(
+        "superset.commands.report.execute.security_manager", new=mocker.MagicMock()
+    )
+    security_manager.find_user.return_value = mocker.MagicMock()
+    security_manager.can_access.return_value = True
+    chart = mocker.patch("superset.commands.report.execute.ChartDAO").find_by_id()
+    chart.query_context = json.dumps({"datasource": {"id": 1, "type": "table"}})
+    chart.params = json.dumps({"viz_type": "table"})
+    mocker.patch("superset.commands.report.execute.ChartDataQueryContextSchema")
+    mocker.patch(
+        "superset.commands.report.execute.apply_client_processing",
+        side_effect=lambda result, form_data, datasource: result,
+    )
+    command = mocker.patch("superset.commands.report.execute.ChartDataCommand")
+    command.return_value.run.return_value = {"queries": queries}
+    get_chart_csv_data = mocker.patch(
+        "superset.commands.report.execute.get_chart_csv_data"
+    )
+    return command, get_chart_csv_data
+
+
+def test_get_csv_data_in_process(mocker: MockerFixture) -> None:
+    """
+    Test that the CSV of a chart report is built in the worker.
+    """
+    command, get_chart_csv_data = mock_chart_data(
+        mocker,
+        [{"result_format": "csv", "data": iter(["a,b\n", "1,2\n"])}],
+    )
+    report_state = BaseReportState(
+        report_schedule=create_report_schedule(mocker),
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+
+    assert report_state._get_csv_data() == b"a,b\n1,2\n"
+    command.return_value.validate.assert_called_once()
+    get_chart_csv_data.assert_not_called()
+
+
+def test_get_csv_data_in_process_forbidden(mocker: MockerFixture) -> None:
+    """
+    Test that the report executor needs to be allowed to read charts.
+    """
+    command, _ = mock_chart_data(mocker, [])
+    security_manager = mocker.patch("superset.commands.report.execute.security_manager")
+
+    def can_access(permission_name: str, view_name: str) -> bool:
+        return (permission_name, view_name) != ("can_read", "Chart")
+
+    security_manager.can_access.side_effect = can_access
+    report_state = BaseReportState(
+        report_schedule=create_report_schedule(mocker),
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+
+    with pytest.raises(ReportScheduleCsvFailedError, match="access to this chart"):
+        report_state._get_csv_data()
+    command.assert_not_called()
+
+
+def test_get_embedded_data_in_process(mocker: MockerFixture) -> None:
+    """
+    Test that the data of a text chart report is built in the worker.
+    """
+    mock_chart_data(
+        mocker,
+        [
+            {
+                "result_format": "json",
+                "data": {"a": {0: "x", 1: "y"}, "b__sum": {0: 1, 1: 2}},
+                "colnames": [("a",), ("b__sum",)],
+                "indexnames": [0, 1],
+                "coltypes": [1, 0],
+            }
+        ],
+    )
+    report_state = BaseReportState(
+        report_schedule=create_report_schedule(mocker),
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+
+    df = report_state._get_embedded_data()
+    assert df.to_dict() == {
+        ("a",): {(0,): "x", (1,): "y"},
+        ("b__sum",): {(0,): 1, (1,): 2},
+    }
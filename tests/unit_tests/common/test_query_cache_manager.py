@@ -0,0 +1,177 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pickle
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_manager import (
+    deserialize_df,
+    QueryCacheManager,
+    serialize_df,
+)
+from superset.constants import CacheRegion
+from tests.conftest import with_config
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "__timestamp": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+            "name": ["a", None, "c"],
+            "count": [1, 2, 3],
+            "ratio": [0.5, None, 1.5],
+            "flag": [True, False, None],
+        }
+    )
+
+
+def test_serialize_df_arrow(df: pd.DataFrame) -> None:
+    value = serialize_df(df)
+
+    assert set(value) == {"df_arrow"}
+    assert isinstance(value["df_arrow"], bytes)
+    pd.testing.assert_frame_equal(deserialize_df(value), df)
+
+
+@with_config({"DATA_CACHE_ARROW_COMPRESSION": None})
+def test_serialize_df_arrow_uncompressed(df: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(deserialize_df(serialize_df(df)), df)
+
+
+def test_serialize_df_arrow_nullable_int() -> None:
+    """
+    Integer columns with nulls are kept as objects, without losing precision.
+    """
+    df = pd.DataFrame(
+        {
+            "id": pd.Series([1, None, 2**60 + 1], dtype=object),
+            "count": [1, 2, 3],
+        }
+    )
+    value = serialize_df(df)
+
+    assert set(value) == {"df_arrow"}
+    result = deserialize_df(value)
+    pd.testing.assert_frame_equal(result, df)
+    assert result["id"].tolist() == [1, None, 2**60 + 1]
+
+
+@with_config({"DATA_CACHE_ARROW_SERIALIZATION": False})
+def test_serialize_df_disabled(df: pd.DataFrame) -> None:
+    assert serialize_df(df) == {"df": df}
+
+
+@pytest.mark.parametrize(
+    "unsupported_df",
+    [
+        pd.DataFrame({"a": [[1, 2], [3]]}),
+        pd.DataFrame({"a": [{"x": 1}, {"x": 2}]}),
+        pd.DataFrame({"a": [1, "x"]}),
+        pd.DataFrame({0: [1, 2]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({"a": pd.Series([1, 2], dtype=object)}),
+        pd.DataFrame({"a": pd.Series([0.5, None], dtype=object)}),
+        pd.DataFrame({"a": pd.Series(pd.to_datetime(["2024-01-01"]), dtype=object)}),
+    ],
+)
+def test_serialize_df_fallback(unsupported_df: pd.DataFrame) -> None:
+    value = serialize_df(unsupported_df)
+
+    assert set(value) == {"df"}
+    assert deserialize_df(value) is unsupported_df
+
+
+def test_deserialize_df_legacy_value(df: pd.DataFrame) -> None:
+    """
+    Entries written before Arrow serialization store the pickled dataframe.
+    """
+    legacy_value = pickle.loads(  # noqa: S301
+        pickle.dumps({"df": df, "query": "SELECT 1"})
+    )
+
+    pd.testing.assert_frame_equal(deserialize_df(legacy_value), df)
+
+
+def test_set_and_get_query_result(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    cache = MagicMock()
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    set_and_log_cache = mocker.patch(
+        "superset.common.utils.query_cache_manager.set_and_log_cache"
+    )
+
+    query_result = MagicMock(
+        status=QueryStatus.SUCCESS,
+        query="SELECT 1",
+        applied_template_filters=[],
+        applied_filter_columns=[],
+        rejected_filter_columns=[],
+        error_message=None,
+        df=df,
+        sql_rowcount=3,
+    )
+    QueryCacheManager().set_query_result(
+        key="key",
+        query_result=query_result,
+        region=CacheRegion.DATA,
+    )
+
+    stored_value = set_and_log_cache.call_args[0][2]
+    assert "df" not in stored_value
+    assert stored_value["query"] == "SELECT 1"
+
+    cache.get.return_value = {**stored_value, "dttm": "2024-01-01T00:00:00"}
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+
+    assert query_cache.is_loaded
+    assert query_cache.sql_rowcount == 3
+    pd.testing.assert_frame_equal(query_cache.df, df)
+
+
+def test_get_query_result_fallback_key(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    """
+    Results missing under the key are looked up under the fallback key.
+    """
+    cache = MagicMock()
+    cache.get.side_effect = {
+        "legacy_key": {
+            **serialize_df(df),
+            "query": "SELECT 1",
+            "dttm": "2024-01-01T00:00:00",
+        }
+    }.get
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+
+    query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+    assert not query_cache.is_loaded
+
+    query_cache = QueryCacheManager.get(
+        "key", CacheRegion.DATA, fallback_key="legacy_key"
+    )
+    assert query_cache.is_loaded
+    assert query_cache.query == "SELECT 1"
+    pd.testing.assert_frame_equal(query_cache.df, df)
@@ -21,7 +21,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context_processor import QueryContextProcessor
 from superset.utils.core import GenericDataType
 
@@ -70,6 +70,26 @@ def test_get_data_csv(mock_df_to_escaped_csv, processor, mock_query_context):
     mock_df_to_escaped_csv.assert_called_once_with(df, index=False, encoding="utf-8")
 
 
+def test_get_data_csv_streaming(processor, mock_query_context, mocker):
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CSV_EXPORT_STREAMING_CHUNK_SIZE": 2},
+    )
+    df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "=b", "c"]})
+    coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
+    mock_query_context.result_format = ChartDataResultFormat.CSV
+    mock_query_context.result_type = ChartDataResultType.FULL
+    mock_query_context.queries = [MagicMock()]
+
+    result = processor.get_data(df, coltypes)
+
+    assert not isinstance(result, str)
+    assert list(result) == [
+        "Column 1,Column 2\n1,a\n2,'=b\n",
+        "3,c\n",
+    ]
+
+
 @patch("superset.common.query_context_processor.excel.df_to_excel")
 @patch("superset.common.query_context_processor.excel.apply_column_types")
 def test_get_data_xlsx(
@@ -236,3 +256,66 @@ def test_get_data_xlsx_apply_column_types_error(
     mock_query_context.result_format = ChartDataResultFormat.XLSX
     with pytest.raises(ValueError, match="Conversion error"):
         processor.get_data(df, coltypes)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@patch("superset.common.query_context_processor.get_query_results")
+def test_get_payload(
+    mock_get_query_results, max_workers, processor, mock_query_context, mocker
+):
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_QUERY_MAX_WORKERS": max_workers},
+    )
+    mock_query_context.queries = [
+        MagicMock(result_type=None, id=idx) for idx in range(3)
+    ]
+    mock_get_query_results.side_effect = lambda _, __, query_obj, ___: {
+        "data": [{"id": query_obj.id}]
+    }
+
+    payload = processor.get_payload()
+
+    assert [query["data"] for query in payload["queries"]] == [
+        [{"id": 0}],
+        [{"id": 1}],
+        [{"id": 2}],
+    ]
+    assert all(query["duration_ms"] >= 0 for query in payload["queries"])
+
+
+@pytest.mark.parametrize(
+    "max_workers, queries, expected",
+    [(1, 3, None), (4, 1, None), (4, 2, 2), (4, 3, 1), (4, 8, 1), (8, 3, 2)],
+)
+@patch("superset.common.query_context_processor.get_query_results")
+def test_get_payload_time_offset_max_workers(
+    mock_get_query_results,
+    max_workers,
+    queries,
+    expected,
+    processor,
+    mock_query_context,
+    mocker,
+):
+    """
+    The workers are split between the query objects and their time offset queries.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_QUERY_MAX_WORKERS": max_workers},
+    )
+    mock_query_context.queries = [
+        MagicMock(result_type=None, id=idx) for idx in range(queries)
+    ]
+    time_offset_max_workers = set()
+
+    def get_query_results(*args):
+        time_offset_max_workers.add(processor._time_offset_max_workers)
+        return {"data": []}
+
+    mock_get_query_results.side_effect = get_query_results
+
+    processor.get_payload()
+
+    assert time_offset_max_workers == {expected}
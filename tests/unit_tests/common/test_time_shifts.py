@@ -14,13 +14,17 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from pandas import DataFrame, Series, Timestamp
-from pandas.testing import assert_frame_equal
+from unittest.mock import MagicMock
+
+from pandas import DataFrame, date_range, Series, Timestamp
+from pandas.testing import assert_frame_equal, assert_series_equal
 from pytest import fixture, mark  # noqa: PT013
+from pytest_mock import MockerFixture
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
 from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import TimeGrain
 
@@ -185,3 +189,121 @@ def test_join_offset_dfs_with_month_granularity():
     )
 
     assert_frame_equal(expected, result)
+
+
+@mark.parametrize(
+    "time_grain",
+    [
+        TimeGrain.WEEK,
+        TimeGrain.WEEK_STARTING_SUNDAY,
+        TimeGrain.WEEK_ENDING_SUNDAY,
+        TimeGrain.MONTH,
+        TimeGrain.QUARTER,
+        TimeGrain.YEAR,
+    ],
+)
+@mark.parametrize("time_offset", [None, "1 year ago", "3 months later"])
+def test_generate_join_column_series(time_grain: str, time_offset: str | None):
+    """
+    The vectorized join column matches the join column generated row by row.
+    """
+    df = DataFrame({"ds": date_range("2019-12-25", periods=60, freq="W")})
+
+    expected = df.apply(
+        lambda row: QueryContextProcessor.generate_join_column(
+            row, 0, time_grain, time_offset
+        ),
+        axis=1,
+    )
+    result = QueryContextProcessor.generate_join_column_series(
+        df["ds"], time_grain, time_offset
+    )
+
+    assert_series_equal(result, expected, check_names=False)
+
+
+def test_generate_join_column_series_unsupported():
+    dates = Series([Timestamp("2020-01-07")])
+    assert (
+        QueryContextProcessor.generate_join_column_series(dates, TimeGrain.DAY) is None
+    )
+    assert (
+        QueryContextProcessor.generate_join_column_series(
+            Series(["2020-01-07"]), TimeGrain.YEAR
+        )
+        is None
+    )
+
+
+def test_processing_time_offsets(mocker: MockerFixture):
+    """
+    Offsets found in the cache are reused, while the other ones are queried and
+    cached under their own cache key.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_QUERY_MAX_WORKERS": 4},
+    )
+    datasource = MagicMock(uid="1__table")
+    datasource.query.side_effect = lambda query_obj: MagicMock(
+        query=f"SELECT {query_obj['from_dttm'].year}",
+        df=DataFrame(
+            {
+                "ds": [Timestamp(query_obj["from_dttm"])],
+                "count": [query_obj["from_dttm"].year],
+            }
+        ),
+    )
+    processor = QueryContextProcessor(
+        MagicMock(datasource=datasource, force=False, get_cache_timeout=lambda: 60)
+    )
+    mocker.patch.object(
+        processor,
+        "query_cache_keys",
+        side_effect=lambda _, time_offset, time_grain: (f"key {time_offset}", None),
+    )
+    mocker.patch.object(processor, "normalize_df", side_effect=lambda df, _: df)
+    cached_df = DataFrame({"ds": [Timestamp("2019-01-01")], "count__1 year ago": [1]})
+    cache_get = mocker.patch(
+        "superset.common.query_context_processor.QueryCacheManager.get",
+        side_effect=lambda key, *_, **__: MagicMock(
+            is_loaded=key == "key 1 year ago", df=cached_df, query="SELECT cached"
+        ),
+    )
+    cache_set = mocker.patch(
+        "superset.common.query_context_processor.QueryCacheManager.set"
+    )
+
+    query_object = QueryObject(
+        columns=["ds"],
+        metrics=["count"],
+        time_range="2020-01-01 : 2021-01-01",
+        granularity="ds",
+        extras={"time_grain_sqla": TimeGrain.YEAR},
+        time_offsets=["2 years ago", "1 year ago", "3 years ago"],
+    )
+    df = DataFrame({"ds": [Timestamp("2020-01-01")], "count": [10]})
+
+    result = processor.processing_time_offsets(df, query_object)
+
+    assert [call.args[0] for call in cache_get.call_args_list] == [
+        "key 2 years ago",
+        "key 1 year ago",
+        "key 3 years ago",
+    ]
+    assert datasource.query.call_count == 2
+    assert sorted(call.kwargs["key"] for call in cache_set.call_args_list) == [
+        "key 2 years ago",
+        "key 3 years ago",
+    ]
+    assert result["queries"] == ["SELECT 2018", "SELECT cached", "SELECT 2017"]
+    assert result["cache_keys"] == [None, "key 1 year ago", None]
+    assert result["df"].to_dict(orient="records") == [
+        {
+            "ds": Timestamp("2020-01-01"),
+            "count": 10,
+            "count__2 years ago": 2018,
+            "count__1 year ago": 1,
+            "count__3 years ago": 2017,
+        }
+    ]
@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from datetime import datetime
+
 import pandas as pd
 import pytest
 from pytest_mock import MockerFixture
@@ -22,12 +24,14 @@ from sqlalchemy import create_engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.session import Session
 
-from superset.connectors.sqla.models import SqlaTable, TableColumn
+from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
 from superset.daos.dataset import DatasetDAO
 from superset.exceptions import OAuth2RedirectError
+from superset.jinja_context import ExtraCache
 from superset.models.core import Database
 from superset.sql_parse import Table
 from superset.superset_typing import QueryObjectDict
+from superset.utils import json
 
 
 def test_query_bubbles_errors(mocker: MockerFixture) -> None:
@@ -287,3 +291,143 @@ def test_normalize_prequery_result_type_custom_sql() -> None:
         sqla_table._normalize_prequery_result_type(row, dimension, columns_by_name)
         == "Car"
     )
+
+
+def test_has_extra_cache_key_calls(mocker: MockerFixture) -> None:
+    """
+    Test that calls to `ExtraCache` methods are detected in the query and in the
+    expressions of the dataset, the latter being memoized per dataset version.
+    """
+    sqla_table = SqlaTable(
+        id=1,
+        table_name="my_sqla_table",
+        columns=[
+            TableColumn(column_name="ds"),
+            TableColumn(column_name="user", expression="'{{ current_username() }}'"),
+        ],
+        metrics=[SqlMetric(metric_name="cnt", expression="COUNT(*)")],
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+        changed_on=datetime(2024, 1, 1),
+    )
+    mocker.patch.object(SqlaTable, "is_rls_supported", False)
+    regex = mocker.patch.object(
+        ExtraCache, "regex", mocker.MagicMock(wraps=ExtraCache.regex)
+    )
+
+    assert not sqla_table.has_extra_cache_key_calls(
+        {"columns": ["ds"], "metrics": ["cnt"]}
+    )
+    assert sqla_table.has_extra_cache_key_calls({"columns": ["user"]})
+    assert sqla_table.has_extra_cache_key_calls(
+        {"columns": ["ds"], "extras": {"where": "user = '{{ current_user_id() }}'"}}
+    )
+    assert sqla_table.has_extra_cache_key_calls(
+        {
+            "metrics": [
+                {
+                    "expressionType": "SQL",
+                    "sqlExpression": "MAX('{{ cache_key_wrapper(1) }}')",
+                    "label": "max",
+                }
+            ]
+        }
+    )
+    # the expressions of the dataset are only searched once
+    assert regex.search.call_count == 4
+
+    sqla_table.changed_on = datetime(2024, 1, 2)
+    sqla_table.metrics[0].expression = "COUNT('{{ current_username() }}')"
+    assert sqla_table.has_extra_cache_key_calls({"metrics": ["cnt"]})
+
+    # adding a metric doesn't change the dataset itself
+    sqla_table.metrics.append(
+        SqlMetric(
+            id=2,
+            metric_name="user_cnt",
+            expression="COUNT('{{ current_username() }}')",
+            changed_on=datetime(2024, 1, 3),
+        )
+    )
+    assert sqla_table.has_extra_cache_key_calls({"metrics": ["user_cnt"]})
+
+
+def test_data_for_slices(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test the dataset payload trimmed for the columns and metrics of charts.
+    """
+    from superset.models.slice import Slice
+
+    Database.metadata.create_all(session.bind)
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    dataset = SqlaTable(
+        database=database,
+        table_name="births",
+        columns=[
+            TableColumn(column_name="ds", type="DATETIME", is_dttm=True),
+            TableColumn(column_name="dttm", type="DATETIME", is_dttm=True),
+            TableColumn(column_name="name", type="VARCHAR", verbose_name="Name"),
+            TableColumn(column_name="state", type="VARCHAR"),
+            TableColumn(column_name="num", type="INTEGER"),
+        ],
+        metrics=[
+            SqlMetric(metric_name="sum__num", expression="SUM(num)"),
+            SqlMetric(metric_name="count", expression="COUNT(*)"),
+        ],
+    )
+    session.add(dataset)
+    session.flush()
+
+    slc = Slice(
+        datasource_id=dataset.id,
+        datasource_type="table",
+        params=json.dumps({"metrics": ["sum__num"], "groupby": ["state"]}),
+        query_context=json.dumps(
+            {
+                "datasource": {"id": dataset.id, "type": "table"},
+                "form_data": {"x_axis": "dttm"},
+                "queries": [
+                    {
+                        "columns": ["dttm", "name"],
+                        "granularity": "ds",
+                        "metrics": ["sum__num"],
+                    }
+                ],
+            }
+        ),
+    )
+
+    data = dataset.data_for_slices([slc])
+    assert [column["column_name"] for column in data["columns"]] == ["ds", "name"]
+    assert [metric["metric_name"] for metric in data["metrics"]] == ["sum__num"]
+    assert data["verbose_map"] == {
+        "__timestamp": "Time",
+        "sum__num": "sum__num",
+        "ds": "ds",
+        "name": "Name",
+    }
+    assert data["column_names"] == {"ds", "dttm", "name", "Name", "state", "num"}
+    assert sorted(data["column_types"]) == [0, 1, 2]
+    assert "description" not in data
+
+    # the payload is memoized per dataset version
+    get_data = mocker.spy(SqlaTable, "get_data")
+    assert dataset.data_for_slices([slc]) == data
+    get_data.assert_not_called()
+
+    # the memoized payload can't be altered by callers
+    data["columns"][0]["column_name"] = "altered"
+    data["verbose_map"].clear()
+    assert dataset.data_for_slices([slc])["columns"][0]["column_name"] != "altered"
+    assert dataset.data_for_slices([slc])["verbose_map"]
+
+    dataset.columns[2].verbose_name = "First name"
+    dataset.columns[2].changed_on = datetime(2024, 1, 1)
+    assert dataset.data_for_slices([slc])["verbose_map"]["name"] == "First name"
+
+    # charts with the query context of another dataset use their form data
+    slc.query_context = slc.query_context.replace(
+        f'"id": {dataset.id}', f'"id": {dataset.id + 1}'
+    )
+    data = dataset.data_for_slices([slc])
+    assert [column["column_name"] for column in data["columns"]] == ["state"]
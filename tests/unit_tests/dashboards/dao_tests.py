@@ -18,8 +18,11 @@
 from collections.abc import Iterator
 
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy.orm.session import Session
 
+from superset.utils import json
+
 
 @pytest.fixture
 def session_with_data(session: Session) -> Iterator[Session]:
@@ -73,3 +76,50 @@ def test_remove_favorite(session: Session) -> None:
 
     DashboardDAO.remove_favorite(dashboard)
     assert len(DashboardDAO.favorited_ids([dashboard])) == 0
+
+
+def test_datasets_trimmed_for_slices(session: Session, mocker: MockerFixture) -> None:
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    Dashboard.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    datasets = [
+        SqlaTable(
+            database=database,
+            table_name=f"table_{i}",
+            columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+        )
+        for i in range(2)
+    ]
+    session.add_all(datasets)
+    session.flush()
+    dashboard = Dashboard(
+        dashboard_title="test_dashboard",
+        slices=[
+            Slice(
+                slice_name=f"chart_{dataset.id}",
+                datasource_id=dataset.id,
+                datasource_type="table",
+                params=json.dumps({"groupby": ["a"]}),
+            )
+            for dataset in datasets
+        ],
+    )
+    session.add(dashboard)
+    session.commit()
+
+    get_datasources = mocker.spy(SqlaTable, "get_eager_sqlatable_datasources")
+    result = dashboard.datasets_trimmed_for_slices()
+
+    get_datasources.assert_called_once_with({dataset.id for dataset in datasets})
+    assert sorted(data["name"] for data in result) == ["table_0", "table_1"]
+    assert [
+        [column["column_name"] for column in data["columns"]] for data in result
+    ] == [
+        ["a"],
+        ["a"],
+    ]
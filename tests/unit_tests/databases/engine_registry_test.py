@@ -0,0 +1,199 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pytest
+from flask import current_app
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import NullPool, QueuePool
+
+from superset.databases.engine_registry import EngineRegistry
+from tests.conftest import with_config
+
+URL = make_url("sqlite://")
+
+
+@pytest.fixture
+def registry() -> EngineRegistry:
+    return EngineRegistry()
+
+
+def test_get_engine(registry: EngineRegistry) -> None:
+    """
+    Test that engines are reused for identical connection parameters.
+    """
+    engine = registry.get_engine(1, URL, {}, None)
+
+    assert isinstance(engine.pool, QueuePool)
+    assert registry.get_engine(1, URL, {}, None) is engine
+    assert registry.get_engine(2, URL, {}, None) is not engine
+    assert registry.get_engine(1, URL, {"echo": True}, None) is not engine
+    assert registry.get_engine(1, URL, {}, "alice") is not engine
+    assert registry.get_engine(1, make_url("sqlite:///test"), {}, None) is not engine
+    prequeries = ['set search_path = "a"']
+    assert registry.get_engine(1, URL, {}, None, prequeries) is not engine
+
+
+def test_get_engine_not_serializable(registry: EngineRegistry) -> None:
+    """
+    Test that engines with parameters that can't be compared aren't registered.
+    """
+    engine_kwargs = {"connect_args": {"factory": object()}}
+    engine = registry.get_engine(1, URL, engine_kwargs, None)
+
+    assert isinstance(engine.pool, NullPool)
+    assert registry.get_engine(1, URL, engine_kwargs, None) is not engine
+    assert not registry._engines
+
+
+def test_get_engine_poolclass(registry: EngineRegistry) -> None:
+    """
+    Test that a pool class set in the engine parameters is kept.
+    """
+    engine = registry.get_engine(1, URL, {"poolclass": NullPool}, None)
+
+    assert isinstance(engine.pool, NullPool)
+
+
+@with_config({"ENGINE_REGISTRY_MAX_ENGINES": 2})
+def test_get_engine_lru(mocker: MockerFixture, registry: EngineRegistry) -> None:
+    """
+    Test that the least recently used engine is disposed of.
+    """
+    engine1 = registry.get_engine(1, URL, {}, None)
+    engine2 = registry.get_engine(2, URL, {}, None)
+    assert registry.get_engine(1, URL, {}, None) is engine1
+    dispose = mocker.patch.object(engine2, "dispose")
+
+    registry.get_engine(3, URL, {}, None)
+
+    dispose.assert_called_once()
+    assert registry.get_engine(1, URL, {}, None) is engine1
+    assert registry.get_engine(2, URL, {}, None) is not engine2
+
+
+@with_config({"ENGINE_REGISTRY_IDLE_TIMEOUT": 60})
+def test_get_engine_idle(registry: EngineRegistry) -> None:
+    """
+    Test that idle engines are disposed of.
+    """
+    with freeze_time("2024-01-01 00:00:00") as frozen_time:
+        engine = registry.get_engine(1, URL, {}, None)
+        frozen_time.tick(30)
+        assert registry.get_engine(1, URL, {}, None) is engine
+        frozen_time.tick(61)
+        assert registry.get_engine(1, URL, {}, None) is not engine
+
+
+def test_invalidate(registry: EngineRegistry) -> None:
+    engine1 = registry.get_engine(1, URL, {}, None)
+    engine2 = registry.get_engine(2, URL, {}, None)
+
+    registry.invalidate(1)
+
+    assert registry.get_engine(1, URL, {}, None) is not engine1
+    assert registry.get_engine(2, URL, {}, None) is engine2
+
+
+def test_pool_metrics(mocker: MockerFixture, registry: EngineRegistry) -> None:
+    """
+    Test that the pool activity is reported through the stats logger.
+    """
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(current_app.config, {"STATS_LOGGER": stats_logger})
+
+    engine = registry.get_engine(1, URL, {}, None)
+    other_engine = registry.get_engine(1, URL, {}, "alice")
+    with engine.connect(), other_engine.connect():
+        stats_logger.gauge.assert_any_call("engine_pool.1.checked_out", 2)
+    stats_logger.gauge.assert_any_call("engine_pool.1.checked_out", 0)
+
+    stats_logger.incr.assert_any_call("engine_registry.miss")
+    stats_logger.incr.assert_any_call("engine_pool.connect")
+    stats_logger.incr.assert_any_call("engine_pool.checkout")
+
+
+def test_get_sqla_engine_pooled(mocker: MockerFixture) -> None:
+    """
+    Test that `get_sqla_engine` uses the registry unless an SSH tunnel is used.
+    """
+    from superset.models.core import Database
+
+    get_engine = mocker.patch(
+        "superset.models.core.engine_registry.get_engine",
+    )
+    get_ssh_tunnel = mocker.patch(
+        "superset.daos.database.DatabaseDAO.get_ssh_tunnel",
+        return_value=None,
+    )
+    mocker.patch.dict(
+        "superset.models.core.config",
+        {"ENGINE_REGISTRY_ENABLED": True},
+    )
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+
+    with database.get_sqla_engine() as engine:
+        assert engine is get_engine.return_value
+
+    args: Any = get_engine.call_args[0]
+    assert args[0] == 1
+    assert "poolclass" not in args[2]
+
+    get_ssh_tunnel.return_value = mocker.MagicMock()
+    ssh_manager_factory = mocker.patch("superset.models.core.ssh_manager_factory")
+    ssh_manager_factory.instance.build_sqla_url.return_value = "sqlite://"
+    create_engine = mocker.patch("superset.models.core.create_engine")
+    get_engine.reset_mock()
+    with database.get_sqla_engine() as engine:
+        assert engine is create_engine.return_value
+    get_engine.assert_not_called()
+
+
+def test_get_sqla_engine_pooled_prequeries(mocker: MockerFixture) -> None:
+    """
+    Test that connections set to different schemas by prequeries aren't shared.
+    """
+    from superset.models.core import Database
+
+    registry = EngineRegistry()
+    mocker.patch("superset.models.core.engine_registry", new=registry)
+    mocker.patch(
+        "superset.daos.database.DatabaseDAO.get_ssh_tunnel",
+        return_value=None,
+    )
+    mocker.patch.dict(
+        "superset.models.core.config",
+        {"ENGINE_REGISTRY_ENABLED": True},
+    )
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    mocker.patch.object(
+        database.db_engine_spec,
+        "get_prequeries",
+        side_effect=lambda database, catalog, schema: (
+            [f"SELECT '{schema}'"] if schema else []
+        ),
+    )
+
+    with database.get_sqla_engine(schema="a") as engine_a:
+        with database.get_sqla_engine(schema="a") as engine:
+            assert engine is engine_a
+        with database.get_sqla_engine(schema="b") as engine_b:
+            assert engine_b is not engine_a
+        with database.get_sqla_engine() as engine:
+            assert engine not in {engine_a, engine_b}
@@ -203,3 +203,21 @@ def test_max_pandas_timestamp(input_, expected) -> None:
     df = results.to_pandas_df()
 
     assert df_to_records(df) == expected
+
+
+def test_df_to_records_big_integers() -> None:
+    from superset.db_engine_specs import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data = [(1, 2**53), (2, -(2**53))]
+    cursor_descr: DbapiDescription = [
+        (column, "int", None, None, None, None, False) for column in ("a", "b")
+    ]
+    results = SupersetResultSet(data, cursor_descr, BaseEngineSpec)
+    df = results.to_pandas_df()
+
+    assert df_to_records(df) == [
+        {"a": 1, "b": "9007199254740992"},
+        {"a": 2, "b": "-9007199254740992"},
+    ]
+    assert df["b"].tolist() == [2**53, -(2**53)]
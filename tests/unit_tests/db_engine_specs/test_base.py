@@ -464,3 +464,205 @@ def test_impersonate_user_no_database(mocker: MockerFixture) -> None:
         "alice",
         "SECRET",
     )
+
+
+class FakeCursor:
+    """
+    A DB API cursor returning rows in batches of `arraysize`.
+    """
+
+    def __init__(self, rows: list[tuple[Any, ...]], description: list[Any]) -> None:
+        self.rows = rows
+        self.description = description
+        self.arraysize = 1
+        self.fetched_sizes: list[int] = []
+
+    def fetchmany(self, size: int) -> list[tuple[Any, ...]]:
+        self.fetched_sizes.append(size)
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+
+def test_fetch_data_batches(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched in batches, transposed into columns.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    mocker.patch.object(BaseEngineSpec, "fetch_batch_size", 2)
+    cursor = FakeCursor(
+        [(1, "a"), (2, "b"), (3, "c")],
+        [("id", "INTEGER"), ("name", "VARCHAR")],
+    )
+
+    assert list(BaseEngineSpec.fetch_data_batches(cursor)) == [
+        [[1, 2], ["a", "b"]],
+        [[3], ["c"]],
+    ]
+    assert cursor.arraysize == 2
+
+
+def test_fetch_data_batches_limit(mocker: MockerFixture) -> None:
+    """
+    Test that no more rows than the limit are fetched.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    mocker.patch.object(BaseEngineSpec, "fetch_batch_size", 2)
+    cursor = FakeCursor([(idx,) for idx in range(10)], [("id", "INTEGER")])
+
+    assert list(BaseEngineSpec.fetch_data_batches(cursor, limit=3)) == [
+        [[0, 1]],
+        [[2]],
+    ]
+    assert cursor.fetched_sizes == [2, 1]
+
+
+def test_fetch_data_batches_column_mutators(mocker: MockerFixture) -> None:
+    """
+    Test that column type mutators are applied to the batches.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    mocker.patch.object(
+        BaseEngineSpec,
+        "column_type_mutators",
+        {types.String: str.upper},
+    )
+    cursor = FakeCursor(
+        [(1, "a"), (2, "b")],
+        [("id", "INTEGER"), ("name", "VARCHAR")],
+    )
+
+    assert list(BaseEngineSpec.fetch_data_batches(cursor)) == [
+        [[1, 2], ["A", "B"]],
+    ]
+
+
+def test_fetch_data_batches_custom_fetch_data() -> None:
+    """
+    Test that engine specs customizing `fetch_data` get a single batch.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class CustomEngineSpec(BaseEngineSpec):
+        @classmethod
+        def fetch_data(
+            cls,
+            cursor: Any,
+            limit: int | None = None,
+        ) -> list[tuple[Any, ...]]:
+            return [(1, "a"), (2, "b")]
+
+    assert list(CustomEngineSpec.fetch_data_batches(None)) == [
+        [[1, 2], ["a", "b"]],
+    ]
+
+
+def test_query_progress_tracker(mocker: MockerFixture) -> None:
+    """
+    Test that progress is committed at most once per interval, unless it increased
+    by at least the minimum delta.
+    """
+    from superset.db_engine_specs.base import QueryProgressTracker
+
+    mocker.patch.dict(
+        "superset.db_engine_specs.base.current_app.config",
+        {
+            "SQLLAB_PROGRESS_UPDATE_INTERVAL": 10,
+            "SQLLAB_PROGRESS_UPDATE_MIN_DELTA": 20,
+        },
+    )
+    db = mocker.patch("superset.db_engine_specs.base.db")
+    monotonic = mocker.patch("superset.db_engine_specs.base.monotonic")
+    monotonic.return_value = 0
+    query = mocker.MagicMock(progress=0)
+    tracker = QueryProgressTracker()
+
+    tracker.update(query, 5)
+    assert query.progress == 5
+
+    # within the interval, only large increases are committed
+    monotonic.return_value = 5
+    tracker.update(query, 10)
+    assert query.progress == 5
+    tracker.update(query, 30)
+    assert query.progress == 30
+
+    # progress never decreases
+    monotonic.return_value = 20
+    tracker.update(query, 20)
+    assert query.progress == 30
+    tracker.update(query, 35)
+    assert query.progress == 35
+    assert db.session.commit.call_count == 3
+
+
+def test_dfs_to_sql(mocker: MockerFixture) -> None:
+    """
+    Chunks are inserted one at a time, the table being created from the first one.
+    """
+    from contextlib import contextmanager
+
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    engine = create_engine("sqlite://")
+
+    @contextmanager
+    def get_engine(*args: Any, **kwargs: Any) -> Any:
+        yield engine
+
+    mocker.patch.object(BaseEngineSpec, "get_engine", get_engine)
+    dfs = (
+        pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+        pd.DataFrame({"a": [3], "b": ["z"]}),
+    )
+
+    BaseEngineSpec.dfs_to_sql(
+        mocker.MagicMock(),
+        Table("tbl"),
+        iter(dfs),
+        {"if_exists": "fail", "index": False},
+    )
+
+    with engine.connect() as connection:
+        assert connection.execute("SELECT a, b FROM tbl ORDER BY a").fetchall() == [
+            (1, "x"),
+            (2, "y"),
+            (3, "z"),
+        ]
+
+
+def test_dfs_to_sql_custom_df_to_sql(mocker: MockerFixture) -> None:
+    """
+    Engines overriding `df_to_sql` receive the concatenated chunks.
+    """
+    import pandas as pd
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    uploaded: list[pd.DataFrame] = []
+
+    class CustomEngineSpec(BaseEngineSpec):
+        @classmethod
+        def df_to_sql(
+            cls,
+            database: Any,
+            table: Table,
+            df: pd.DataFrame,
+            to_sql_kwargs: dict[str, Any],
+        ) -> None:
+            uploaded.append(df)
+
+    CustomEngineSpec.dfs_to_sql(
+        mocker.MagicMock(),
+        Table("tbl"),
+        iter([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]),
+        {},
+    )
+
+    assert len(uploaded) == 1
+    assert uploaded[0]["a"].tolist() == [1, 2, 3]
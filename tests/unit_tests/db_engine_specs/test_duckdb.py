@@ -127,3 +127,45 @@ def test_get_parameters_from_uri() -> None:
 
     assert parameters["database"] == "md:my_db"
     assert parameters["access_token"] == "token"  # noqa: S105
+
+
+@pytest.mark.parametrize(
+    "limit,expected_result",
+    [
+        (None, [0, 1, 2, 3, 4]),
+        (3, [0, 1, 2]),
+        (2, [0, 1]),
+    ],
+)
+def test_fetch_arrow_table(
+    mocker: MockerFixture,
+    limit: Optional[int],
+    expected_result: list[int],
+) -> None:
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    schema = pa.schema([("id", pa.int64())])
+    batches = [
+        pa.record_batch([pa.array([0, 1])], schema=schema),
+        pa.record_batch([pa.array([2, 3])], schema=schema),
+        pa.record_batch([pa.array([4])], schema=schema),
+    ]
+    cursor = mocker.MagicMock()
+    cursor.fetch_record_batch.return_value = pa.RecordBatchReader.from_batches(
+        schema, batches
+    )
+
+    table = DuckDBEngineSpec.fetch_arrow_table(cursor, limit)
+
+    assert table.column("id").to_pylist() == expected_result
+    cursor.fetch_record_batch.assert_called_with(DuckDBEngineSpec.fetch_batch_size)
+
+
+def test_fetch_arrow_table_not_supported(mocker: MockerFixture) -> None:
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    cursor = mocker.MagicMock(spec=["fetchmany"])
+
+    assert DuckDBEngineSpec.fetch_arrow_table(cursor) is None
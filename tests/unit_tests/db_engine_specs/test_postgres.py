@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
 import pytest
@@ -243,3 +243,68 @@ def test_timegrain_expressions(time_grain: str, expected_result: str) -> None:
         spec.get_timestamp_expr(col=column("col"), pdf=None, time_grain=time_grain)
     )
     assert actual == expected_result
+
+
+def test_copy_from_csv(mocker: MockerFixture) -> None:
+    """
+    NULLs are loaded as NULL, and empty strings as empty strings.
+    """
+    from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+    from sqlalchemy.sql import table
+
+    from superset.db_engine_specs.postgres import copy_from_csv
+
+    copied: list[tuple[str, str]] = []
+
+    def copy_expert(sql: str, buffer: Any) -> None:
+        copied.append((sql, buffer.read()))
+
+    conn = mocker.MagicMock()
+    conn.dialect = PGDialect_psycopg2()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    cursor.copy_expert.side_effect = copy_expert
+    cursor.rowcount = 3
+    pandas_table = mocker.MagicMock()
+    pandas_table.table = table("my table")
+
+    assert (
+        copy_from_csv(
+            pandas_table,
+            conn,
+            ["id", "name", "dttm"],
+            [
+                (1, "a", datetime(2020, 1, 1)),
+                (None, "", None),
+                (2.5, None, datetime(2020, 1, 2, 5, 30)),
+                (3, 'say "hi",\nbye', None),
+                (4, b"\x00\xff", timedelta(days=1, seconds=1.5)),
+            ],
+        )
+        == 3
+    )
+    assert copied == [
+        (
+            'COPY "my table" (id, name, dttm) FROM STDIN WITH CSV',
+            '"1","a","2020-01-01 00:00:00"\n'
+            ',"",\n'
+            '"2.5",,"2020-01-02 05:30:00"\n'
+            '"3","say ""hi"",\nbye",\n'
+            '"4","\\x00ff","86401.5 seconds"\n',
+        )
+    ]
+
+
+def test_get_to_sql_method(mocker: MockerFixture) -> None:
+    from superset.db_engine_specs.cockroachdb import CockroachDbEngineSpec
+    from superset.db_engine_specs.postgres import copy_from_csv
+
+    engine = mocker.MagicMock()
+    engine.dialect.driver = "psycopg2"
+    assert spec.get_to_sql_method(engine) is copy_from_csv
+
+    engine.dialect.driver = "pg8000"
+    engine.dialect.supports_multivalues_insert = True
+    assert spec.get_to_sql_method(engine) == "multi"
+
+    engine.dialect.driver = "psycopg2"
+    assert CockroachDbEngineSpec.get_to_sql_method(engine) == "multi"
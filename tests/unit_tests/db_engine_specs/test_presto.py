@@ -21,6 +21,7 @@ from unittest import mock
 import pytest
 import pytz
 from pyhive.sqlalchemy_presto import PrestoDialect
+from pytest_mock import MockerFixture
 from sqlalchemy import column, sql, text, types
 from sqlalchemy.engine.url import make_url
 
@@ -303,3 +304,33 @@ def test_timegrain_expressions(time_grain: str, expected_result: str) -> None:
         spec.get_timestamp_expr(col=column("col"), pdf=None, time_grain=time_grain)
     )
     assert actual == expected_result
+
+
+def test_handle_cursor_stopped_without_progress(mocker: MockerFixture) -> None:
+    """
+    A stopped query is cancelled even when its progress doesn't change, and thus
+    the query isn't committed between polls.
+    """
+    from superset.common.db_query_status import QueryStatus
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+    from superset.models.sql_lab import Query
+
+    query = Query(id=1, status=QueryStatus.RUNNING, progress=50)
+    query.database = mocker.MagicMock()
+    query.database.connect_args = {"poll_interval": 0}
+    db = mocker.patch("superset.db_engine_specs.presto.db")
+    db.session.query.return_value.filter_by.return_value.one.return_value = query
+
+    def stop(query: Query) -> None:
+        if db.session.refresh.call_count == 2:
+            query.status = QueryStatus.STOPPED
+
+    db.session.refresh.side_effect = stop
+    stats = {"state": "RUNNING", "completedSplits": 1, "totalSplits": 2}
+    cursor = mocker.MagicMock()
+    cursor.poll.side_effect = [{"stats": stats}] * 3 + [None]
+
+    PrestoEngineSpec.handle_cursor(cursor, query)
+
+    cursor.cancel.assert_called_once()
+    assert cursor.poll.call_count == 2
@@ -0,0 +1,188 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+import pytest
+from flask_caching.backends import NullCache, SimpleCache
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.extensions.metastore_cache import SupersetMetastoreCache
+from superset.key_value.types import JsonKeyValueCodec
+
+NAMESPACE = UUID("ee173d1b-ccf3-40aa-941c-985c15224496")
+CODEC = JsonKeyValueCodec()
+
+
+class FakeEntry:
+    def __init__(self, value: bytes, expires_on: Optional[datetime]) -> None:
+        self.value = value
+        self.expires_on = expires_on
+
+    def is_expired(self) -> bool:
+        return bool(self.expires_on and self.expires_on <= datetime.now())
+
+
+@pytest.fixture
+def entries(mocker: MockerFixture) -> dict[Any, FakeEntry]:
+    """
+    Replace the metastore with a dict, shared by all caches like a database would be.
+    """
+    entries: dict[Any, FakeEntry] = {}
+    mocker.patch("superset.extensions.metastore_cache.db")
+    dao = mocker.patch("superset.daos.key_value.KeyValueDAO")
+    dao.get_entry.side_effect = lambda resource, key: entries.get(key)
+    dao.get_value.side_effect = lambda resource, key, codec: (
+        codec.decode(entry.value)
+        if (entry := entries.get(key)) and not entry.is_expired()
+        else None
+    )
+
+    def upsert_entry(
+        resource: Any,
+        value: Any,
+        codec: Any,
+        key: Any,
+        expires_on: Optional[datetime] = None,
+    ) -> FakeEntry:
+        entries[key] = FakeEntry(codec.encode(value), expires_on)
+        return entries[key]
+
+    dao.upsert_entry.side_effect = upsert_entry
+    dao.create_entry.side_effect = upsert_entry
+    return entries
+
+
+def get_cache(version_cache: SimpleCache, **kwargs: Any) -> SupersetMetastoreCache:
+    return SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        codec=CODEC,
+        default_timeout=600,
+        local_cache_size=2,
+        version_cache=version_cache,
+        **kwargs,
+    )
+
+
+def test_local_cache(mocker: MockerFixture, entries: dict[Any, FakeEntry]) -> None:
+    """
+    Values are read from the local cache until another process changes them.
+    """
+    from superset.daos.key_value import KeyValueDAO
+
+    version_cache = SimpleCache()
+    cache = get_cache(version_cache)
+    other_cache = get_cache(version_cache)
+
+    assert cache.set("foo", {"foo": "bar"}) is True
+    assert other_cache.get("foo") == {"foo": "bar"}
+    assert other_cache.get("foo") == {"foo": "bar"}
+    assert cache.get("foo") == {"foo": "bar"}
+    assert KeyValueDAO.get_entry.call_count == 1  # type: ignore
+
+    assert other_cache.set("foo", {"foo": "baz"}) is True
+    assert cache.get("foo") == {"foo": "baz"}
+    assert KeyValueDAO.get_entry.call_count == 2  # type: ignore
+
+    other_cache.delete("foo")
+    entries.clear()
+    assert cache.get("foo") is None
+
+    # the least recently used entries are evicted
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+    assert list(cache._local_cache) == ["b", "c"]
+
+
+def test_local_cache_timeout(entries: dict[Any, FakeEntry]) -> None:
+    """
+    Values are not read from the local cache after they expire.
+    """
+    cache = get_cache(SimpleCache(), local_cache_timeout=60)
+
+    with freeze_time(datetime(2024, 1, 1)):
+        cache.set("foo", "bar", timeout=10)
+        assert cache.get("foo") == "bar"
+
+    with freeze_time(datetime(2024, 1, 1) + timedelta(seconds=11)):
+        assert cache.get("foo") is None
+
+
+def test_refresh_interval(entries: dict[Any, FakeEntry]) -> None:
+    """
+    Refreshing the timeout of an unchanged value is only persisted once the expiry
+    moves by more than the refresh interval.
+    """
+    from superset.daos.key_value import KeyValueDAO
+
+    cache = get_cache(SimpleCache(), local_cache_timeout=3600, refresh_interval=60)
+    dttm = datetime(2024, 1, 1)
+
+    with freeze_time(dttm):
+        cache.set("foo", "bar")
+    with freeze_time(dttm + timedelta(seconds=30)):
+        cache.set("foo", "bar")
+    assert KeyValueDAO.upsert_entry.call_count == 1  # type: ignore
+
+    with freeze_time(dttm + timedelta(seconds=30)):
+        cache.set("foo", "baz")
+    with freeze_time(dttm + timedelta(seconds=120)):
+        cache.set("foo", "baz")
+    assert KeyValueDAO.upsert_entry.call_count == 3  # type: ignore
+
+
+def test_local_cache_disabled(
+    mocker: MockerFixture,
+    entries: dict[Any, FakeEntry],
+) -> None:
+    """
+    The local cache is disabled when the Superset cache is not configured.
+    """
+    mocker.patch("superset.extensions.cache_manager._cache", cache=NullCache())
+    cache = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        codec=CODEC,
+        local_cache_size=2,
+    )
+
+    assert cache.version_cache is None
+    cache.set("foo", "bar")
+    assert cache.get("foo") == "bar"
+    assert cache.local_cache_size == 0
+
+
+def test_add_without_pruning(entries: dict[Any, FakeEntry]) -> None:
+    """
+    Only an expired entry with the same key is deleted when pruning is disabled.
+    """
+    from superset.daos.key_value import KeyValueDAO
+
+    cache = SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        codec=CODEC,
+        prune_on_add=False,
+    )
+    entries[cache.get_key("foo")] = FakeEntry(
+        CODEC.encode({"foo": "bar"}),
+        datetime.now() - timedelta(seconds=1),
+    )
+
+    assert cache.add("foo", {"foo": "baz"}) is True
+    KeyValueDAO.delete_expired_entries.assert_not_called()  # type: ignore
+    assert cache.get("foo") == {"foo": "baz"}
@@ -34,6 +34,7 @@ from superset.commands.dataset.exceptions import DatasetNotFoundError
 from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
 from superset.exceptions import SupersetTemplateException
 from superset.jinja_context import (
+    compiled_templates,
     dataset_macro,
     ExtraCache,
     get_template_processor,
@@ -1358,3 +1359,53 @@ def test_get_time_filter(
         assert cache.get_time_filter(*args, **kwargs) == time_filter, description
         assert cache.removed_filters == removed_filters
         assert cache.applied_filters == applied_filters
+
+
+def test_process_template_compiled_once(mocker: MockerFixture) -> None:
+    """
+    Test that templates are compiled once, and rendered with their processor.
+    """
+    compile_ = mocker.spy(SandboxedEnvironment, "compile")
+    compiled_templates.clear()
+    sql = "SELECT * FROM t WHERE name IN {{ filter_values('name')|where_in }}"
+
+    with app.test_request_context(
+        data={
+            "form_data": json.dumps(
+                {"extra_filters": [{"col": "name", "op": "in", "val": ["Jo'e"]}]}
+            ),
+        }
+    ):
+        for _ in range(2):
+            database = mocker.MagicMock()
+            database.backend = "sqlite"
+            database.get_dialect.return_value = dialect()
+            processor = get_template_processor(database=database)
+
+            template, names = processor.get_template(sql)
+            assert template.environment is processor.env
+            assert names == {"filter_values"}
+            assert processor.process_template(sql) == (
+                "SELECT * FROM t WHERE name IN ('Jo''e')"
+            )
+
+    assert compile_.call_count == 1
+
+
+def test_process_template_lazy_context(mocker: MockerFixture) -> None:
+    """
+    Test that macros are only bound when the template references them.
+    """
+    database = mocker.MagicMock()
+    database.backend = "sqlite"
+    database.get_dialect.return_value = dialect()
+
+    with app.test_request_context(query_string={"foo": "bar"}):
+        processor = get_template_processor(database=database)
+        assert processor.process_template("SELECT '{{ url_param('foo') }}'") == (
+            "SELECT 'bar'"
+        )
+
+    assert "url_param" in processor._bound_context
+    assert "filter_values" not in processor._bound_context
+    assert "filter_values" in processor._context
@@ -683,7 +683,10 @@ def test_engine_context_manager(mocker: MockerFixture) -> None:
     engine_context_manager = mocker.MagicMock()
     mocker.patch(
         "superset.models.core.config",
-        new={"ENGINE_CONTEXT_MANAGER": engine_context_manager},
+        new={
+            "ENGINE_CONTEXT_MANAGER": engine_context_manager,
+            "ENGINE_REGISTRY_ENABLED": False,
+        },
     )
     _get_sqla_engine = mocker.patch.object(Database, "_get_sqla_engine")
 
@@ -700,6 +703,7 @@ def test_engine_context_manager(mocker: MockerFixture) -> None:
         nullpool=True,
         source=None,
         sqlalchemy_uri="trino://",
+        pooled=False,
     )
 
 
@@ -210,3 +210,77 @@ def test_values_for_column_double_percents(
 
         assert called_sql.compare(expected_sql) is True
         assert called_conn == engine
+
+
+def test_sqla_query_shared_by_cache_key_and_execution(mocker: MockerFixture) -> None:
+    """
+    Test that the query built to collect the extra cache keys of a query object is
+    reused to execute it, rather than being built and rendered again.
+    """
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    engine = create_engine("sqlite://")
+
+    @contextmanager
+    def mock_get_sqla_engine(*args, **kwargs):
+        yield engine
+
+    mocker.patch.object(database, "get_sqla_engine", new=mock_get_sqla_engine)
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        sql="SELECT a, b FROM t WHERE '{{ cache_key_wrapper('x') }}' = 'x'",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+    get_sqla_query = mocker.spy(SqlaTable, "get_sqla_query")
+    query_obj = QueryObject(columns=["b"], row_limit=10).to_dict()
+
+    assert table.get_extra_cache_keys(query_obj) == ["x"]
+    sql = table.get_query_str_extended(query_obj).sql
+
+    assert "WHERE 'x' = 'x'" in sql
+    assert get_sqla_query.call_count == 1
+
+    # a different query object is built separately
+    table.get_query_str_extended(QueryObject(columns=["a"], row_limit=10).to_dict())
+    assert get_sqla_query.call_count == 2
+
+
+def test_sqla_query_memoized_per_user(mocker: MockerFixture) -> None:
+    """
+    Test that the memoized query is not shared across users of the same app context.
+    """
+    from superset.common.query_object import QueryObject
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+    from superset.utils.core import override_user
+
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    engine = create_engine("sqlite://")
+
+    @contextmanager
+    def mock_get_sqla_engine(*args, **kwargs):
+        yield engine
+
+    mocker.patch.object(database, "get_sqla_engine", new=mock_get_sqla_engine)
+    mocker.patch(
+        "superset.models.helpers.security_manager.get_rls_cache_key",
+        return_value=[],
+    )
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        sql="SELECT a FROM t WHERE a = '{{ current_username() }}'",
+        columns=[TableColumn(column_name="a")],
+    )
+    query_obj = QueryObject(columns=["a"], row_limit=10).to_dict()
+
+    with override_user(mocker.MagicMock(id=1, username="alice")):
+        assert "WHERE a = 'alice'" in table.get_query_str_extended(query_obj).sql
+    with override_user(mocker.MagicMock(id=2, username="bob")):
+        assert "WHERE a = 'bob'" in table.get_query_str_extended(query_obj).sql
@@ -16,7 +16,10 @@
 # under the License.
 from unittest.mock import call, patch
 
+import pytest
+from flask import current_app
 from flask_appbuilder.security.sqla.models import User
+from pytest_mock import MockerFixture
 
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import SqlaTable
@@ -342,3 +345,45 @@ def test_cache_key_cache_impersonation_on_with_different_user_and_db_impersonati
             ),
         ]
     )
+
+
+def test_cache_key_legacy_format():
+    """
+    The default cache key format is unchanged, so existing keys remain valid
+    """
+    query_object = QueryObject(row_limit=1)
+    assert query_object.cache_key() == "94d2f039d4fa8d3ac2e3c95f3458b143"
+    assert query_object.cache_keys() == ("94d2f039d4fa8d3ac2e3c95f3458b143", None)
+
+
+@pytest.mark.parametrize(
+    "compact_format, algorithm",
+    [(True, "md5"), (True, "blake2b"), (False, "blake2b")],
+)
+def test_cache_key_formats(
+    mocker: MockerFixture, compact_format: bool, algorithm: str
+) -> None:
+    """
+    Changing the cache key format changes the keys, unless falling back to the
+    legacy keys while migrating
+    """
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "QUERY_CACHE_KEY_COMPACT_FORMAT": compact_format,
+            "QUERY_CACHE_KEY_HASH_ALGORITHM": algorithm,
+        },
+    )
+    query_object = QueryObject(row_limit=1)
+    cache_key = query_object.cache_key()
+
+    assert cache_key != "94d2f039d4fa8d3ac2e3c95f3458b143"
+    assert QueryObject(row_limit=1).cache_key() == cache_key
+    assert QueryObject(row_limit=2).cache_key() != cache_key
+    assert query_object.cache_keys() == (cache_key, None)
+
+    mocker.patch.dict(current_app.config, {"QUERY_CACHE_KEY_LEGACY_FALLBACK": True})
+    assert query_object.cache_keys() == (
+        cache_key,
+        "94d2f039d4fa8d3ac2e3c95f3458b143",
+    )
@@ -164,3 +164,69 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_from_cursor(mocker: MockerFixture) -> None:
+    """
+    Test building a result set from batches whose types differ.
+    """
+    mocker.patch.object(BaseEngineSpec, "fetch_batch_size", 2)
+    cursor = mocker.MagicMock()
+    cursor.description = [
+        ("id", "INTEGER"),
+        ("value", "FLOAT"),
+        ("mixed", "VARCHAR"),
+        ("nested", "JSON"),
+    ]
+    rows = [
+        (1, None, 1, [1, 2]),
+        (2, None, 2, [3]),
+        (3, 1.5, "a", None),
+    ]
+    cursor.fetchmany.side_effect = [rows[:2], rows[2:], []]
+
+    result_set = SupersetResultSet.from_cursor(cursor, BaseEngineSpec)
+
+    assert result_set.size == 3
+    df = result_set.to_pandas_df()
+    assert df["mixed"].tolist() == ["1", "2", "a"]
+    assert df["nested"].tolist() == ["[1, 2]", "[3]", None]
+    pd.testing.assert_frame_equal(
+        df,
+        SupersetResultSet(rows, cursor.description, BaseEngineSpec).to_pandas_df(),
+    )
+
+
+def test_from_cursor_empty(mocker: MockerFixture) -> None:
+    """
+    Test that an empty result has no columns, as when fetching all rows.
+    """
+    cursor = mocker.MagicMock()
+    cursor.description = [("id", "INTEGER")]
+    cursor.fetchmany.return_value = []
+
+    result_set = SupersetResultSet.from_cursor(cursor, BaseEngineSpec)
+
+    assert result_set.size == 0
+    assert result_set.columns == []
+
+
+def test_from_cursor_arrow(mocker: MockerFixture) -> None:
+    """
+    Test building a result set from an Arrow table fetched natively.
+    """
+    import pyarrow as pa
+
+    table = pa.table({"a": [1, 2], "a_": [[1], [2, 3]]})
+    mocker.patch.object(BaseEngineSpec, "fetch_arrow_table", return_value=table)
+    fetch_data_batches = mocker.patch.object(BaseEngineSpec, "fetch_data_batches")
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER"), ("a", "INTEGER[]")]
+
+    result_set = SupersetResultSet.from_cursor(cursor, BaseEngineSpec)
+
+    fetch_data_batches.assert_not_called()
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "a": [1, 2],
+        "a__1": ["[1]", "[2, 3]"],
+    }
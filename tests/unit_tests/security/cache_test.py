@@ -0,0 +1,127 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=invalid-name, unused-argument, redefined-outer-name
+
+from unittest.mock import MagicMock
+
+import pytest
+from flask import g
+from pytest_mock import MockerFixture
+
+from superset.extensions import appbuilder
+from superset.security.cache import SecurityCache
+from superset.security.manager import SupersetSecurityManager
+from tests.conftest import with_config
+
+
+@pytest.fixture
+def cache() -> SecurityCache:
+    return SecurityCache()
+
+
+def test_get_request_scope(cache: SecurityCache) -> None:
+    """
+    Values are memoized for the duration of the request only by default.
+    """
+    func = MagicMock(return_value=[1])
+
+    assert cache.get("ns", "key", func) == [1]
+    assert cache.get("ns", "key", func) == [1]
+    assert cache.get("ns", "other", func) == [1]
+    assert func.call_count == 2
+    assert cache.stats() == {"ns": {"hits": 1, "misses": 2}}
+
+    del g.security_cache
+    cache.get("ns", "key", func)
+    assert func.call_count == 3
+
+
+def test_get_ttl(cache: SecurityCache, mocker: MockerFixture) -> None:
+    """
+    Values with a TTL are shared between requests until they expire.
+    """
+    func = MagicMock(return_value=[1])
+    monotonic = mocker.patch("superset.security.cache.time.monotonic")
+
+    monotonic.return_value = 100
+    cache.get("ns", "key", func, ttl=10)
+    del g.security_cache
+
+    monotonic.return_value = 105
+    cache.get("ns", "key", func, ttl=10)
+    assert func.call_count == 1
+    del g.security_cache
+
+    monotonic.return_value = 111
+    cache.get("ns", "key", func, ttl=10)
+    assert func.call_count == 2
+
+
+def test_invalidate(cache: SecurityCache) -> None:
+    func = MagicMock(return_value=[1])
+
+    cache.get("ns", "key", func, ttl=10)
+    cache.invalidate(request_only=True)
+    cache.get("ns", "key", func, ttl=10)
+    assert func.call_count == 1
+
+    cache.invalidate()
+    cache.get("ns", "key", func, ttl=10)
+    assert func.call_count == 2
+
+
+def test_get_rls_filters_memoized(mocker: MockerFixture, app_context: None) -> None:
+    """
+    RLS filters are queried once per request for a given dataset and set of roles,
+    and are invalidated when a role is updated.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(sm, "get_user_roles", return_value=[MagicMock(id=1)])
+    get_rls_filters = mocker.patch.object(
+        sm, "_get_rls_filters", return_value=[MagicMock(id=2), MagicMock(id=1)]
+    )
+    g.user = MagicMock()
+    table = MagicMock(id=42, is_rls_supported=True)
+
+    assert [f.id for f in sm.get_rls_sorted(table)] == [1, 2]
+    assert [f.id for f in sm.get_rls_filters(table)] == [2, 1]
+    sm.get_rls_cache_key(table)
+    assert get_rls_filters.call_count == 1
+
+    sm.on_role_after_update(MagicMock(), MagicMock(), MagicMock())
+    sm.get_rls_filters(table)
+    assert get_rls_filters.call_count == 2
+
+
+@with_config({"RLS_FILTERS_CACHE_TTL": 60})
+def test_get_rls_filters_shared(mocker: MockerFixture, app_context: None) -> None:
+    """
+    With a TTL, RLS filters are shared between requests of users with the same
+    roles.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(sm, "get_user_roles", return_value=[MagicMock(id=1)])
+    get_rls_filters = mocker.patch.object(sm, "_get_rls_filters", return_value=[])
+    table = MagicMock(id=43)
+
+    g.user = MagicMock()
+    sm.get_rls_filters(table)
+    del g.security_cache
+    g.user = MagicMock()
+    sm.get_rls_filters(table)
+
+    assert get_rls_filters.call_count == 1
@@ -18,12 +18,14 @@
 
 
 import pytest
+import sqlglot
 from sqlglot import Dialects
 
 from superset.exceptions import SupersetParseError
 from superset.sql.parse import (
     extract_tables_from_statement,
     KustoKQLStatement,
+    ParseCache,
     split_kql,
     SQLGLOT_DIALECTS,
     SQLScript,
@@ -1185,3 +1187,74 @@ def test_firebolt_old_escape_string() -> None:
   'foo''bar',
   'foo''bar'"""
     )
+
+
+def test_parse_cache() -> None:
+    """
+    Test the LRU cache of parse results.
+    """
+    cache = ParseCache(maxsize=2)
+    calls: list[str] = []
+
+    def parse(sql: str) -> str:
+        calls.append(sql)
+        return sql.upper()
+
+    assert cache.get("sqlglot", "a", "postgresql", lambda: parse("a")) == "A"
+    assert cache.get("sqlglot", "a", "postgresql", lambda: parse("a")) == "A"
+    assert cache.get("sqlglot", "a", "mysql", lambda: parse("a")) == "A"
+    assert calls == ["a", "a"]
+
+    # ("a", "postgresql") is the least recently used entry
+    cache.get("sqlglot", "b", "postgresql", lambda: parse("b"))
+    cache.get("sqlglot", "a", "postgresql", lambda: parse("a"))
+    assert calls == ["a", "a", "b", "a"]
+
+    assert cache.stats() == {
+        "sqlglot": {"hits": 1, "misses": 4, "hit_ratio": 0.2},
+    }
+
+
+def test_parse_cache_errors() -> None:
+    """
+    Test that parse errors are not cached.
+    """
+    cache = ParseCache()
+
+    def parse() -> None:
+        raise ValueError("invalid")
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="invalid"):
+            cache.get("sqlglot", "SELECT", "", parse)
+
+    assert cache.stats()["sqlglot"]["misses"] == 2
+
+
+def test_parse_cache_disabled() -> None:
+    """
+    Test that nothing is cached when the size is 0.
+    """
+    cache = ParseCache(maxsize=0)
+    calls: list[str] = []
+
+    cache.get("sqlglot", "a", "", lambda: calls.append("a"))
+    cache.get("sqlglot", "a", "", lambda: calls.append("a"))
+
+    assert calls == ["a", "a"]
+    assert cache.stats() == {}
+
+
+def test_sqlstatement_parse_cache_copies() -> None:
+    """
+    Test that statements parsed from the cache don't share their trees.
+    """
+    sql = "SELECT * FROM some_table"
+    statement = SQLStatement(sql, "postgresql")
+    other = SQLStatement(sql, "postgresql")
+
+    assert statement._parsed is not other._parsed
+    statement._parsed.set("where", sqlglot.exp.Where(this=sqlglot.parse_one("1 = 0")))
+
+    assert statement.format() == "SELECT\n  *\nFROM some_table\nWHERE\n  1 = 0"
+    assert SQLStatement(sql, "postgresql").format() == "SELECT\n  *\nFROM some_table"
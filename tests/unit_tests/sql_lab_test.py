@@ -75,6 +75,46 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+@mock.patch.dict("superset.sql_lab.config", {"FETCH_RESULTS_IN_BATCHES": True})
+def test_execute_sql_statement_fetch_in_batches(mocker: MockerFixture) -> None:
+    """
+    Test for `execute_sql_statement` when results are fetched in batches.
+    """
+    import pyarrow as pa
+
+    from superset.sql_lab import execute_sql_statement
+
+    query = mocker.MagicMock()
+    query.limit = 2
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+
+    cursor = mocker.MagicMock()
+    result_set = mocker.MagicMock()
+    result_set.table = pa.table({"answer": [42, 43, 44]})
+    result_set.size = 3
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+    SupersetResultSet.from_cursor.return_value = result_set
+
+    assert (
+        execute_sql_statement(
+            "SELECT answer FROM answers",
+            query,
+            cursor=cursor,
+            log_params={},
+            apply_ctas=False,
+        )
+        == result_set
+    )
+
+    SupersetResultSet.from_cursor.assert_called_with(cursor, db_engine_spec, 3)
+    db_engine_spec.fetch_data.assert_not_called()
+    assert result_set.table.column("answer").to_pylist() == [42, 43]
+
+
 def test_execute_sql_statement_with_rls(
     mocker: MockerFixture,
 ) -> None:
@@ -391,3 +431,65 @@ def test_get_sql_results_oauth2(mocker: MockerFixture, app) -> None:
             }
         ],
     }
+
+
+@pytest.mark.parametrize(
+    "offset, limit, expected",
+    [
+        (0, None, list(range(25))),
+        (0, 5, list(range(5))),
+        (8, 5, list(range(8, 13))),
+        (10, 10, list(range(10, 20))),
+        (24, 10, [24]),
+        (30, 5, []),
+    ],
+)
+def test_slice_ipc_buffer(offset: int, limit: int | None, expected: list[int]) -> None:
+    """
+    Test that only the requested rows are read from a stream of record batches.
+    """
+    import pyarrow as pa
+
+    from superset.sqllab.utils import slice_ipc_buffer, write_ipc_buffer
+
+    table = pa.table({"a": list(range(25))})
+    buffer = write_ipc_buffer(table, max_chunksize=10)
+
+    sliced = slice_ipc_buffer(buffer, offset, limit)
+    assert sliced.schema == table.schema
+    assert sliced["a"].to_pylist() == expected
+
+
+def test_deserialize_results_payload_page(mocker: MockerFixture) -> None:
+    """
+    Test that a page of the stored results is deserialized and expanded.
+    """
+    import msgpack
+    import pyarrow as pa
+
+    from superset.sqllab.utils import write_ipc_buffer
+    from superset.views.utils import _deserialize_results_payload
+
+    query = mocker.MagicMock()
+    query.database.db_engine_spec.expand_data.side_effect = lambda columns, data: (
+        columns,
+        data,
+        [],
+    )
+    table = pa.table({"a": list(range(25))})
+    payload = msgpack.dumps(
+        {
+            "data": write_ipc_buffer(table, max_chunksize=10).to_pybytes(),
+            "selected_columns": [{"name": "a", "type": "INT"}],
+        }
+    )
+
+    result = _deserialize_results_payload(
+        payload,
+        query,
+        use_msgpack=True,
+        offset=12,
+        limit=3,
+    )
+    assert result["data"] == [{"a": 12}, {"a": 13}, {"a": 14}]
+    assert result["columns"] == [{"name": "a", "type": "INT", "column_name": "a"}]
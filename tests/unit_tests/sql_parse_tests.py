@@ -1555,6 +1555,26 @@ def test_insert_rls_as_subquery(
     )
 
 
+def test_insert_rls_as_subquery_parse_cache(mocker: MockerFixture) -> None:
+    """
+    Test that applying RLS to a parsed query doesn't modify the cached parse tree.
+    """
+    condition = sqlparse.parse("id=42")[0]
+    add_table_name(condition, "some_table")
+    mocker.patch("superset.sql_parse.get_rls_for_table", return_value=condition)
+
+    sql = "SELECT * FROM some_table"
+    parsed_query = ParsedQuery(sql)
+    statement = parsed_query._parsed[0]
+    insert_rls_as_subquery(statement, 1, None)
+
+    assert str(statement) == (
+        "SELECT * FROM (SELECT * FROM some_table WHERE some_table.id=42) AS some_table"
+    )
+    assert parsed_query.get_statements() == [str(statement)]
+    assert ParsedQuery(sql).get_statements() == [sql]
+
+
 @pytest.mark.parametrize(
     "sql,table,rls,expected",
     [
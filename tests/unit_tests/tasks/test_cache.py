@@ -0,0 +1,75 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+from pytest_mock import MockerFixture
+
+from superset.constants import CacheRegion
+
+
+def test_warm_up_in_process(mocker: MockerFixture) -> None:
+    """
+    Test that charts are deduped on their cache keys, that cached charts are skipped,
+    and that errors are reported per chart.
+    """
+    from superset.tasks.cache import warm_up_in_process
+
+    mocker.patch("superset.tasks.cache.db")
+    mocker.patch("superset.tasks.cache.security_manager", new=mocker.MagicMock())
+    mocker.patch(
+        "superset.tasks.cache.get_query_cache_keys",
+        side_effect=[
+            (1, ("a", "b")),
+            (1, ("a", "b")),
+            (1, ("c",)),
+            (2, ("d",)),
+            None,
+            (1, ("e",)),
+        ],
+    )
+
+    def has(key: str, region: CacheRegion) -> bool:
+        assert region == CacheRegion.DATA
+        return key == "c"
+
+    mocker.patch("superset.tasks.cache.QueryCacheManager.has", side_effect=has)
+
+    def warm_up_chart(task: dict[str, Any]) -> dict[str, Any]:
+        chart_id = task["payload"]["chart_id"]
+        if chart_id == 6:
+            raise Exception("Error")
+        return {"chart_id": chart_id, "viz_error": None, "viz_status": "success"}
+
+    warm_up = mocker.patch(
+        "superset.tasks.cache.warm_up_chart",
+        side_effect=warm_up_chart,
+    )
+
+    tasks = [
+        {"payload": {"chart_id": chart_id}, "username": "admin"}
+        for chart_id in range(1, 7)
+    ]
+    tasks.append({"payload": {"chart_id": 7}, "username": None})
+
+    assert warm_up_in_process(tasks) == {  # type: ignore
+        "success": ['{"chart_id": 1}', '{"chart_id": 4}', '{"chart_id": 5}'],
+        "skipped": ['{"chart_id": 2}', '{"chart_id": 3}'],
+        "errors": ['{"chart_id": 6}'],
+    }
+    assert sorted(
+        call.args[0]["payload"]["chart_id"] for call in warm_up.call_args_list
+    ) == [1, 4, 5, 6]
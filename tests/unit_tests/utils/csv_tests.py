@@ -15,10 +15,13 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from datetime import datetime, timedelta
+
 import pandas as pd
 import pyarrow as pa
 import pytest  # noqa: F401
 
+from superset.sqllab.utils import write_ipc_buffer
 from superset.utils import csv
 
 
@@ -95,3 +98,146 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_to_escaped_csv_does_not_mutate_dataframe():
+    df = pd.DataFrame({"=header": ["=func()", "a"]}, index=[5, 7])
+
+    csv.df_to_escaped_csv(df)
+
+    assert df.columns.tolist() == ["=header"]
+    assert df["=header"].tolist() == ["=func()", "a"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 10])
+def test_df_to_escaped_csv_chunks(chunk_size):
+    df = pd.DataFrame(
+        {
+            "=name": ["a", "=func()", "-10", "|b", None],
+            "value": [1, 2, 3, 4, 5],
+        }
+    )
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, chunk_size, index=False))
+
+    assert len(chunks) == -(-len(df) // chunk_size)
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+@pytest.mark.parametrize("date_format", [None, "%d/%m/%Y"])
+def test_df_to_escaped_csv_chunks_temporal(chunk_size, date_format):
+    """
+    Temporal columns are formatted consistently across chunks.
+    """
+    df = pd.DataFrame(
+        {
+            "dttm": pd.to_datetime(
+                ["2020-01-01", None, "2020-01-02 05:30:00"], format="ISO8601"
+            ),
+            "duration": pd.to_timedelta(["1 day", "1 day 00:00:01.5", None]),
+        }
+    )
+
+    chunks = list(
+        csv.df_to_escaped_csv_chunks(
+            df,
+            chunk_size,
+            index=False,
+            date_format=date_format,
+        )
+    )
+
+    assert "".join(chunks) == csv.df_to_escaped_csv(
+        df,
+        index=False,
+        date_format=date_format,
+    )
+    assert df["dttm"].dtype == "datetime64[ns]"
+
+
+@pytest.mark.parametrize("header", [False, ["n", "v"]])
+def test_df_to_escaped_csv_chunks_header(header):
+    df = pd.DataFrame({"name": ["a", "b", "c"], "value": [1, 2, 3]})
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, 2, index=False, header=header))
+
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False, header=header)
+
+
+def test_df_to_escaped_csv_chunks_empty():
+    df = pd.DataFrame({"name": [], "value": []})
+
+    assert list(csv.df_to_escaped_csv_chunks(df, 10, index=False)) == ["name,value\n"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 10])
+def test_arrow_to_escaped_csv_chunks(chunk_size):
+    df = pd.DataFrame(
+        {
+            "=name": ["a", "=func()", "-10", "|b", None],
+            "value": [1, 2, 3, 4, 5],
+        }
+    )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    reader = pa.ipc.open_stream(write_ipc_buffer(table, max_chunksize=2))
+
+    chunks = list(csv.arrow_to_escaped_csv_chunks(reader, chunk_size, index=False))
+
+    assert len(chunks) == sum(-(-rows // chunk_size) for rows in (2, 2, 1))
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2])
+def test_arrow_to_escaped_csv_chunks_temporal(chunk_size):
+    """
+    Chunks are formatted consistently, as SQL Lab results exported without streaming.
+    """
+    from superset.dataframe import df_to_records
+    from superset.result_set import SupersetResultSet
+
+    table = pa.table(
+        {
+            "dttm": pa.array(
+                [datetime(2020, 1, 1), None, datetime(2020, 1, 2, 5, 30)],
+                pa.timestamp("us"),
+            ),
+            "fractional": pa.array(
+                [datetime(2020, 1, 1), datetime(2020, 1, 1, 0, 0, 0, 500000), None],
+                pa.timestamp("ns", tz="UTC"),
+            ),
+            "delta": pa.array([timedelta(days=1), None, timedelta(seconds=1)]),
+            "id": pa.array([1, None, 2**60], pa.int64()),
+            "value": pa.array([0.1, None, 1e20]),
+        }
+    )
+    reader = pa.ipc.open_stream(write_ipc_buffer(table))
+    df = pd.DataFrame(
+        data=df_to_records(SupersetResultSet.convert_table_to_df(table)),
+        dtype=object,
+        columns=table.column_names,
+    )
+
+    chunks = list(csv.arrow_to_escaped_csv_chunks(reader, chunk_size, index=False))
+
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False)
+    assert chunks[0].startswith(
+        "dttm,fractional,delta,id,value\n"
+        "2020-01-01 00:00:00,2020-01-01 00:00:00+00:00,1 days 00:00:00,1,0.1\n"
+    )
+
+
+def test_arrow_to_escaped_csv_chunks_header():
+    table = pa.table({"name": ["a", "b", "c"]})
+    reader = pa.ipc.open_stream(write_ipc_buffer(table))
+
+    chunks = list(csv.arrow_to_escaped_csv_chunks(reader, 2, index=False, header=["n"]))
+
+    assert chunks == ["n\na\nb\n", "c\n"]
+
+
+def test_arrow_to_escaped_csv_chunks_empty():
+    table = pa.table({"name": pa.array([], pa.string())})
+    reader = pa.ipc.open_stream(write_ipc_buffer(table))
+
+    assert list(csv.arrow_to_escaped_csv_chunks(reader, 10, index=False)) == ["name\n"]
@@ -28,10 +28,12 @@ from superset.commands.chart.exceptions import (
     TimeRangeParseFailError,
 )
 from superset.utils.date_parser import (
+    compile_datetime_expression,
     DateRangeMigration,
     datetime_eval,
     get_past_or_future,
     get_since_until,
+    get_time_range_expressions,
     parse_human_datetime,
     parse_human_timedelta,
     parse_past_timedelta,
@@ -344,6 +346,36 @@ def test_previous_calendar_quarter():
         assert result == expected
 
 
+def test_get_since_until_cached_expressions() -> None:
+    """
+    Time ranges are translated and parsed once, and evaluated on each call against
+    the current time.
+    """
+    get_time_range_expressions.cache_clear()
+    compile_datetime_expression.cache_clear()
+
+    assert get_time_range_expressions("Last week") == (
+        "DATEADD(DATETIME('today'), -1, week)",
+        "DATETIME('today')",
+    )
+    assert get_time_range_expressions("2018") is None
+
+    with freezegun.freeze_time("2023-01-15"):
+        assert get_since_until("Last week", time_shift="1 week ago") == (
+            datetime(2023, 1, 1),
+            datetime(2023, 1, 8),
+        )
+    with freezegun.freeze_time("2024-03-10"):
+        assert get_since_until("Last week", time_shift="1 week ago") == (
+            datetime(2024, 2, 25),
+            datetime(2024, 3, 3),
+        )
+
+    assert get_time_range_expressions.cache_info().hits == 1
+    assert compile_datetime_expression.cache_info().misses == 2
+    assert compile_datetime_expression.cache_info().hits == 2
+
+
 @patch("superset.utils.date_parser.parse_human_datetime", mock_parse_human_datetime)
 def test_datetime_eval() -> None:
     result = datetime_eval("datetime('now')")
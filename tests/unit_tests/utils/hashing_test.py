@@ -0,0 +1,45 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+
+import pytest
+
+from superset.utils.hashing import hash_from_dict, hash_from_str, md5_sha_from_str
+from superset.utils.json import json_int_dttm_ser
+
+
+def test_hash_from_str() -> None:
+    assert hash_from_str("superset") == md5_sha_from_str("superset")
+    assert len(hash_from_str("superset", "blake2b")) == 32
+    assert hash_from_str("superset", "blake2b") != hash_from_str("superset")
+
+    with pytest.raises(ValueError, match="Unsupported hash algorithm: crc32"):
+        hash_from_str("superset", "crc32")
+
+
+def test_hash_from_dict() -> None:
+    obj = {"b": 1, "a": datetime(2024, 1, 1)}
+
+    assert hash_from_dict(obj, default=json_int_dttm_ser) == hash_from_dict(
+        {"a": datetime(2024, 1, 1), "b": 1}, default=json_int_dttm_ser
+    )
+    assert hash_from_dict(obj, default=json_int_dttm_ser) == md5_sha_from_str(
+        '{"a":1704067200000.0,"b":1}'
+    )
+    assert hash_from_dict(
+        obj, default=json_int_dttm_ser, algorithm="blake2b"
+    ) != hash_from_dict(obj, default=json_int_dttm_ser)
@@ -27,6 +27,8 @@ import pytest
 
 from superset.utils import json
 from superset.utils.core import (
+    compress_blob,
+    decompress_blob,
     zlib_compress,
     zlib_decompress,
 )
@@ -244,6 +246,20 @@ def test_zlib_compression():
     assert json_str == got_str
 
 
+@pytest.mark.parametrize("codec", ["zlib", "zstd", "lz4", None])
+def test_blob_compression(codec):
+    json_str = '{"test": 1}'
+    blob = compress_blob(json_str, codec)
+    assert decompress_blob(blob) == json_str
+    assert decompress_blob(blob, decode=False) == json_str.encode("utf-8")
+
+
+def test_blob_decompression_zlib():
+    json_str = '{"test": 1}'
+    assert compress_blob(json_str) == zlib_compress(json_str)
+    assert decompress_blob(zlib_compress(json_str)) == json_str
+
+
 def test_json_int_dttm_ser():
     dttm = datetime(2020, 1, 1)
     ts = 1577836800000.0
@@ -258,6 +274,16 @@ def test_json_int_dttm_ser():
         json.json_int_dttm_ser(np.datetime64())
 
 
+def test_dumps_canonical():
+    obj = {"b": [1, 2.5, None], "a": {"d": datetime(1970, 1, 1), "c": np.int64(3)}}
+    assert json.dumps_canonical(obj) == '{"a":{"c":3,"d":0.0},"b":[1,2.5,null]}'
+    # keys of mixed types can't be sorted by the standard library encoder
+    assert json.dumps_canonical({1: "a", "b": 2}) == '{"1":"a","b":2}'
+
+    with pytest.raises(TypeError):
+        json.dumps_canonical({"a": object()})
+
+
 def test_format_timedelta():
     assert json.format_timedelta(timedelta(0)) == "0:00:00"
     assert json.format_timedelta(timedelta(days=1)) == "1 day, 0:00:00"
@@ -16,7 +16,9 @@
 # under the License.
 
 
-from superset.utils.log import get_logger_from_status
+from pytest_mock import MockerFixture
+
+from superset.utils.log import BufferedDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +37,98 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def log_records(event_logger: BufferedDBEventLogger, count: int) -> None:
+    event_logger.log(
+        user_id=1,
+        action="chart_data",
+        dashboard_id=None,
+        duration_ms=10,
+        slice_id=None,
+        referrer=None,
+        records=[{"slice_id": idx} for idx in range(count)],
+    )
+
+
+def test_buffered_db_event_logger(mocker: MockerFixture) -> None:
+    save_logs = mocker.patch.object(
+        BufferedDBEventLogger, "save_logs", return_value=True
+    )
+    event_logger = BufferedDBEventLogger(batch_size=2, flush_interval=60)
+
+    log_records(event_logger, 5)
+    event_logger.shutdown()
+
+    batches = [call.args[0] for call in save_logs.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [mapping["slice_id"] for batch in batches for mapping in batch] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert batches[0][0]["action"] == "chart_data"
+    assert batches[0][0]["json"] == '{"slice_id": 0}'
+
+    # once shut down, logs are written synchronously
+    log_records(event_logger, 1)
+    assert save_logs.call_count == 4
+
+
+def test_buffered_db_event_logger_full_queue(mocker: MockerFixture) -> None:
+    save_logs = mocker.patch.object(
+        BufferedDBEventLogger, "save_logs", return_value=False
+    )
+    mocker.patch.object(BufferedDBEventLogger, "_start")
+    event_logger = BufferedDBEventLogger(max_queue_size=2, batch_size=10)
+    event_logger._app = mocker.MagicMock()
+
+    log_records(event_logger, 3)
+    assert event_logger.dropped == 1
+
+    event_logger.flush()
+    assert len(save_logs.call_args.args[0]) == 2
+    assert event_logger.failed == 2
+
+
+def test_buffered_db_event_logger_error(mocker: MockerFixture) -> None:
+    """
+    Batches failing with any error are dropped without stopping the thread.
+    """
+    save_logs = mocker.patch.object(
+        BufferedDBEventLogger,
+        "save_logs",
+        side_effect=[ValueError("boom"), True],
+    )
+    event_logger = BufferedDBEventLogger(batch_size=2, flush_interval=60)
+
+    log_records(event_logger, 4)
+    event_logger.shutdown()
+
+    assert save_logs.call_count == 2
+    assert event_logger.failed == 2
+
+
+def test_buffered_db_event_logger_shutdown_timeout(mocker: MockerFixture) -> None:
+    """
+    The pending logs are written on shutdown even if the thread doesn't stop.
+    """
+    save_logs = mocker.patch.object(
+        BufferedDBEventLogger, "save_logs", return_value=True
+    )
+    mocker.patch.object(BufferedDBEventLogger, "_start")
+    event_logger = BufferedDBEventLogger(batch_size=10)
+    event_logger._app = mocker.MagicMock()
+    event_logger._thread = mocker.MagicMock()
+    event_logger._thread.is_alive.return_value = True
+
+    log_records(event_logger, 3)
+    event_logger.shutdown()
+
+    event_logger._thread.join.assert_called_once_with(timeout=5)
+    assert len(save_logs.call_args.args[0]) == 3
+
+    # the logger is shut down again at exit
+    event_logger._thread.is_alive.return_value = False
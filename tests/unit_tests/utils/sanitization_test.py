@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import numpy as np
+import pandas as pd
+import pytest
+
+from superset.utils.csv import escape_value
+from superset.utils.sanitization import (
+    escape_formulas,
+    quote_formulas,
+    stringify_large_numbers,
+)
+
+
+def test_escape_formulas() -> None:
+    values = [
+        "value",
+        "-10",
+        "@value",
+        "=cmd|' /C calc'!A0",
+        '""=10+2',
+        " =10+2",
+        None,
+        1,
+    ]
+    escaped = escape_formulas(pd.Series(values))
+
+    assert escaped.tolist() == [
+        escape_value(value) if isinstance(value, str) else value for value in values
+    ]
+
+    # string only columns are matched by Arrow
+    strings = [value for value in values if isinstance(value, str)]
+    assert escape_formulas(pd.Series(strings)).tolist() == [
+        escape_value(value) for value in strings
+    ]
+
+
+def test_escape_formulas_whitespace() -> None:
+    """
+    Values preceded by any whitespace character matched by Python are escaped.
+    """
+    values = [f"{chr(code)}=cmd" for code in range(0x3001) if chr(code).isspace()]
+
+    escaped = escape_formulas(pd.Series(values)).tolist()
+
+    assert escaped == [escape_value(value) for value in values]
+    assert all(value.startswith("'") for value in escaped)
+
+
+@pytest.mark.parametrize(
+    "column",
+    [
+        pd.Series([1, 2, 3]),
+        pd.Series([1.5, np.nan]),
+        pd.Series([1, 2], dtype=object),
+        pd.Series(["a", "b"]),
+    ],
+)
+def test_sanitization_unchanged(column: pd.Series) -> None:
+    """
+    Columns that can't or don't need to be sanitized are returned as is.
+    """
+    assert escape_formulas(column) is column
+    assert quote_formulas(column) is column
+    assert stringify_large_numbers(column, 10) is column
+
+
+def test_quote_formulas() -> None:
+    column = pd.Series(["=SUM(A1:A2)", "normal", "@SUM(A1:A2)", "-1", "", None, 1])
+
+    assert quote_formulas(column).tolist() == [
+        "'=SUM(A1:A2)",
+        "normal",
+        "'@SUM(A1:A2)",
+        "'-1",
+        "",
+        None,
+        1,
+    ]
+
+
+def test_stringify_large_numbers_integers() -> None:
+    column = pd.Series([1, -(2**53), 2**53, np.iinfo(np.int64).min])
+
+    assert stringify_large_numbers(column, 2**53 - 1).tolist() == [
+        1,
+        str(-(2**53)),
+        str(2**53),
+        str(np.iinfo(np.int64).min),
+    ]
+
+
+def test_stringify_large_numbers_object() -> None:
+    column = pd.Series([2**64, 1, 1e20, True, "a", None, np.nan])
+
+    assert stringify_large_numbers(column, 10).tolist() == [
+        str(2**64),
+        1,
+        1e20,
+        True,
+        "a",
+        None,
+        pytest.approx(np.nan, nan_ok=True),
+    ]
+    assert stringify_large_numbers(column, 10, include_floats=True).tolist() == [
+        str(2**64),
+        1,
+        "1e+20",
+        True,
+        "a",
+        None,
+        pytest.approx(np.nan, nan_ok=True),
+    ]
+
+
+def test_stringify_large_numbers_floats() -> None:
+    column = pd.Series([1.5, 1e16, -1e16, np.nan])
+
+    assert stringify_large_numbers(column, 10**15) is column
+    result = stringify_large_numbers(column, 10**15, include_floats=True)
+    assert result[:3].tolist() == [1.5, "1e+16", "-1e+16"]
+    assert np.isnan(result[3])
@@ -0,0 +1,70 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+
+import pytest
+from flask import g
+
+from superset.utils.concurrency import map_in_app_context
+
+
+def test_map_in_app_context_serial() -> None:
+    thread_ids: set[int] = set()
+
+    def func(item: int) -> int:
+        thread_ids.add(threading.get_ident())
+        return item * 2
+
+    assert map_in_app_context(func, [1, 2, 3], max_workers=1) == [2, 4, 6]
+    assert thread_ids == {threading.get_ident()}
+
+
+def test_map_in_app_context_concurrent() -> None:
+    """
+    Calls run concurrently, in order, and see the attributes of `g`.
+    """
+    barrier = threading.Barrier(3, timeout=5)
+    g.user = "admin"
+
+    def func(item: int) -> tuple[int, str]:
+        barrier.wait()
+        return item, g.user
+
+    assert map_in_app_context(func, [1, 2, 3], max_workers=3) == [
+        (1, "admin"),
+        (2, "admin"),
+        (3, "admin"),
+    ]
+
+
+def test_map_in_app_context_errors() -> None:
+    processed: list[int] = []
+
+    def func(item: int) -> int:
+        if item in {2, 3}:
+            raise ValueError(f"error {item}")
+        processed.append(item)
+        return item
+
+    with pytest.raises(ValueError, match="error 2"):
+        map_in_app_context(func, [1, 2, 3, 4], max_workers=2)
+    assert sorted(processed) == [1, 4]
+
+    results = map_in_app_context(func, [1, 2, 3], max_workers=2, return_exceptions=True)
+    assert results[0] == 1
+    assert str(results[1]) == "error 2"
+    assert str(results[2]) == "error 3"
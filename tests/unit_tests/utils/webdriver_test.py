@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from itertools import count
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.utils.webdriver import (
+    BrowserPool,
+    close_browser_pools,
+    get_browser_pool,
+    WebDriverSelenium,
+)
+
+
+@pytest.fixture(autouse=True)
+def browser_pools() -> Iterator[None]:
+    yield
+    close_browser_pools()
+
+
+def test_browser_pool() -> None:
+    """
+    Browsers are reused, and recycled after `max_uses` uses or when they fail.
+    """
+    ids = count()
+    destroyed: list[int] = []
+    pool = BrowserPool(lambda: next(ids), destroyed.append, size=2, max_uses=2)
+
+    with pool.acquire() as browser:
+        assert browser == 0
+    with pool.acquire() as browser:
+        assert browser == 0
+    assert destroyed == [0]
+
+    def crash() -> None:
+        with pool.acquire():
+            raise ValueError("crash")
+
+    with pytest.raises(ValueError, match="crash"):
+        crash()
+    assert destroyed == [0, 1]
+
+    # at most `size` idle browsers are kept
+    with pool.acquire() as first, pool.acquire() as second, pool.acquire() as third:
+        assert (first, second, third) == (2, 3, 4)
+    assert destroyed == [0, 1, 2]
+
+    pool.close()
+    assert sorted(destroyed) == [0, 1, 2, 3, 4]
+
+
+def test_get_browser_pool(mocker: MockerFixture) -> None:
+    mocker.patch.dict(
+        "superset.utils.webdriver.current_app.config",
+        {"SCREENSHOT_BROWSER_POOL_SIZE": 0},
+    )
+    assert get_browser_pool("firefox", object, print) is None
+
+    mocker.patch.dict(
+        "superset.utils.webdriver.current_app.config",
+        {"SCREENSHOT_BROWSER_POOL_SIZE": 2, "SCREENSHOT_BROWSER_POOL_MAX_USES": 5},
+    )
+    pool = get_browser_pool("firefox", object, print)
+    assert pool is not None
+    assert (pool.size, pool.max_uses) == (2, 5)
+    assert get_browser_pool("firefox", object, print) is pool
+    assert get_browser_pool("chrome", object, print) is not pool
+
+
+def test_selenium_get_screenshot_pool(mocker: MockerFixture) -> None:
+    """
+    Pooled drivers are reused across users, with their cookies and storage reset.
+    """
+    mocker.patch.dict(
+        "superset.utils.webdriver.current_app.config",
+        {"SCREENSHOT_BROWSER_POOL_SIZE": 1},
+    )
+    driver = mocker.MagicMock()
+    driver.current_url = "about:blank"
+    create = mocker.patch.object(WebDriverSelenium, "create", return_value=driver)
+    authenticate = mocker.patch(
+        "superset.utils.webdriver.machine_auth_provider_factory"
+    ).instance.authenticate_webdriver
+    take_screenshot = mocker.patch.object(
+        WebDriverSelenium,
+        "take_screenshot",
+        return_value=b"image",
+    )
+    users = [mocker.MagicMock(), mocker.MagicMock()]
+
+    for user in users:
+        screenshot = WebDriverSelenium("firefox").get_screenshot(
+            "http://localhost/chart",
+            "chart-container",
+            user,
+        )
+        assert screenshot == b"image"
+        driver.current_url = "http://localhost/chart"
+
+    create.assert_called_once()
+    assert driver.delete_all_cookies.call_count == 2
+    driver.execute_script.assert_called_once_with(
+        "window.localStorage.clear(); window.sessionStorage.clear();"
+    )
+    assert [call.args for call in authenticate.call_args_list] == [
+        (driver, user) for user in users
+    ]
+    assert take_screenshot.call_count == 2
+    driver.quit.assert_not_called()